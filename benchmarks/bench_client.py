@@ -0,0 +1,229 @@
+"""End-to-end benchmark: SDK throughput and latency against an in-process FakeEigenLake.
+
+Runs ``add_many``, the sized batch writer, ``search.iterate`` and ``search.nearest``
+over a grid of batch sizes, worker counts and vector dims. The fake server sleeps
+``--latency`` seconds per request and can fail ``--error-rate`` of them with 503, so
+retries and pipelining show up the way they would against a real deployment.
+
+Every case runs in a fresh process so peak RSS belongs to that case alone. CPU per
+operation is process CPU time, which includes the fake server's share of the work;
+compare it between versions rather than reading it as SDK cost in isolation.
+
+    python benchmarks/bench_client.py --records 20000 --dims 128,768 --output after.json
+    python benchmarks/bench_client.py --compare before.json after.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import platform
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from eigenlake.retry import RetryBudget, RetryPolicy
+from eigenlake.testing import FakeEigenLake
+
+SCENARIOS = ("add_many", "batch", "iterate", "nearest")
+
+
+def _records(count: int, dims: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"doc-{i}",
+            "properties": {"document_id": f"doc-{i}", "chunk": i, "lang": rng.choice(["en", "de", "fr"])},
+            "vector": [rng.random() for _ in range(dims)],
+        }
+        for i in range(count)
+    ]
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_case(case: Dict[str, Any]) -> Dict[str, Any]:
+    server = FakeEigenLake(latency=case["latency"], error_rate=case["error_rate"], seed=0)
+    # Injected errors are answered before any write, so replaying inserts is safe here.
+    policy = RetryPolicy(
+        retries=case["retries"],
+        base_delay=0.01,
+        max_delay=0.1,
+        idempotent_endpoints=("data/insert-many",),
+        budget=RetryBudget(),
+        seed=0,
+    )
+    client = server.client(metrics=True, retry_policy=policy)
+    index = client.indexes.create_or_get(namespace="bench", index="bench", dimensions=case["dims"])
+    scenario, batch, workers = case["scenario"], case["batch_size"], case["workers"]
+
+    if scenario in ("iterate", "nearest"):
+        size = case["records"] if scenario == "iterate" else case["search_size"]
+        server.latency, server.error_rate = 0.0, 0.0
+        index.records.add_many(_records(size, case["dims"]), chunk_size=2000)
+        server.latency, server.error_rate = case["latency"], case["error_rate"]
+        client._metrics.reset()
+    records = _records(case["records"], case["dims"]) if scenario in ("add_many", "batch") else []
+    queries = [record["vector"] for record in _records(min(case["queries"], 512), case["dims"], seed=1)]
+
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    error = None
+    try:
+        if scenario == "add_many":
+            index.records.add_many(records, chunk_size=batch, concurrency=workers)
+            operations = len(records)
+        elif scenario == "batch":
+            with index.batch.with_size(batch_size=batch, max_workers=workers, on_error="raise") as writer:
+                for record in records:
+                    writer.add(properties=record["properties"], vector=record["vector"], id=record["id"])
+            operations = len(records)
+        elif scenario == "iterate":
+            scan = index.search.iterate(page_size=batch, with_vector=True, parallel=workers, prefetch=1)
+            operations = sum(1 for _ in scan)
+        else:
+
+            def query(position: int) -> None:
+                index.search.nearest(vector=queries[position % len(queries)], limit=10)
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(query, range(case["queries"])))
+            operations = case["queries"]
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        operations = 0
+    seconds = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+
+    stats = client.stats()
+    busiest = max(stats.endpoints.values(), key=lambda endpoint: endpoint.requests, default=None)
+    client.close()
+    return {
+        **case,
+        "operations": operations,
+        "seconds": seconds,
+        "ops_per_second": operations / seconds if seconds > 0 else 0.0,
+        "requests": stats.requests,
+        "retries": stats.retries,
+        "p50_ms": busiest.p50 * 1000 if busiest is not None else 0.0,
+        "p99_ms": busiest.p99 * 1000 if busiest is not None else 0.0,
+        "cpu_us_per_op": cpu / operations * 1e6 if operations else 0.0,
+        "peak_rss_mb": _peak_rss_mb(),
+        "error": error,
+    }
+
+
+def _key(result: Dict[str, Any]) -> str:
+    return f"{result['scenario']} dims={result['dims']} batch={result['batch_size']} workers={result['workers']}"
+
+
+def _cases(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    common = {
+        "records": args.records,
+        "queries": args.queries,
+        "search_size": args.search_size,
+        "latency": args.latency,
+        "error_rate": args.error_rate,
+        "retries": args.retries,
+    }
+    cases = []
+    for scenario, dims, workers in itertools.product(args.scenarios, args.dims, args.workers):
+        # Batch size does not apply to single-vector queries.
+        for batch in args.batch_sizes if scenario != "nearest" else [1]:
+            cases.append({"scenario": scenario, "dims": dims, "batch_size": batch, "workers": workers, **common})
+    return cases
+
+
+def _print(results: List[Dict[str, Any]]) -> None:
+    print(f"{'case':46s} {'ops/s':>10s} {'p50 ms':>8s} {'p99 ms':>8s} {'cpu us/op':>10s} {'rss MB':>8s} {'retry':>6s}")
+    for result in results:
+        print(
+            f"{_key(result):46s} {result['ops_per_second']:10.0f} {result['p50_ms']:8.2f} {result['p99_ms']:8.2f}"
+            f" {result['cpu_us_per_op']:10.1f} {result['peak_rss_mb']:8.1f} {result['retries']:6d}"
+            + (f"  {result['error']}" if result["error"] else "")
+        )
+
+
+def _compare(before_path: str, after_path: str) -> None:
+    with open(before_path) as handle:
+        before = {_key(result): result for result in json.load(handle)["results"]}
+    with open(after_path) as handle:
+        after = json.load(handle)["results"]
+    print(f"{'case':46s} {'ops/s':>10s} {'change':>8s} {'p99 ms':>8s} {'change':>8s}")
+    for result in after:
+        old = before.get(_key(result))
+        if old is None:
+            continue
+        throughput = result["ops_per_second"] / old["ops_per_second"] if old["ops_per_second"] else 0.0
+        p99 = result["p99_ms"] / old["p99_ms"] if old["p99_ms"] else 0.0
+        print(
+            f"{_key(result):46s} {result['ops_per_second']:10.0f} {throughput:7.2f}x"
+            f" {result['p99_ms']:8.2f} {p99:7.2f}x"
+        )
+
+
+def _ints(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", type=lambda value: value.split(","), default=list(SCENARIOS))
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--search-size", type=int, default=500, help="index size for nearest()")
+    parser.add_argument("--dims", type=_ints, default=[128, 768])
+    parser.add_argument("--batch-sizes", type=_ints, default=[250, 1000])
+    parser.add_argument("--workers", type=_ints, default=[1, 4])
+    parser.add_argument("--latency", type=float, default=0.002, help="seconds added to every request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two JSON result files")
+    args = parser.parse_args()
+
+    if args.compare:
+        _compare(*args.compare)
+        return
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for case in _cases(args):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results.append(pool.submit(_run_case, case).result())
+    _print(results)
+
+    if args.output:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            sdk_version = version("eigenlake")
+        except PackageNotFoundError:
+            sdk_version = None
+        payload = {
+            "meta": {
+                "eigenlake": sdk_version,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as handle:
+            json.dump(payload, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
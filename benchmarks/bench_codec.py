@@ -0,0 +1,87 @@
+"""Micro-benchmark: encoding an insert-many body with each JSON codec.
+
+Compares the pre-codec path (copy every record to rename ``id`` and let stdlib
+``json`` encode the whole payload) with ``Transport.encode_record`` and the
+spliced array body, for every codec installed here.
+
+    python benchmarks/bench_codec.py --records 20000 --dims 384
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from eigenlake.client import _array_body
+from eigenlake.codec import get_codec
+from eigenlake.transport import Transport
+
+
+def _baseline(records):
+    objects = []
+    for record in records:
+        item = dict(record)
+        if "id" in item:
+            item["uuid"] = item.pop("id")
+        objects.append(item)
+    return json.dumps({"objects": objects, "on_duplicate": "error"}).encode("utf-8")
+
+
+def _codec_path(transport, records):
+    parts = [transport.encode_record(record) for record in records]
+    return _array_body("objects", parts, {"on_duplicate": "error"}, transport.codec)
+
+
+def _time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, len(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--dims", type=int, default=384)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--numpy", action="store_true", help="use float32 ndarray vectors")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    vectors = [[rng.random() for _ in range(args.dims)] for _ in range(args.records)]
+    if args.numpy:
+        import numpy as np
+
+        vectors = list(np.asarray(vectors, dtype=np.float32))
+    records = [
+        {"id": f"doc-{i}", "properties": {"document_id": f"doc-{i}", "chunk": i}, "vector": vectors[i]}
+        for i in range(args.records)
+    ]
+
+    rows = []
+    if not args.numpy:
+        rows.append(("baseline (copy + stdlib json)",) + _time(lambda: _baseline(records), args.repeat))
+    for name in ("stdlib", "orjson", "msgspec"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            continue
+        transport = Transport(base_url="http://localhost", api_key=None, codec=codec)
+        rows.append((f"{name} (encode_record)",) + _time(lambda: _codec_path(transport, records), args.repeat))
+        transport.close()
+
+    reference = rows[0][1]
+    print(f"{args.records} records x {args.dims} dims{' (ndarray)' if args.numpy else ''}")
+    for label, seconds, size in rows:
+        print(
+            f"{label:32s} {seconds * 1000:9.1f} ms  {args.records / seconds:11.0f} rec/s"
+            f"  {size / 1e6:7.1f} MB  x{reference / seconds:5.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Micro-benchmark: per-record cost of client-side validation against encoding.
+
+Times ``RecordValidator.validate_record`` over a typical schema and compares it
+with ``Transport.encode_record`` for the same records, so the overhead can be
+read as a fraction of the serialization work every upload already pays.
+
+    python benchmarks/bench_validation.py --records 20000 --dims 384
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from eigenlake import schema
+from eigenlake.transport import Transport
+from eigenlake.validation import RecordValidator
+
+
+def _schema():
+    builder = (
+        schema.SchemaBuilder()
+        .add("document_id", schema.string(required=True, max_length=64, pattern=r"^doc-\d+$"))
+        .add("chunk", schema.integer(required=True, minimum=0))
+        .add("lang", schema.string(enum=["en", "de", "fr"]))
+        .add("score", schema.number(minimum=0.0, maximum=1.0))
+        .add("tags", schema.array(schema.string(max_length=16), max_items=8, unique_items=True))
+    )
+    return builder.build()[0]
+
+
+def _time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--dims", type=int, default=384)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    records = [
+        {
+            "id": f"doc-{i}",
+            "properties": {
+                "document_id": f"doc-{i}",
+                "chunk": i,
+                "lang": rng.choice(["en", "de", "fr"]),
+                "score": rng.random(),
+                "tags": rng.sample(["a", "b", "c", "d", "e"], 3),
+            },
+            "vector": [rng.random() for _ in range(args.dims)],
+        }
+        for i in range(args.records)
+    ]
+
+    validator = RecordValidator(_schema(), dimensions=args.dims)
+    transport = Transport(base_url="http://localhost", api_key=None)
+    assert all(validator.validate_record(record) is None for record in records)
+
+    validate = _time(lambda: [validator.validate_record(record) for record in records], args.repeat)
+    encode = _time(lambda: [transport.encode_record(record) for record in records], args.repeat)
+    transport.close()
+
+    print(f"{args.records} records x {args.dims} dims, codec={transport.codec.name}")
+    for label, seconds in (("validate", validate), ("encode_record", encode)):
+        print(f"{label:16s} {seconds * 1000:9.1f} ms  {seconds / args.records * 1e6:7.2f} us/record")
+    print(f"validation overhead: {validate / encode * 100:.1f}% of encoding")
+
+
+if __name__ == "__main__":
+    main()
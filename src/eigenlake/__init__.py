@@ -1,6 +1,17 @@
 from __future__ import annotations
 
+from typing import Sequence
+
+import httpx
+
+from .async_client import AsyncEigenLakeClient
+from ._vectors import VectorEncoding
 from .client import EigenLakeClient
+from .codec import CodecName, JSONCodec
+from .compression import DEFAULT_COMPRESSION_THRESHOLD, Compression
+from .metrics import Instrumentation
+from .retry import RetryPolicy
+from .transport import DEFAULT_KEEPALIVE_EXPIRY, DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_KEEPALIVE_CONNECTIONS
 from . import schema
 
 
@@ -8,14 +19,48 @@ def connect(
     *,
     url: str,
     api_key: str | None = None,
-    timeout: float = 20.0,
+    timeout: float | httpx.Timeout = 20.0,
+    connect_timeout: float | None = None,
+    read_timeout: float | None = None,
+    write_timeout: float | None = None,
+    pool_timeout: float | None = None,
+    max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
     retries: int = 2,
+    retry_policy: RetryPolicy | None = None,
+    vector_encoding: VectorEncoding = "json",
+    compression: Compression | None = None,
+    compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    codec: CodecName | JSONCodec = "auto",
+    metadata_ttl: float | None = 30.0,
+    metrics: bool = False,
+    hooks: Sequence[Instrumentation] | None = None,
+    warmup: int = 0,
 ) -> EigenLakeClient:
     return EigenLakeClient(
         url=url,
         api_key=api_key,
         timeout=timeout,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        write_timeout=write_timeout,
+        pool_timeout=pool_timeout,
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+        http2=http2,
         retries=retries,
+        retry_policy=retry_policy,
+        vector_encoding=vector_encoding,
+        compression=compression,
+        compression_threshold=compression_threshold,
+        codec=codec,
+        metadata_ttl=metadata_ttl,
+        metrics=metrics,
+        hooks=hooks,
+        warmup=warmup,
     )
 
 
@@ -24,20 +69,148 @@ def connect_local(
     host: str = "http://localhost",
     port: int = 8000,
     api_key: str | None = None,
-    timeout: float = 20.0,
+    timeout: float | httpx.Timeout = 20.0,
+    connect_timeout: float | None = None,
+    read_timeout: float | None = None,
+    write_timeout: float | None = None,
+    pool_timeout: float | None = None,
+    max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
     retries: int = 2,
+    retry_policy: RetryPolicy | None = None,
+    vector_encoding: VectorEncoding = "json",
+    compression: Compression | None = None,
+    compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    codec: CodecName | JSONCodec = "auto",
+    metadata_ttl: float | None = 30.0,
+    metrics: bool = False,
+    hooks: Sequence[Instrumentation] | None = None,
+    warmup: int = 0,
 ) -> EigenLakeClient:
     return EigenLakeClient(
         url=f"{host.rstrip('/')}:{int(port)}",
         api_key=api_key,
         timeout=timeout,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        write_timeout=write_timeout,
+        pool_timeout=pool_timeout,
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+        http2=http2,
+        retries=retries,
+        retry_policy=retry_policy,
+        vector_encoding=vector_encoding,
+        compression=compression,
+        compression_threshold=compression_threshold,
+        codec=codec,
+        metadata_ttl=metadata_ttl,
+        metrics=metrics,
+        hooks=hooks,
+        warmup=warmup,
+    )
+
+
+def connect_async(
+    *,
+    url: str,
+    api_key: str | None = None,
+    timeout: float | httpx.Timeout = 20.0,
+    connect_timeout: float | None = None,
+    read_timeout: float | None = None,
+    write_timeout: float | None = None,
+    pool_timeout: float | None = None,
+    max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
+    retries: int = 2,
+    retry_policy: RetryPolicy | None = None,
+    vector_encoding: VectorEncoding = "json",
+    compression: Compression | None = None,
+    compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    codec: CodecName | JSONCodec = "auto",
+    metrics: bool = False,
+    hooks: Sequence[Instrumentation] | None = None,
+) -> AsyncEigenLakeClient:
+    return AsyncEigenLakeClient(
+        url=url,
+        api_key=api_key,
+        timeout=timeout,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        write_timeout=write_timeout,
+        pool_timeout=pool_timeout,
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+        http2=http2,
+        retries=retries,
+        retry_policy=retry_policy,
+        vector_encoding=vector_encoding,
+        compression=compression,
+        compression_threshold=compression_threshold,
+        codec=codec,
+        metrics=metrics,
+        hooks=hooks,
+    )
+
+
+def connect_local_async(
+    *,
+    host: str = "http://localhost",
+    port: int = 8000,
+    api_key: str | None = None,
+    timeout: float | httpx.Timeout = 20.0,
+    connect_timeout: float | None = None,
+    read_timeout: float | None = None,
+    write_timeout: float | None = None,
+    pool_timeout: float | None = None,
+    max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
+    retries: int = 2,
+    retry_policy: RetryPolicy | None = None,
+    vector_encoding: VectorEncoding = "json",
+    compression: Compression | None = None,
+    compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    codec: CodecName | JSONCodec = "auto",
+    metrics: bool = False,
+    hooks: Sequence[Instrumentation] | None = None,
+) -> AsyncEigenLakeClient:
+    return AsyncEigenLakeClient(
+        url=f"{host.rstrip('/')}:{int(port)}",
+        api_key=api_key,
+        timeout=timeout,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        write_timeout=write_timeout,
+        pool_timeout=pool_timeout,
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+        http2=http2,
         retries=retries,
+        retry_policy=retry_policy,
+        vector_encoding=vector_encoding,
+        compression=compression,
+        compression_threshold=compression_threshold,
+        codec=codec,
+        metrics=metrics,
+        hooks=hooks,
     )
 
 
 __all__ = [
+    "AsyncEigenLakeClient",
     "EigenLakeClient",
     "connect",
+    "connect_async",
     "connect_local",
+    "connect_local_async",
     "schema",
 ]
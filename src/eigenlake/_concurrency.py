@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    TypeVar,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+K = TypeVar("K", bound=Hashable)
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    size = max(1, int(size))
+    chunk: List[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def bounded_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    concurrency: int = 1,
+    thread_name_prefix: str = "eigenlake",
+) -> Iterator[R]:
+    # Results come back in input order; input is only pulled as slots free up.
+    concurrency = max(1, int(concurrency))
+    if concurrency == 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    pending: Deque[Future] = deque()
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=thread_name_prefix)
+    try:
+        iterator = iter(items)
+        for item in iterator:
+            # Runs in a copy of the caller's context so deadline() and other context vars carry over.
+            pending.append(executor.submit(contextvars.copy_context().run, fn, item))
+            if len(pending) >= concurrency:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+async def abounded_map(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    concurrency: int = 1,
+) -> AsyncIterator[R]:
+    concurrency = max(1, int(concurrency))
+    pending: Deque[asyncio.Task[Any]] = deque()
+    try:
+        for item in items:
+            pending.append(asyncio.ensure_future(fn(item)))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class _PendingBatch:
+    def __init__(self):
+        self.futures: Dict[Any, Future] = {}
+        self.full = threading.Event()
+
+
+class Coalescer(Generic[K, R]):
+    # Merges concurrent load(key) calls arriving within `window` seconds into one load_many(keys).
+    # The first caller of a batch waits out the window and runs the load for everyone in it.
+
+    def __init__(self, load_many: Callable[[List[K]], List[R]], *, window: float = 0.002, max_batch: int = 256):
+        self._load_many = load_many
+        self._window = max(0.0, float(window))
+        self._max_batch = max(1, int(max_batch))
+        self._lock = threading.Lock()
+        self._open: _PendingBatch | None = None
+
+    def load(self, key: K) -> R:
+        with self._lock:
+            batch = self._open
+            leader = batch is None
+            if batch is None:
+                batch = self._open = _PendingBatch()
+            future = batch.futures.get(key)
+            if future is None:
+                future = batch.futures[key] = Future()
+                if len(batch.futures) >= self._max_batch:
+                    self._open = None
+                    batch.full.set()
+
+        if leader:
+            batch.full.wait(self._window)
+            with self._lock:
+                if self._open is batch:
+                    self._open = None
+            keys = list(batch.futures)
+            try:
+                values = list(self._load_many(keys))
+                if len(values) != len(keys):
+                    raise RuntimeError(f"load_many returned {len(values)} values for {len(keys)} keys")
+            except BaseException as exc:
+                for pending in batch.futures.values():
+                    pending.set_exception(exc)
+            else:
+                for pending_key, value in zip(keys, values):
+                    batch.futures[pending_key].set_result(value)
+        return future.result()
+
+
+class AdaptiveBatchSize:
+    # AIMD: grow by `step` after a batch that succeeds within `target_latency`,
+    # halve after a slow or failed one, staying within [minimum, maximum].
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        minimum: int = 1,
+        maximum: int = 10_000,
+        target_latency: float = 1.0,
+        step: int | None = None,
+        backoff: float = 0.5,
+    ):
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum))
+        self.target_latency = float(target_latency)
+        self._step = max(1, int(step) if step is not None else int(initial) // 10)
+        self._backoff = min(max(float(backoff), 0.05), 0.95)
+        self._current = min(max(int(initial), self.minimum), self.maximum)
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> int:
+        return self._current
+
+    def record(self, *, latency: float, ok: bool) -> int:
+        with self._lock:
+            if ok and latency <= self.target_latency:
+                self._current = min(self.maximum, self._current + self._step)
+            else:
+                self._current = max(self.minimum, int(self._current * self._backoff))
+            return self._current
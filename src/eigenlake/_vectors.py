@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import base64
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Literal, Sequence, Union
+
+if TYPE_CHECKING:
+    import numpy
+
+    Vector = Union[Sequence[float], numpy.ndarray]
+    Matrix = Union[Sequence[Sequence[float]], numpy.ndarray]
+else:
+    Vector = Union[Sequence[float], Any]
+    Matrix = Union[Sequence[Sequence[float]], Any]
+
+
+VectorEncoding = Literal["json", "float32", "float16"]
+
+VECTOR_ENCODING_HEADER = "X-Vector-Encoding"
+_WIRE_NAMES = {"float32": "base64-float32", "float16": "base64-float16"}
+_NUMPY_DTYPES = {"float32": "<f4", "float16": "<f2"}
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def require_numpy():
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError("NumPy support requires numpy: pip install 'eigenlake[numpy]'") from exc
+    return numpy
+
+
+def is_ndarray(value: Any) -> bool:
+    # Never imports numpy: if it has not been imported, value cannot be an ndarray.
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def json_default(value: Any) -> Any:
+    np = sys.modules.get("numpy")
+    if np is not None:
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        if isinstance(value, np.generic):
+            return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def to_json_vector(vector: Vector | None) -> List[float] | None:
+    if vector is None:
+        return None
+    if is_ndarray(vector):
+        if vector.ndim != 1:
+            raise ValueError(f"Expected a 1-D vector, got an array of shape {vector.shape}")
+        return vector.tolist()
+    return vector if isinstance(vector, list) else list(vector)
+
+
+def iter_rows(matrix: Matrix) -> Iterator[Any]:
+    if is_ndarray(matrix):
+        if matrix.ndim != 2:
+            raise ValueError(f"Expected a 2-D matrix, got an array of shape {matrix.shape}")
+    return iter(matrix)
+
+
+class VectorCodec:
+    def __init__(self, encoding: VectorEncoding = "json"):
+        if encoding not in ("json", "float32", "float16"):
+            raise ValueError(f"Unsupported vector encoding: {encoding!r}")
+        self.encoding = encoding
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        if self.encoding == "json":
+            return {}
+        return {VECTOR_ENCODING_HEADER: _WIRE_NAMES[self.encoding]}
+
+    def encode(self, vector: Vector | None) -> Any:
+        if vector is None or self.encoding == "json":
+            return to_json_vector(vector)
+        return base64.b64encode(self.to_bytes(vector)).decode("ascii")
+
+    def to_bytes(self, vector: Vector) -> bytes:
+        if is_ndarray(vector):
+            if vector.ndim != 1:
+                raise ValueError(f"Expected a 1-D vector, got an array of shape {vector.shape}")
+            return vector.astype(_NUMPY_DTYPES[self.encoding], copy=False).tobytes()
+        if self.encoding == "float16":
+            return struct.pack(f"<{len(vector)}e", *vector)
+        packed = array("f", vector)
+        if not _LITTLE_ENDIAN:
+            packed.byteswap()
+        return packed.tobytes()
+
+    def decode(self, value: Any, *, as_numpy: bool = False) -> Any:
+        if isinstance(value, str):
+            return self.from_bytes(base64.b64decode(value), as_numpy=as_numpy)
+        if as_numpy and value is not None and not is_ndarray(value):
+            return require_numpy().asarray(value, dtype="float32")
+        return value
+
+    def from_bytes(self, raw: bytes, *, as_numpy: bool = False) -> Any:
+        if as_numpy:
+            np = require_numpy()
+            return np.frombuffer(raw, dtype=_NUMPY_DTYPES[self.encoding]).astype(np.float32)
+        if self.encoding == "float16":
+            return list(struct.unpack(f"<{len(raw) // 2}e", raw))
+        unpacked = array("f")
+        unpacked.frombytes(raw)
+        if not _LITTLE_ENDIAN:
+            unpacked.byteswap()
+        return unpacked.tolist()
+
+    def encode_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        if self.encoding != "json" and record.get("vector") is not None:
+            record["vector"] = self.encode(record["vector"])
+        return record
+
+    def decode_response(self, data: Any, *, as_numpy: bool = False) -> Any:
+        # Decodes vectors on the response itself, on "object" and on objects in any top-level list.
+        if not isinstance(data, dict) or (self.encoding == "json" and not as_numpy):
+            return data
+        self._decode_object(data, as_numpy)
+        for value in data.values():
+            if isinstance(value, dict):
+                self._decode_object(value, as_numpy)
+            elif isinstance(value, list):
+                for item in value:
+                    self._decode_object(item, as_numpy)
+        return data
+
+    def _decode_object(self, obj: Any, as_numpy: bool) -> None:
+        if isinstance(obj, dict) and obj.get("vector") is not None:
+            obj["vector"] = self.decode(obj["vector"], as_numpy=as_numpy)
@@ -0,0 +1,585 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, List, Literal, Sequence, Set
+from uuid import uuid4
+
+import httpx
+
+from ._concurrency import abounded_map
+from ._vectors import Matrix, Vector, VectorEncoding
+from .codec import CodecName, JSONCodec
+from .client import (
+    _DEFAULT_CHUNK_BYTES,
+    _DEFAULT_CHUNK_SIZE,
+    _JSON_HEADERS,
+    AddManyResult,
+    FailedRecord,
+    _array_body,
+    _chunk_encoded,
+    _failed_records,
+    _index_path,
+    _q,
+    _vector_items,
+)
+from .compression import DEFAULT_COMPRESSION_THRESHOLD, Compression, CompressionTotals
+from .metrics import ClientStats, Instrumentation, Metrics, PoolStats, combine
+from .retry import RetryPolicy
+from .transport import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    AsyncTransport,
+    build_limits,
+    build_timeout,
+)
+
+
+class AsyncIndexRecords:
+    def __init__(self, handle: "AsyncIndexHandle"):
+        self._h = handle
+
+    async def add(
+        self,
+        *,
+        properties: Dict[str, Any],
+        vector: Vector,
+        id: str | None = None,
+        on_duplicate: Literal["error", "replace", "skip"] = "error",
+        batch_size: int = 500,
+        max_workers: int = 1,
+    ) -> str:
+        payload = {
+            "properties": properties,
+            "vector": self._h._t.vectors.encode(vector),
+            "uuid": id,
+            "on_duplicate": on_duplicate,
+            "batch_size": batch_size,
+            "max_workers": max_workers,
+        }
+        resp = await self._h._t.post_json(f"{self._h._path}/data/insert", json=payload)
+        return str(resp["uuid"])
+
+    async def add_many(
+        self,
+        records: Iterable[dict[str, Any]],
+        *,
+        on_duplicate: Literal["error", "replace", "skip"] = "error",
+        on_error: Literal["raise", "continue"] = "raise",
+        batch_size: int = 500,
+        max_workers: int = 1,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        chunk_bytes: int = _DEFAULT_CHUNK_BYTES,
+        concurrency: int = 1,
+    ) -> AddManyResult:
+        fields = {
+            "on_duplicate": on_duplicate,
+            "on_error": on_error,
+            "batch_size": batch_size,
+            "max_workers": max_workers,
+        }
+
+        async def upload(chunk: List[bytes]) -> Dict[str, Any]:
+            body = _array_body("objects", chunk, fields, self._h._t.codec)
+            return await self._h._t.post_json(f"{self._h._path}/data/insert-many", content=body, headers=_JSON_HEADERS)
+
+        encoded = (self._h._t.encode_record(record) for record in records)
+        chunks = _chunk_encoded(encoded, chunk_size=chunk_size, chunk_bytes=chunk_bytes)
+
+        uuids: List[str] = []
+        failed: List[FailedRecord] = []
+        async for resp in abounded_map(upload, chunks, concurrency=concurrency):
+            uuids.extend(resp.get("uuids") or [])
+            failed.extend(_failed_records(resp))
+        return AddManyResult(uuids, failed_records=failed)
+
+    async def add_vectors(
+        self,
+        vectors: Iterable[dict[str, Any]] | Matrix,
+        *,
+        ids: Iterable[str] | None = None,
+        properties: Iterable[Dict[str, Any]] | None = None,
+        batch_size: int = 500,
+        max_workers: int = 1,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        chunk_bytes: int = _DEFAULT_CHUNK_BYTES,
+        concurrency: int = 1,
+    ) -> List[FailedRecord]:
+        fields = {
+            "batch_size": batch_size,
+            "max_workers": max_workers,
+        }
+
+        async def upload(chunk: List[bytes]) -> None:
+            body = _array_body("vectors", chunk, fields, self._h._t.codec)
+            await self._h._t.post(f"{self._h._path}/data/insert-vectors", content=body, headers=_JSON_HEADERS)
+
+        items = _vector_items(vectors, ids=ids, properties=properties)
+        encoded = (self._h._t.encode_record(item) for item in items)
+        chunks = _chunk_encoded(encoded, chunk_size=chunk_size, chunk_bytes=chunk_bytes)
+        async for _ in abounded_map(upload, chunks, concurrency=concurrency):
+            pass
+        # The async client has no local validator; records the server rejects raise instead.
+        return []
+
+    async def get(self, id: str, *, return_data: bool = True, return_metadata: bool = True) -> dict[str, Any] | None:
+        payload = {
+            "uuid": id,
+            "return_data": return_data,
+            "return_metadata": return_metadata,
+        }
+        resp = await self._h._t.post_json(f"{self._h._path}/data/get-by-id", json=payload)
+        return self._h._t.vectors.decode_response(resp).get("object")
+
+    async def exists(self, id: str) -> bool:
+        resp = await self._h._t.get_json(f"{self._h._path}/data/exists/{_q(id)}")
+        return bool(resp.get("exists", False))
+
+    async def remove(self, id: str, *, batch_size: int = 500) -> None:
+        await self._h._t.delete(f"{self._h._path}/data/{_q(id)}", params={"batch_size": batch_size})
+
+    async def remove_many(
+        self,
+        *,
+        filter: Dict[str, Any],
+        limit: int | None = None,
+        delete_sql_rows: bool = False,
+        on_missing: Literal["skip", "error"] = "skip",
+        batch_size: int = 500,
+        background: bool = True,
+    ) -> Dict[str, Any]:
+        payload = {
+            "where": filter,
+            "limit": limit,
+            "delete_patent_rows": delete_sql_rows,
+            "on_missing_keys": on_missing,
+            "batch_size": batch_size,
+            "background": background,
+        }
+        return await self._h._t.post_json(f"{self._h._path}/data/delete-many", json=payload)
+
+    async def remove_job(self, job_id: int) -> Dict[str, Any]:
+        return await self._h._t.get_json(f"{self._h._path}/data/delete-jobs/{int(job_id)}")
+
+    async def update(
+        self,
+        *,
+        id: str,
+        properties: Dict[str, Any] | None = None,
+        vector: Vector | None = None,
+    ) -> None:
+        payload = {
+            "properties": properties,
+            "vector": self._h._t.vectors.encode(vector),
+        }
+        await self._h._t.patch(f"{self._h._path}/data/{_q(id)}", json=payload)
+
+    async def replace(
+        self,
+        *,
+        id: str,
+        properties: Dict[str, Any],
+        vector: Vector | None = None,
+    ) -> None:
+        payload = {
+            "properties": properties,
+            "vector": self._h._t.vectors.encode(vector),
+        }
+        await self._h._t.put(f"{self._h._path}/data/{_q(id)}", json=payload)
+
+    async def list(
+        self,
+        *,
+        filter: Dict[str, Any],
+        limit: int = 100,
+        after: str | None = None,
+        with_vector: bool = False,
+        with_properties: bool = True,
+        on_missing: Literal["skip", "error"] = "skip",
+        as_numpy: bool = False,
+    ) -> Dict[str, Any]:
+        payload = {
+            "where": filter,
+            "limit": limit,
+            "after": after,
+            "include_vector": with_vector,
+            "include_properties": with_properties,
+            "on_missing_keys": on_missing,
+        }
+        resp = await self._h._t.post_json(f"{self._h._path}/data/get-by-filter", json=payload)
+        return self._h._t.vectors.decode_response(resp, as_numpy=as_numpy)
+
+
+class AsyncIndexSearch:
+    def __init__(self, handle: "AsyncIndexHandle"):
+        self._h = handle
+
+    async def nearest(self, *, vector: Vector, limit: int = 10, filter: Dict[str, Any] | None = None):
+        payload = {
+            "vector": self._h._t.vectors.encode(vector),
+            "top_k": limit,
+            "filter": filter,
+        }
+        resp = await self._h._t.post_json(f"{self._h._path}/query/near-vector", json=payload)
+        return self._h._t.vectors.decode_response(resp)
+
+    async def get(self, id: str, *, with_vector: bool = False, as_numpy: bool = False) -> Dict[str, Any]:
+        params = {"include_vector": bool(with_vector)}
+        resp = await self._h._t.get_json(f"{self._h._path}/query/object/{_q(id)}", params=params)
+        return self._h._t.vectors.decode_response(resp, as_numpy=as_numpy)
+
+    async def list(
+        self,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        with_vector: bool = False,
+        with_properties: bool = True,
+        newest_first: bool = True,
+        as_numpy: bool = False,
+    ) -> Dict[str, Any]:
+        params = {
+            "limit": limit,
+            "offset": offset,
+            "include_vector": with_vector,
+            "include_properties": with_properties,
+            "newest_first": newest_first,
+        }
+        resp = await self._h._t.get_json(f"{self._h._path}/query/objects", params=params)
+        return self._h._t.vectors.decode_response(resp, as_numpy=as_numpy)
+
+    async def iterate(
+        self,
+        *,
+        page_size: int = 500,
+        with_vector: bool = False,
+        with_properties: bool = True,
+        newest_first: bool = True,
+        as_numpy: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        offset = 0
+        while True:
+            page = await self.list(
+                limit=page_size,
+                offset=offset,
+                with_vector=with_vector,
+                with_properties=with_properties,
+                newest_first=newest_first,
+                as_numpy=as_numpy,
+            )
+            objects = page.get("objects") or []
+            if not objects:
+                break
+            for obj in objects:
+                yield obj
+            offset = int(page.get("next_offset") or 0)
+
+
+class AsyncIndexSettings:
+    def __init__(self, handle: "AsyncIndexHandle"):
+        self._h = handle
+
+    async def _read(self) -> dict[str, Any]:
+        return await self._h._t.get_json(f"{self._h._path}/config")
+
+    async def dimensions(self) -> int:
+        return int((await self._read()).get("dims", 0))
+
+    async def schema(self) -> Dict[str, Any]:
+        return dict((await self._read()).get("schema") or {})
+
+    async def shards(self) -> Dict[str, Any]:
+        return dict((await self._read()).get("shards") or {})
+
+
+class AsyncIndexManage:
+    def __init__(self, handle: "AsyncIndexHandle"):
+        self._h = handle
+
+    async def delete(self, *, ensure_remote: bool = True, drop_keys_table: bool = True):
+        params = {
+            "ensure_remote": ensure_remote,
+            "drop_keys_table": drop_keys_table,
+        }
+        return await self._h._t.delete_json(self._h._path, params=params)
+
+    async def remove_by_filter(
+        self,
+        *,
+        filter: Dict[str, Any],
+        limit_ids: int | None = None,
+        delete_sql_rows: bool = False,
+        on_missing: Literal["skip", "error"] = "skip",
+        batch_size: int = 500,
+        background: bool = True,
+    ) -> Dict[str, Any]:
+        payload = {
+            "where": filter,
+            "limit_object_ids": limit_ids,
+            "delete_sql_metadata_rows": delete_sql_rows,
+            "on_missing_keys": on_missing,
+            "batch_size": batch_size,
+            "background": background,
+        }
+        return await self._h._t.post_json(f"{self._h._path}/admin/delete-by-filter", json=payload)
+
+
+class AsyncIndexBatch:
+    def __init__(self, handle: "AsyncIndexHandle"):
+        self._h = handle
+        self.failed_records: List[FailedRecord] = []
+
+    def with_size(
+        self,
+        *,
+        batch_size: int = 200,
+        max_workers: int = 1,
+        on_error: Literal["raise", "continue"] = "continue",
+    ):
+        return _AsyncSizedBatchWriter(
+            manager=self,
+            batch_size=int(batch_size),
+            max_workers=int(max_workers),
+            on_error=on_error,
+        )
+
+
+class _AsyncSizedBatchWriter:
+    def __init__(
+        self,
+        *,
+        manager: AsyncIndexBatch,
+        batch_size: int,
+        max_workers: int,
+        on_error: Literal["raise", "continue"],
+    ):
+        self._m = manager
+        self._batch_size = max(1, batch_size)
+        self._max_workers = max(1, max_workers)
+        self._on_error = on_error
+
+        self._buffer: List[dict[str, Any]] = []
+        self.failed_records: List[FailedRecord] = []
+        self.number_errors: int = 0
+
+        self._slots = asyncio.Semaphore(self._max_workers)
+        self._in_flight: Set[asyncio.Task] = set()
+        self._error: BaseException | None = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            await self.flush()
+        finally:
+            self._m.failed_records = list(self.failed_records)
+        return False
+
+    async def add(
+        self,
+        *,
+        properties: Dict[str, Any],
+        vector: Vector,
+        id: str | None = None,
+    ) -> str:
+        self._raise_pending_error()
+        out_id = str(id) if id is not None else str(uuid4())
+        self._buffer.append(
+            {
+                "id": out_id,
+                "properties": properties,
+                "vector": vector,
+            }
+        )
+        if len(self._buffer) >= self._batch_size:
+            await self._submit()
+        return out_id
+
+    async def flush(self) -> None:
+        await self._submit()
+        if self._in_flight:
+            await asyncio.wait(self._in_flight)
+        self._raise_pending_error()
+
+    async def _submit(self) -> None:
+        if not self._buffer:
+            return
+
+        payload = self._buffer
+        self._buffer = []
+
+        # Suspends the producer once max_workers batches are outstanding.
+        await self._slots.acquire()
+        task = asyncio.ensure_future(self._upload(payload))
+        self._in_flight.add(task)
+        task.add_done_callback(self._on_done)
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        self._in_flight.discard(task)
+        self._slots.release()
+
+    async def _upload(self, payload: List[dict[str, Any]]) -> None:
+        try:
+            result = await self._m._h.records.add_many(
+                payload,
+                on_duplicate="error",
+                on_error="continue",
+                batch_size=self._batch_size,
+                max_workers=self._max_workers,
+            )
+        except Exception as exc:
+            self.number_errors += len(payload)
+            self.failed_records.extend(
+                [FailedRecord(id=str(item.get("id") or ""), error=str(exc)) for item in payload]
+            )
+            if self._on_error == "raise" and self._error is None:
+                self._error = exc
+            return
+
+        self.number_errors += result.number_errors
+        self.failed_records.extend(result.failed_records)
+
+    def _raise_pending_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+
+class AsyncIndexHandle:
+    def __init__(self, transport: AsyncTransport, namespace: str, index: str):
+        self._t = transport
+        self._path = _index_path(namespace, index)
+
+        self.records = AsyncIndexRecords(self)
+        self.search = AsyncIndexSearch(self)
+        self.settings = AsyncIndexSettings(self)
+        self.manage = AsyncIndexManage(self)
+        self.batch = AsyncIndexBatch(self)
+
+
+class AsyncIndexesNamespace:
+    def __init__(self, transport: AsyncTransport):
+        self._t = transport
+
+    async def create_or_get(
+        self,
+        *,
+        namespace: str,
+        index: str,
+        dimensions: int,
+        schema: Dict[str, Any] | None = None,
+        index_options: Dict[str, Any] | None = None,
+        shard_count: int = 1,
+        record_id_property: str = "document_id",
+    ) -> AsyncIndexHandle:
+        shard_count = max(1, int(shard_count))
+        payload = {
+            "namespace": namespace,
+            "index": index,
+            "dimensions": int(dimensions),
+            "schema": schema,
+            "index_options": index_options,
+            "shard_count": shard_count,
+            "record_id_property": record_id_property,
+        }
+        await self._t.post("/v1/collections/get-or-create", json=payload)
+        return AsyncIndexHandle(self._t, namespace, index)
+
+    async def open(self, *, namespace: str, index: str) -> AsyncIndexHandle:
+        await self._t.get(_index_path(namespace, index))
+        return AsyncIndexHandle(self._t, namespace, index)
+
+    def ref(self, *, namespace: str, index: str) -> AsyncIndexHandle:
+        return AsyncIndexHandle(self._t, namespace, index)
+
+
+class AsyncEigenLakeClient:
+    def __init__(
+        self,
+        *,
+        url: str,
+        api_key: str | None = None,
+        timeout: float | httpx.Timeout = 20.0,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        retries: int = 2,
+        retry_policy: RetryPolicy | None = None,
+        vector_encoding: VectorEncoding = "json",
+        compression: Compression | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        codec: CodecName | JSONCodec = "auto",
+        http_transport: httpx.AsyncBaseTransport | None = None,
+        metrics: bool = False,
+        hooks: Sequence[Instrumentation] | None = None,
+    ):
+        self._metrics = Metrics() if metrics else None
+        self._hooks: List[Instrumentation] = list(hooks or [])
+        self._transport = AsyncTransport(
+            base_url=url,
+            api_key=api_key,
+            timeout=build_timeout(
+                timeout, connect=connect_timeout, read=read_timeout, write=write_timeout, pool=pool_timeout
+            ),
+            retries=retries,
+            retry_policy=retry_policy,
+            vector_encoding=vector_encoding,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            codec=codec,
+            http_transport=http_transport,
+            instrumentation=combine([self._metrics, *self._hooks]),
+            limits=build_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+            http2=http2,
+        )
+        self.indexes = AsyncIndexesNamespace(self._transport)
+
+    def compression_stats(self) -> CompressionTotals | None:
+        compressor = self._transport.compressor
+        return compressor.totals() if compressor is not None else None
+
+    def stats(self) -> ClientStats | None:
+        # None unless the client was created with metrics=True.
+        if self._metrics is None:
+            return None
+        return self._metrics.snapshot(self._transport.pool_stats())
+
+    def pool_stats(self) -> PoolStats:
+        return self._transport.pool_stats()
+
+    def add_hook(self, hook: Instrumentation) -> None:
+        self._hooks.append(hook)
+        self._transport.instrumentation = combine([self._metrics, *self._hooks])
+
+    def remove_hook(self, hook: Instrumentation) -> None:
+        self._hooks.remove(hook)
+        self._transport.instrumentation = combine([self._metrics, *self._hooks])
+
+    async def capabilities(self) -> frozenset[str]:
+        return await self._transport.capabilities()
+
+    async def warm_up(self, connections: int = 1) -> int:
+        return await self._transport.warm_up(connections)
+
+    async def ready(self) -> bool:
+        try:
+            payload = await self._transport.get_json("/v1/health/ready")
+            return bool(payload.get("ready"))
+        except Exception:
+            return False
+
+    async def close(self) -> None:
+        await self._transport.aclose()
+
+    async def __aenter__(self) -> "AsyncEigenLakeClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        await self.close()
+        return False
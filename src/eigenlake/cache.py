@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class QueryCache:
+    """Thread-safe LRU cache with a per-entry TTL, used for search results.
+
+    Entries written by a read that started before the last ``invalidate()`` are
+    dropped, so a write through the same handle never leaves a stale result behind.
+    Cached values are shared between callers and should be treated as read-only.
+    """
+
+    def __init__(self, *, maxsize: int = 1024, ttl: float | None = 60.0, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = max(1, int(maxsize))
+        self.ttl = None if ttl is None else float(ttl)
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, Tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return True, value
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+            return False, None
+
+    def put(self, key: Hashable, value: Any, *, generation: int | None = None) -> None:
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            expires_at = None if self.ttl is None else self._clock() + self.ttl
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        hit, value = self.get(key)
+        if hit:
+            return value
+        generation = self._generation
+        value = load()
+        self.put(key, value, generation=generation)
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._invalidations += 1
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+
+@dataclass(frozen=True)
+class IndexMetadata:
+    checked_at: float | None = None
+    config: Dict[str, Any] | None = None
+    etag: str | None = None
+    fetched_at: float | None = None
+
+
+class MetadataCache:
+    """Per-client record of which indexes exist and what their ``/config`` returned.
+
+    ``checked_at`` and ``fetched_at`` are judged against ``ttl`` separately: an index
+    known to exist may still need its config revalidated. ``ttl=0`` disables reuse.
+    """
+
+    def __init__(self, *, ttl: float | None = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.ttl = None if ttl is None else max(0.0, float(ttl))
+        self._clock = clock
+        self._entries: Dict[str, IndexMetadata] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> IndexMetadata:
+        with self._lock:
+            return self._entries.get(path) or IndexMetadata()
+
+    def is_fresh(self, stamp: float | None) -> bool:
+        if stamp is None or self.ttl == 0:
+            return False
+        return self.ttl is None or self._clock() - stamp < self.ttl
+
+    def exists(self, path: str) -> bool:
+        return self.is_fresh(self.get(path).checked_at)
+
+    def config(self, path: str) -> Dict[str, Any] | None:
+        entry = self.get(path)
+        return entry.config if self.is_fresh(entry.fetched_at) else None
+
+    def mark_exists(self, path: str) -> None:
+        with self._lock:
+            entry = self._entries.get(path) or IndexMetadata()
+            self._entries[path] = IndexMetadata(self._clock(), entry.config, entry.etag, entry.fetched_at)
+
+    def store_config(self, path: str, config: Dict[str, Any], etag: str | None) -> None:
+        now = self._clock()
+        with self._lock:
+            self._entries[path] = IndexMetadata(now, config, etag, now)
+
+    def forget(self, path: str | None = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+
+def query_key(kind: str, vector_bytes: bytes | None, **params: Any) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(kind.encode("utf-8"))
+    if vector_bytes is not None:
+        digest.update(vector_bytes)
+    digest.update(json.dumps(params, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"))
+    return digest.hexdigest()
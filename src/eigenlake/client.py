@@ -1,11 +1,36 @@
 from __future__ import annotations
 
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Literal
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Sequence
 from urllib.parse import quote
 from uuid import uuid4
 
-from .transport import Transport
+import httpx
+
+from ._concurrency import AdaptiveBatchSize, Coalescer, bounded_map, chunked
+from ._vectors import Matrix, Vector, VectorCodec, VectorEncoding, iter_rows, require_numpy
+from .cache import CacheStats, MetadataCache, QueryCache, query_key
+from .codec import CodecName, JSONCodec
+from .compression import DEFAULT_COMPRESSION_THRESHOLD, Compression, CompressionTotals
+from .metrics import ClientStats, Instrumentation, Metrics, PoolStats, combine
+from .retry import RetryPolicy
+from .scan import CursorScan, OffsetScan, _object_id
+from .errors import EigenlakeError, PayloadTooLargeError, ValidationError
+from .producer import DEFAULT_BATCH_BYTES, BatchProducer
+from .transport import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    Transport,
+    build_limits,
+    build_timeout,
+)
+from .validation import RecordValidator
 
 
 def _q(value: str) -> str:
@@ -16,12 +41,161 @@ def _index_path(namespace: str, index: str) -> str:
     return f"/v1/collections/{_q(namespace)}/{_q(index)}"
 
 
+_DEFAULT_CHUNK_SIZE = 5000
+_DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+NEAR_VECTOR_BATCH = "near-vector-batch"
+GET_MANY = "get-many"
+EXISTS_MANY = "exists-many"
+UPDATE_MANY = "update-many"
+REPLACE_MANY = "replace-many"
+DELETE_BY_IDS = "delete-by-ids"
+
+_CACHE_KEY_VECTORS = VectorCodec("float32")
+
+
+def _chunk_encoded(parts: Iterable[bytes], *, chunk_size: int, chunk_bytes: int) -> Iterator[List[bytes]]:
+    chunk_size = max(1, int(chunk_size))
+    chunk_bytes = max(1, int(chunk_bytes))
+    chunk: List[bytes] = []
+    size = 0
+    for part in parts:
+        if chunk and (len(chunk) >= chunk_size or size + len(part) > chunk_bytes):
+            yield chunk
+            chunk = []
+            size = 0
+        chunk.append(part)
+        size += len(part) + 1
+    if chunk:
+        yield chunk
+
+
+def _array_body(key: str, parts: List[bytes], fields: Dict[str, Any], codec: JSONCodec) -> bytes:
+    # Splices pre-encoded array items into the envelope instead of re-encoding them.
+    head = codec.dumps(key) + b":[" + b",".join(parts) + b"]"
+    rest = codec.dumps(fields)
+    if rest == b"{}":
+        return b"{" + head + b"}"
+    return b"{" + head + b"," + rest[1:]
+
+
+def _invalidates_cache(method):
+    # Writes through a handle drop its cached search results once they finish (or fail).
+    @functools.wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._h._invalidate()
+
+    return wrapper
+
+
 @dataclass
 class FailedRecord:
     id: str
     error: str
 
 
+def _vector_items(
+    vectors: Iterable[dict[str, Any]] | Matrix,
+    *,
+    ids: Iterable[str] | None,
+    properties: Iterable[Dict[str, Any]] | None,
+) -> Iterator[Dict[str, Any]]:
+    if ids is None:
+        if properties is not None:
+            raise ValueError("properties= requires ids= and a matrix of vectors")
+        yield from vectors
+        return
+
+    rows = iter_rows(vectors)
+    props = iter(properties) if properties is not None else None
+    for id in ids:
+        try:
+            row = next(rows)
+        except StopIteration:
+            raise ValueError("ids= has more entries than there are vectors") from None
+        item = {"uuid": str(id), "vector": row}
+        if props is not None:
+            item["properties"] = next(props)
+        yield item
+
+
+def _write_items(items: Iterable[Dict[str, Any] | tuple]) -> Iterator[Dict[str, Any]]:
+    # Accepts {"id", "properties", "vector"} dicts or (id, properties[, vector]) tuples.
+    for item in items:
+        if isinstance(item, dict):
+            id = item.get("id", item.get("uuid"))
+            properties, vector = item.get("properties"), item.get("vector")
+        else:
+            id, properties, *rest = item
+            vector = rest[0] if rest else None
+        yield {"id": str(id), "properties": properties, "vector": vector}
+
+
+def _validated(
+    records: Iterable[Dict[str, Any]],
+    validator: RecordValidator | None,
+    failed: List[FailedRecord],
+    *,
+    partial: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    # Invalid records are reported in `failed` and never encoded or sent.
+    if validator is None:
+        yield from records
+        return
+    for record in records:
+        error = validator.validate_record(record, partial=partial)
+        if error is None:
+            yield record
+        else:
+            failed.append(FailedRecord(id=str(record.get("id", record.get("uuid")) or ""), error=error))
+
+
+def _failed_records(resp: Dict[str, Any]) -> List[FailedRecord]:
+    return [
+        FailedRecord(id=str(item.get("uuid") or ""), error=str(item.get("error") or ""))
+        for item in (resp.get("failed_objects") or [])
+    ]
+
+
+@dataclass
+class FailedQuery:
+    index: int
+    error: str
+
+
+class NearestManyResult(list[Dict[str, Any] | None]):
+    def __init__(self, results: Iterable[Dict[str, Any] | None], *, failed_queries: List[FailedQuery] | None = None):
+        super().__init__(results)
+        self.failed_queries: List[FailedQuery] = failed_queries or []
+
+    @property
+    def number_errors(self) -> int:
+        return len(self.failed_queries)
+
+    def to_arrays(self, limit: int | None = None):
+        # Dense (n, k) ids (object, None-padded) and scores (float32, NaN-padded); failed rows stay empty.
+        np = require_numpy()
+        matches = [_matches(result) if result is not None else [] for result in self]
+        k = limit if limit is not None else max((len(m) for m in matches), default=0)
+        ids = np.full((len(matches), k), None, dtype=object)
+        scores = np.full((len(matches), k), np.nan, dtype=np.float32)
+        for row, row_matches in enumerate(matches):
+            for col, match in enumerate(row_matches[:k]):
+                ids[row, col] = match.get("uuid", match.get("id"))
+                score = match.get("score", match.get("distance"))
+                if score is not None:
+                    scores[row, col] = score
+        return ids, scores
+
+
+def _matches(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return result.get("results") or result.get("matches") or []
+
+
 class AddManyResult(list[str]):
     def __init__(self, ids: Iterable[str], *, failed_records: List[FailedRecord] | None = None):
         super().__init__(ids)
@@ -32,45 +206,85 @@ class AddManyResult(list[str]):
         return len(self.failed_records)
 
 
+class BulkWriteResult(list[str]):
+    def __init__(
+        self,
+        ids: Iterable[str],
+        *,
+        failed_records: List[FailedRecord] | None = None,
+        requests: int = 0,
+        seconds: float = 0.0,
+    ):
+        super().__init__(ids)
+        self.failed_records: List[FailedRecord] = failed_records or []
+        self.requests = requests
+        self.seconds = seconds
+
+    @property
+    def number_errors(self) -> int:
+        return len(self.failed_records)
+
+    @property
+    def records_per_second(self) -> float:
+        total = len(self) + len(self.failed_records)
+        return total / self.seconds if self.seconds > 0 else 0.0
+
+
 class IndexRecords:
     def __init__(self, handle: "IndexHandle"):
         self._h = handle
+        self._coalescers: Dict[tuple[bool, bool], Coalescer[str, Dict[str, Any] | None]] | None = None
+        self._coalesce_options: Dict[str, Any] = {}
+
+    def enable_validation(
+        self,
+        *,
+        schema: Dict[str, Any] | None = None,
+        dimensions: int | None = None,
+    ) -> RecordValidator:
+        if schema is None:
+            schema = self._h.settings.schema()
+        if dimensions is None:
+            dimensions = self._h.settings.dimensions()
+        self._h._validator = RecordValidator(schema, dimensions=dimensions)
+        return self._h._validator
+
+    def disable_validation(self) -> None:
+        self._h._validator = None
+
+    def _check(
+        self, id: str | None, properties: Dict[str, Any] | None, vector: Any, *, partial: bool = False
+    ) -> None:
+        validator = self._h._validator
+        if validator is not None:
+            error = validator.validate(properties, vector, partial=partial)
+            if error is not None:
+                raise ValidationError(f"record {id}: {error}" if id is not None else error)
 
+    @_invalidates_cache
     def add(
         self,
         *,
         properties: Dict[str, Any],
-        vector: List[float],
+        vector: Vector,
         id: str | None = None,
         on_duplicate: Literal["error", "replace", "skip"] = "error",
         batch_size: int = 500,
         max_workers: int = 1,
     ) -> str:
+        self._check(id, properties, vector)
         payload = {
             "properties": properties,
-            "vector": vector,
+            "vector": self._h._t.vectors.encode(vector),
             "uuid": id,
             "on_duplicate": on_duplicate,
             "batch_size": batch_size,
             "max_workers": max_workers,
         }
-        resp = self._h._t.post(f"{self._h._path}/data/insert", json=payload).json()
+        resp = self._h._t.post_json(f"{self._h._path}/data/insert", json=payload)
         return str(resp["uuid"])
 
-    @staticmethod
-    def _normalize_record(record: Dict[str, Any]) -> Dict[str, Any]:
-        item = dict(record)
-        if "id" in item:
-            item["uuid"] = item.pop("id")
-        return item
-
-    @staticmethod
-    def _normalize_vector_item(item: Dict[str, Any]) -> Dict[str, Any]:
-        normalized = dict(item)
-        if "id" in normalized:
-            normalized["uuid"] = normalized.pop("id")
-        return normalized
-
+    @_invalidates_cache
     def add_many(
         self,
         records: Iterable[dict[str, Any]],
@@ -79,51 +293,185 @@ class IndexRecords:
         on_error: Literal["raise", "continue"] = "raise",
         batch_size: int = 500,
         max_workers: int = 1,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        chunk_bytes: int = _DEFAULT_CHUNK_BYTES,
+        concurrency: int = 1,
+        validate: bool = True,
     ) -> AddManyResult:
-        payload = {
-            "objects": [self._normalize_record(record) for record in records],
+        fields = {
             "on_duplicate": on_duplicate,
             "on_error": on_error,
             "batch_size": batch_size,
             "max_workers": max_workers,
         }
-        resp = self._h._t.post(f"{self._h._path}/data/insert-many", json=payload).json()
-        failed = [
-            FailedRecord(id=str(item.get("uuid") or ""), error=str(item.get("error") or ""))
-            for item in (resp.get("failed_objects") or [])
-        ]
-        return AddManyResult(resp.get("uuids") or [], failed_records=failed)
 
+        def upload(chunk: List[bytes]) -> Dict[str, Any]:
+            return self._insert_encoded(chunk, fields)
+
+        uuids: List[str] = []
+        failed: List[FailedRecord] = []
+        records = _validated(records, self._h._validator if validate else None, failed)
+        encoded = (self._h._t.encode_record(record) for record in records)
+        chunks = _chunk_encoded(encoded, chunk_size=chunk_size, chunk_bytes=chunk_bytes)
+        for resp in bounded_map(upload, chunks, concurrency=concurrency):
+            uuids.extend(resp.get("uuids") or [])
+            failed.extend(_failed_records(resp))
+        return AddManyResult(uuids, failed_records=failed)
+
+    def _insert_encoded(self, parts: List[bytes], fields: Dict[str, Any]) -> Dict[str, Any]:
+        body = _array_body("objects", parts, fields, self._h._t.codec)
+        return self._h._t.post_json(f"{self._h._path}/data/insert-many", content=body, headers=_JSON_HEADERS)
+
+    @_invalidates_cache
     def add_vectors(
         self,
-        vectors: Iterable[dict[str, Any]],
+        vectors: Iterable[dict[str, Any]] | Matrix,
         *,
+        ids: Iterable[str] | None = None,
+        properties: Iterable[Dict[str, Any]] | None = None,
         batch_size: int = 500,
         max_workers: int = 1,
-    ) -> None:
-        payload = {
-            "vectors": [self._normalize_vector_item(item) for item in vectors],
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        chunk_bytes: int = _DEFAULT_CHUNK_BYTES,
+        concurrency: int = 1,
+    ) -> List[FailedRecord]:
+        fields = {
             "batch_size": batch_size,
             "max_workers": max_workers,
         }
-        self._h._t.post(f"{self._h._path}/data/insert-vectors", json=payload)
+
+        def upload(chunk: List[bytes]) -> None:
+            body = _array_body("vectors", chunk, fields, self._h._t.codec)
+            self._h._t.post(f"{self._h._path}/data/insert-vectors", content=body, headers=_JSON_HEADERS)
+
+        # Items without properties keep the stored ones, so only what is sent is checked.
+        failed: List[FailedRecord] = []
+        items = _vector_items(vectors, ids=ids, properties=properties)
+        items = _validated(items, self._h._validator, failed, partial=True)
+        encoded = (self._h._t.encode_record(item) for item in items)
+        chunks = _chunk_encoded(encoded, chunk_size=chunk_size, chunk_bytes=chunk_bytes)
+        for _ in bounded_map(upload, chunks, concurrency=concurrency):
+            pass
+        return failed
+
+    def import_file(self, path: str, **options: Any):
+        from .transfer import import_file
+
+        return import_file(self._h, path, **options)
 
     def get(self, id: str, *, return_data: bool = True, return_metadata: bool = True) -> dict[str, Any] | None:
+        if self._coalescers is not None:
+            return self._coalescer(return_data, return_metadata).load(str(id))
+        return self._get(id, return_data=return_data, return_metadata=return_metadata)
+
+    def _get(self, id: str, *, return_data: bool, return_metadata: bool) -> dict[str, Any] | None:
         payload = {
             "uuid": id,
             "return_data": return_data,
             "return_metadata": return_metadata,
         }
-        resp = self._h._t.post(f"{self._h._path}/data/get-by-id", json=payload).json()
-        return resp.get("object")
+        resp = self._h._t.post_json(f"{self._h._path}/data/get-by-id", json=payload)
+        return self._h._t.vectors.decode_response(resp).get("object")
+
+    def get_many(
+        self,
+        ids: Iterable[str],
+        *,
+        return_data: bool = True,
+        return_metadata: bool = True,
+        batch_size: int = 256,
+        concurrency: int = 8,
+        use_bulk_endpoint: bool | None = None,
+    ) -> List[Dict[str, Any] | None]:
+        # One entry per input id, in input order; missing records are None.
+        ids = [str(id) for id in ids]
+        unique = list(dict.fromkeys(ids))
+        if use_bulk_endpoint is None:
+            use_bulk_endpoint = GET_MANY in self._h._t.capabilities()
+
+        def fetch_one(chunk: List[str]) -> List[Dict[str, Any] | None]:
+            return [self._get(chunk[0], return_data=return_data, return_metadata=return_metadata)]
+
+        def fetch_bulk(chunk: List[str]) -> List[Dict[str, Any] | None]:
+            payload = {"uuids": chunk, "return_data": return_data, "return_metadata": return_metadata}
+            resp = self._h._t.post_json(f"{self._h._path}/data/get-many", json=payload)
+            objects = self._h._t.vectors.decode_response(resp).get("objects") or []
+            by_id = {_object_id(obj): obj for obj in objects if obj is not None}
+            return [by_id.get(id) for id in chunk]
+
+        chunks = list(chunked(unique, batch_size if use_bulk_endpoint else 1))
+        fetch = fetch_bulk if use_bulk_endpoint else fetch_one
+        found: Dict[str, Dict[str, Any] | None] = {}
+        for chunk, objects in zip(chunks, bounded_map(fetch, chunks, concurrency=concurrency)):
+            found.update(zip(chunk, objects))
+        return [found.get(id) for id in ids]
 
     def exists(self, id: str) -> bool:
-        resp = self._h._t.get(f"{self._h._path}/data/exists/{_q(id)}").json()
+        resp = self._h._t.get_json(f"{self._h._path}/data/exists/{_q(id)}")
         return bool(resp.get("exists", False))
 
+    def exists_many(
+        self,
+        ids: Iterable[str],
+        *,
+        batch_size: int = 1000,
+        concurrency: int = 8,
+        use_bulk_endpoint: bool | None = None,
+    ) -> List[bool]:
+        ids = [str(id) for id in ids]
+        unique = list(dict.fromkeys(ids))
+        if use_bulk_endpoint is None:
+            use_bulk_endpoint = EXISTS_MANY in self._h._t.capabilities()
+
+        def check_one(chunk: List[str]) -> List[bool]:
+            return [self.exists(chunk[0])]
+
+        def check_bulk(chunk: List[str]) -> List[bool]:
+            resp = self._h._t.post_json(f"{self._h._path}/data/exists-many", json={"uuids": chunk})
+            present = set(resp.get("existing") or [])
+            return [id in present for id in chunk]
+
+        chunks = list(chunked(unique, batch_size if use_bulk_endpoint else 1))
+        check = check_bulk if use_bulk_endpoint else check_one
+        found: Dict[str, bool] = {}
+        for chunk, flags in zip(chunks, bounded_map(check, chunks, concurrency=concurrency)):
+            found.update(zip(chunk, flags))
+        return [found[id] for id in ids]
+
+    def enable_coalescing(self, *, window: float = 0.002, max_batch: int = 256, concurrency: int = 8) -> None:
+        # Concurrent get() calls within `window` seconds are served by one get_many().
+        self._coalesce_options = {"window": window, "max_batch": max_batch, "concurrency": concurrency}
+        self._coalescers = {}
+
+    def disable_coalescing(self) -> None:
+        self._coalescers = None
+
+    def _coalescer(self, return_data: bool, return_metadata: bool) -> Coalescer[str, Dict[str, Any] | None]:
+        coalescers = self._coalescers
+        key = (bool(return_data), bool(return_metadata))
+        coalescer = coalescers.get(key)
+        if coalescer is None:
+            options = self._coalesce_options
+
+            def load_many(ids: List[str]) -> List[Dict[str, Any] | None]:
+                return self.get_many(
+                    ids,
+                    return_data=return_data,
+                    return_metadata=return_metadata,
+                    batch_size=options["max_batch"],
+                    concurrency=options["concurrency"],
+                )
+
+            coalescer = coalescers.setdefault(
+                key, Coalescer(load_many, window=options["window"], max_batch=options["max_batch"])
+            )
+        return coalescer
+
+    @_invalidates_cache
     def remove(self, id: str, *, batch_size: int = 500) -> None:
         self._h._t.delete(f"{self._h._path}/data/{_q(id)}", params={"batch_size": batch_size})
 
+    @_invalidates_cache
     def remove_many(
         self,
         *,
@@ -142,37 +490,146 @@ class IndexRecords:
             "batch_size": batch_size,
             "background": background,
         }
-        return self._h._t.post(f"{self._h._path}/data/delete-many", json=payload).json()
+        return self._h._t.post_json(f"{self._h._path}/data/delete-many", json=payload)
 
     def remove_job(self, job_id: int) -> Dict[str, Any]:
-        return self._h._t.get(f"{self._h._path}/data/delete-jobs/{int(job_id)}").json()
+        return self._h._t.get_json(f"{self._h._path}/data/delete-jobs/{int(job_id)}")
 
+    @_invalidates_cache
     def update(
         self,
         *,
         id: str,
         properties: Dict[str, Any] | None = None,
-        vector: List[float] | None = None,
+        vector: Vector | None = None,
     ) -> None:
+        self._check(id, properties, vector, partial=True)
         payload = {
             "properties": properties,
-            "vector": vector,
+            "vector": self._h._t.vectors.encode(vector),
         }
         self._h._t.patch(f"{self._h._path}/data/{_q(id)}", json=payload)
 
+    @_invalidates_cache
     def replace(
         self,
         *,
         id: str,
         properties: Dict[str, Any],
-        vector: List[float] | None = None,
+        vector: Vector | None = None,
     ) -> None:
+        self._check(id, properties, vector)
         payload = {
             "properties": properties,
-            "vector": vector,
+            "vector": self._h._t.vectors.encode(vector),
         }
         self._h._t.put(f"{self._h._path}/data/{_q(id)}", json=payload)
 
+    @_invalidates_cache
+    def update_many(
+        self,
+        items: Iterable[Dict[str, Any] | tuple],
+        *,
+        batch_size: int = 500,
+        concurrency: int = 8,
+        use_bulk_endpoint: bool | None = None,
+    ) -> BulkWriteResult:
+        failed: List[FailedRecord] = []
+        records = _validated(_write_items(items), self._h._validator, failed, partial=True)
+        return self._write_many(
+            records,
+            feature=UPDATE_MANY,
+            single=lambda record: self.update(**record),
+            batch_size=batch_size,
+            concurrency=concurrency,
+            use_bulk_endpoint=use_bulk_endpoint,
+            failed=failed,
+        )
+
+    @_invalidates_cache
+    def replace_many(
+        self,
+        items: Iterable[Dict[str, Any] | tuple],
+        *,
+        batch_size: int = 500,
+        concurrency: int = 8,
+        use_bulk_endpoint: bool | None = None,
+    ) -> BulkWriteResult:
+        failed: List[FailedRecord] = []
+        records = _validated(_write_items(items), self._h._validator, failed)
+        return self._write_many(
+            records,
+            feature=REPLACE_MANY,
+            single=lambda record: self.replace(**record),
+            batch_size=batch_size,
+            concurrency=concurrency,
+            use_bulk_endpoint=use_bulk_endpoint,
+            failed=failed,
+        )
+
+    @_invalidates_cache
+    def remove_ids(
+        self,
+        ids: Iterable[str],
+        *,
+        batch_size: int = 1000,
+        concurrency: int = 8,
+        use_bulk_endpoint: bool | None = None,
+    ) -> BulkWriteResult:
+        return self._write_many(
+            ({"id": str(id)} for id in ids),
+            feature=DELETE_BY_IDS,
+            single=lambda record: self.remove(record["id"]),
+            batch_size=batch_size,
+            concurrency=concurrency,
+            use_bulk_endpoint=use_bulk_endpoint,
+        )
+
+    def _write_many(
+        self,
+        records: Iterable[Dict[str, Any]],
+        *,
+        feature: str,
+        single: Callable[[Dict[str, Any]], Any],
+        batch_size: int,
+        concurrency: int,
+        use_bulk_endpoint: bool | None,
+        failed: List[FailedRecord] | None = None,
+    ) -> BulkWriteResult:
+        # Streams records through bounded_map: one bulk request per chunk, or one request per record.
+        started = time.perf_counter()
+        if use_bulk_endpoint is None:
+            use_bulk_endpoint = feature in self._h._t.capabilities()
+        path = f"{self._h._path}/data/{feature}"
+
+        def send_bulk(chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+            if feature == DELETE_BY_IDS:
+                return self._h._t.post_json(path, json={"uuids": [record["id"] for record in chunk]})
+            parts = [self._h._t.encode_record(record) for record in chunk]
+            body = _array_body("objects", parts, {}, self._h._t.codec)
+            return self._h._t.post_json(path, content=body, headers=_JSON_HEADERS)
+
+        def run(chunk: List[Dict[str, Any]]) -> tuple[List[str], List[FailedRecord]]:
+            try:
+                if use_bulk_endpoint:
+                    resp = send_bulk(chunk)
+                    return [str(id) for id in resp.get("uuids") or []], _failed_records(resp)
+                single(chunk[0])
+                return [chunk[0]["id"]], []
+            except EigenlakeError as exc:
+                return [], [FailedRecord(id=record["id"], error=str(exc)) for record in chunk]
+
+        ids: List[str] = []
+        failed = failed if failed is not None else []
+        requests = 0
+        chunks = chunked(records, batch_size if use_bulk_endpoint else 1)
+        for done, rejected in bounded_map(run, chunks, concurrency=concurrency):
+            ids.extend(done)
+            failed.extend(rejected)
+            requests += 1
+        seconds = time.perf_counter() - started
+        return BulkWriteResult(ids, failed_records=failed, requests=requests, seconds=seconds)
+
     def list(
         self,
         *,
@@ -182,6 +639,7 @@ class IndexRecords:
         with_vector: bool = False,
         with_properties: bool = True,
         on_missing: Literal["skip", "error"] = "skip",
+        as_numpy: bool = False,
     ) -> Dict[str, Any]:
         payload = {
             "where": filter,
@@ -191,24 +649,127 @@ class IndexRecords:
             "include_properties": with_properties,
             "on_missing_keys": on_missing,
         }
-        return self._h._t.post(f"{self._h._path}/data/get-by-filter", json=payload).json()
+        resp = self._h._t.post_json(f"{self._h._path}/data/get-by-filter", json=payload)
+        return self._h._t.vectors.decode_response(resp, as_numpy=as_numpy)
+
+    def scan(
+        self,
+        *,
+        filter: Dict[str, Any] | None = None,
+        page_size: int = 500,
+        with_vector: bool = False,
+        with_properties: bool = True,
+        on_missing: Literal["skip", "error"] = "skip",
+        as_numpy: bool = False,
+        checkpoint: str | None = None,
+        pipeline: bool = True,
+    ) -> CursorScan:
+        def fetch(after: str | None) -> Dict[str, Any]:
+            return self.list(
+                filter=filter or {},
+                limit=page_size,
+                after=after,
+                with_vector=with_vector,
+                with_properties=with_properties,
+                on_missing=on_missing,
+                as_numpy=as_numpy,
+            )
+
+        return CursorScan(fetch, filter=filter, page_size=page_size, checkpoint=checkpoint, pipeline=pipeline)
 
 
 class IndexSearch:
     def __init__(self, handle: "IndexHandle"):
         self._h = handle
 
-    def nearest(self, *, vector: List[float], limit: int = 10, filter: Dict[str, Any] | None = None):
+    def enable_cache(self, *, maxsize: int = 1024, ttl: float | None = 60.0) -> QueryCache:
+        self._h._query_cache = QueryCache(maxsize=maxsize, ttl=ttl)
+        return self._h._query_cache
+
+    def disable_cache(self) -> None:
+        self._h._query_cache = None
+
+    def cache_stats(self) -> CacheStats | None:
+        cache = self._h._query_cache
+        return cache.stats() if cache is not None else None
+
+    def nearest(self, *, vector: Vector, limit: int = 10, filter: Dict[str, Any] | None = None):
+        cache = self._h._query_cache
+        if cache is None:
+            return self._nearest(vector=vector, limit=limit, filter=filter)
+        key = query_key("nearest", _CACHE_KEY_VECTORS.to_bytes(vector), limit=limit, filter=filter)
+        return cache.get_or_load(key, lambda: self._nearest(vector=vector, limit=limit, filter=filter))
+
+    def _nearest(self, *, vector: Vector, limit: int, filter: Dict[str, Any] | None):
         payload = {
-            "vector": vector,
+            "vector": self._h._t.vectors.encode(vector),
             "top_k": limit,
             "filter": filter,
         }
-        return self._h._t.post(f"{self._h._path}/query/near-vector", json=payload).json()
+        resp = self._h._t.post_json(f"{self._h._path}/query/near-vector", json=payload)
+        return self._h._t.vectors.decode_response(resp)
 
-    def get(self, id: str, *, with_vector: bool = False) -> Dict[str, Any]:
+    def nearest_many(
+        self,
+        vectors: Matrix,
+        *,
+        limit: int = 10,
+        filter: Dict[str, Any] | None = None,
+        concurrency: int = 8,
+        batch_size: int = 64,
+        use_batch_endpoint: bool | None = None,
+    ) -> NearestManyResult:
+        if use_batch_endpoint is None:
+            use_batch_endpoint = NEAR_VECTOR_BATCH in self._h._t.capabilities()
+
+        def run_one(chunk: List[tuple[int, Vector]]) -> List[tuple[int, Dict[str, Any] | None, str | None]]:
+            index, vector = chunk[0]
+            try:
+                return [(index, self.nearest(vector=vector, limit=limit, filter=filter), None)]
+            except EigenlakeError as exc:
+                return [(index, None, str(exc))]
+
+        def run_batch(chunk: List[tuple[int, Vector]]) -> List[tuple[int, Dict[str, Any] | None, str | None]]:
+            payload = {
+                "vectors": [self._h._t.vectors.encode(vector) for _, vector in chunk],
+                "top_k": limit,
+                "filter": filter,
+            }
+            try:
+                resp = self._h._t.post_json(f"{self._h._path}/query/near-vector-batch", json=payload)
+            except EigenlakeError as exc:
+                return [(index, None, str(exc)) for index, _ in chunk]
+            items = resp.get("results") or []
+            out: List[tuple[int, Dict[str, Any] | None, str | None]] = []
+            for position, (index, _) in enumerate(chunk):
+                item = items[position] if position < len(items) else {"error": "missing from batch response"}
+                if item.get("error"):
+                    out.append((index, None, str(item["error"])))
+                else:
+                    out.append((index, self._h._t.vectors.decode_response(item), None))
+            return out
+
+        chunks = chunked(enumerate(iter_rows(vectors)), batch_size if use_batch_endpoint else 1)
+        results: List[Dict[str, Any] | None] = []
+        failed: List[FailedQuery] = []
+        for batch in bounded_map(run_batch if use_batch_endpoint else run_one, chunks, concurrency=concurrency):
+            for index, result, error in batch:
+                results.append(result)
+                if error is not None:
+                    failed.append(FailedQuery(index=index, error=error))
+        return NearestManyResult(results, failed_queries=failed)
+
+    def get(self, id: str, *, with_vector: bool = False, as_numpy: bool = False) -> Dict[str, Any]:
+        cache = self._h._query_cache
+        if cache is None:
+            return self._get(id, with_vector=with_vector, as_numpy=as_numpy)
+        key = query_key("get", None, id=id, with_vector=bool(with_vector), as_numpy=as_numpy)
+        return cache.get_or_load(key, lambda: self._get(id, with_vector=with_vector, as_numpy=as_numpy))
+
+    def _get(self, id: str, *, with_vector: bool, as_numpy: bool) -> Dict[str, Any]:
         params = {"include_vector": bool(with_vector)}
-        return self._h._t.get(f"{self._h._path}/query/object/{_q(id)}", params=params).json()
+        resp = self._h._t.get_json(f"{self._h._path}/query/object/{_q(id)}", params=params)
+        return self._h._t.vectors.decode_response(resp, as_numpy=as_numpy)
 
     def list(
         self,
@@ -218,6 +779,7 @@ class IndexSearch:
         with_vector: bool = False,
         with_properties: bool = True,
         newest_first: bool = True,
+        as_numpy: bool = False,
     ) -> Dict[str, Any]:
         params = {
             "limit": limit,
@@ -226,7 +788,8 @@ class IndexSearch:
             "include_properties": with_properties,
             "newest_first": newest_first,
         }
-        return self._h._t.get(f"{self._h._path}/query/objects", params=params).json()
+        resp = self._h._t.get_json(f"{self._h._path}/query/objects", params=params)
+        return self._h._t.vectors.decode_response(resp, as_numpy=as_numpy)
 
     def iterate(
         self,
@@ -235,30 +798,48 @@ class IndexSearch:
         with_vector: bool = False,
         with_properties: bool = True,
         newest_first: bool = True,
-    ) -> Iterator[dict[str, Any]]:
-        offset = 0
-        while True:
-            page = self.list(
+        as_numpy: bool = False,
+        prefetch: int = 0,
+        parallel: int = 1,
+        ordered: bool = True,
+    ) -> OffsetScan:
+        def fetch(offset: int) -> Dict[str, Any]:
+            return self.list(
                 limit=page_size,
                 offset=offset,
                 with_vector=with_vector,
                 with_properties=with_properties,
                 newest_first=newest_first,
+                as_numpy=as_numpy,
             )
-            objects = page.get("objects") or []
-            if not objects:
-                break
-            for obj in objects:
-                yield obj
-            offset = int(page.get("next_offset") or 0)
+
+        return OffsetScan(fetch, page_size=page_size, prefetch=prefetch, parallel=parallel, ordered=ordered)
 
 
 class IndexSettings:
     def __init__(self, handle: "IndexHandle"):
         self._h = handle
 
-    def _read(self) -> dict[str, Any]:
-        return self._h._t.get(f"{self._h._path}/config").json()
+    def _read(self, *, refresh: bool = False) -> dict[str, Any]:
+        meta = self._h._meta
+        path = self._h._path
+        if not refresh:
+            cached = meta.config(path)
+            if cached is not None:
+                return cached
+
+        entry = meta.get(path)
+        headers = {"If-None-Match": entry.etag} if entry.etag and entry.config is not None else None
+        resp = self._h._t.get(f"{path}/config", headers=headers)
+        if resp.status_code == 304 and entry.config is not None:
+            config, etag = entry.config, entry.etag
+        else:
+            config, etag = self._h._t.decode(resp), resp.headers.get("ETag")
+        meta.store_config(path, config, etag)
+        return config
+
+    def refresh(self) -> Dict[str, Any]:
+        return dict(self._read(refresh=True))
 
     def dimensions(self) -> int:
         return int(self._read().get("dims", 0))
@@ -274,13 +855,18 @@ class IndexManage:
     def __init__(self, handle: "IndexHandle"):
         self._h = handle
 
+    @_invalidates_cache
     def delete(self, *, ensure_remote: bool = True, drop_keys_table: bool = True):
         params = {
             "ensure_remote": ensure_remote,
             "drop_keys_table": drop_keys_table,
         }
-        return self._h._t.delete(self._h._path, params=params).json()
+        try:
+            return self._h._t.delete_json(self._h._path, params=params)
+        finally:
+            self._h._meta.forget(self._h._path)
 
+    @_invalidates_cache
     def remove_by_filter(
         self,
         *,
@@ -299,7 +885,7 @@ class IndexManage:
             "batch_size": batch_size,
             "background": background,
         }
-        return self._h._t.post(f"{self._h._path}/admin/delete-by-filter", json=payload).json()
+        return self._h._t.post_json(f"{self._h._path}/admin/delete-by-filter", json=payload)
 
 
 class IndexBatch:
@@ -313,12 +899,48 @@ class IndexBatch:
         batch_size: int = 200,
         max_workers: int = 1,
         on_error: Literal["raise", "continue"] = "continue",
+        max_batch_bytes: int = _DEFAULT_CHUNK_BYTES,
+        adaptive: bool = False,
+        max_batch_size: int = _DEFAULT_CHUNK_SIZE,
+        target_latency: float = 1.0,
+        bisect: bool = True,
     ):
         return _SizedBatchWriter(
             manager=self,
             batch_size=int(batch_size),
             max_workers=int(max_workers),
             on_error=on_error,
+            max_batch_bytes=int(max_batch_bytes),
+            sizer=(
+                AdaptiveBatchSize(batch_size, maximum=max_batch_size, target_latency=target_latency)
+                if adaptive
+                else None
+            ),
+            bisect=bisect,
+        )
+
+    def spooled(
+        self,
+        directory: str,
+        *,
+        segment_records: int = 10_000,
+        segment_bytes: int = 64 * 1024 * 1024,
+        max_segment_age: float = 1.0,
+        batch_size: int = 500,
+        concurrency: int = 2,
+        fsync: bool = False,
+    ):
+        from .spool import Spool
+
+        return Spool(
+            self._h,
+            directory,
+            segment_records=segment_records,
+            segment_bytes=segment_bytes,
+            max_segment_age=max_segment_age,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            fsync=fsync,
         )
 
 
@@ -330,73 +952,163 @@ class _SizedBatchWriter:
         batch_size: int,
         max_workers: int,
         on_error: Literal["raise", "continue"],
+        max_batch_bytes: int = _DEFAULT_CHUNK_BYTES,
+        sizer: AdaptiveBatchSize | None = None,
+        bisect: bool = True,
     ):
         self._m = manager
         self._batch_size = max(1, batch_size)
         self._max_workers = max(1, max_workers)
         self._on_error = on_error
+        self._max_batch_bytes = max(1, max_batch_bytes)
+        self._sizer = sizer
+        self._bisect = bisect
 
-        self._buffer: List[dict[str, Any]] = []
+        # Records are encoded when added; the buffer holds (id, bytes) pairs.
+        self._buffer: List[tuple[str, bytes]] = []
+        self._buffer_bytes = 0
         self.failed_records: List[FailedRecord] = []
         self.number_errors: int = 0
+        self.requests: int = 0
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self._max_workers)
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight: List[Future] = []
+        self._error: BaseException | None = None
+
+    @property
+    def batch_size(self) -> int:
+        return self._sizer.current if self._sizer is not None else self._batch_size
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc, tb):
-        self.flush()
-        self._m.failed_records = list(self.failed_records)
+        try:
+            self.flush()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            self._m.failed_records = list(self.failed_records)
         return False
 
     def add(
         self,
         *,
         properties: Dict[str, Any],
-        vector: List[float],
+        vector: Vector,
         id: str | None = None,
     ) -> str:
+        self._raise_pending_error()
         out_id = str(id) if id is not None else str(uuid4())
-        self._buffer.append(
-            {
-                "properties": properties,
-                "vector": vector,
-                "id": out_id,
-            }
-        )
-        if len(self._buffer) >= self._batch_size:
-            self.flush()
+        validator = self._m._h._validator
+        error = validator.validate(properties, vector) if validator is not None else None
+        if error is not None:
+            with self._lock:
+                self.number_errors += 1
+                self.failed_records.append(FailedRecord(id=out_id, error=error))
+            if self._on_error == "raise":
+                raise ValidationError(f"record {out_id}: {error}")
+            return out_id
+
+        body = self._m._h._t.encode_record({"id": out_id, "properties": properties, "vector": vector})
+        if self._buffer and self._buffer_bytes + len(body) > self._max_batch_bytes:
+            self._submit()
+        self._buffer.append((out_id, body))
+        self._buffer_bytes += len(body) + 1
+        if len(self._buffer) >= self.batch_size:
+            self._submit()
         return out_id
 
     def flush(self) -> None:
+        self._submit()
+        wait(self._in_flight)
+        self._in_flight = []
+        self._raise_pending_error()
+
+    def _submit(self) -> None:
         if not self._buffer:
             return
 
-        payload = list(self._buffer)
+        payload = self._buffer
         self._buffer = []
+        self._buffer_bytes = 0
 
-        try:
-            result = self._m._h.records.add_many(
-                payload,
-                on_duplicate="error",
-                on_error="continue",
-                batch_size=self._batch_size,
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
                 max_workers=self._max_workers,
+                thread_name_prefix="eigenlake-batch",
             )
-            self.number_errors += result.number_errors
-            self.failed_records.extend(result.failed_records)
+        # Blocks the producer once max_workers batches are outstanding.
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(contextvars.copy_context().run, self._upload, payload)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._in_flight = [f for f in self._in_flight if not f.done()]
+        self._in_flight.append(future)
+
+    def _upload(self, payload: List[tuple[str, bytes]]) -> None:
+        try:
+            self._send(payload)
+        finally:
+            self._m._h._invalidate()
+
+    def _send(self, payload: List[tuple[str, bytes]]) -> None:
+        fields = {
+            "on_duplicate": "error",
+            "on_error": "continue",
+            "batch_size": len(payload),
+            "max_workers": self._max_workers,
+        }
+        started = time.perf_counter()
+        try:
+            resp = self._m._h.records._insert_encoded([body for _, body in payload], fields)
         except Exception as exc:
-            self.number_errors += len(payload)
-            self.failed_records.extend(
-                [FailedRecord(id=str(item.get("id") or ""), error=str(exc)) for item in payload]
-            )
-            if self._on_error == "raise":
-                raise
+            if self._sizer is not None:
+                self._sizer.record(latency=time.perf_counter() - started, ok=False)
+            with self._lock:
+                self.requests += 1
+            # A batch rejected for its content is split until the failing records are isolated;
+            # transport and server errors would fail every half the same way, so they fail the batch.
+            if self._bisect and len(payload) > 1 and isinstance(exc, (ValidationError, PayloadTooLargeError)):
+                middle = len(payload) // 2
+                self._send(payload[:middle])
+                self._send(payload[middle:])
+                return
+            with self._lock:
+                self.number_errors += len(payload)
+                self.failed_records.extend([FailedRecord(id=id, error=str(exc)) for id, _ in payload])
+                if self._on_error == "raise" and self._error is None:
+                    self._error = exc
+            return
+
+        if self._sizer is not None:
+            self._sizer.record(latency=time.perf_counter() - started, ok=True)
+        failed = _failed_records(resp)
+        with self._lock:
+            self.requests += 1
+            self.number_errors += len(failed)
+            self.failed_records.extend(failed)
+
+    def _raise_pending_error(self) -> None:
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
 
 
 class IndexHandle:
-    def __init__(self, transport: Transport, namespace: str, index: str):
+    def __init__(self, transport: Transport, namespace: str, index: str, *, metadata: MetadataCache | None = None):
         self._t = transport
         self._path = _index_path(namespace, index)
+        self._meta = metadata if metadata is not None else MetadataCache(ttl=0)
+        self._query_cache: QueryCache | None = None
+        self._validator: RecordValidator | None = None
 
         self.records = IndexRecords(self)
         self.search = IndexSearch(self)
@@ -404,10 +1116,55 @@ class IndexHandle:
         self.manage = IndexManage(self)
         self.batch = IndexBatch(self)
 
+    def producer(
+        self,
+        *,
+        batch_size: int = 500,
+        batch_bytes: int = DEFAULT_BATCH_BYTES,
+        linger: float = 0.005,
+        max_queue: int = 10_000,
+        max_in_flight: int = 4,
+        on_duplicate: Literal["error", "replace", "skip"] = "error",
+    ) -> BatchProducer:
+        return BatchProducer(
+            self,
+            batch_size=batch_size,
+            batch_bytes=batch_bytes,
+            linger=linger,
+            max_queue=max_queue,
+            max_in_flight=max_in_flight,
+            on_duplicate=on_duplicate,
+        )
+
+    def ingest(self, source: Iterable[Dict[str, Any]], embed_fn: Callable[[List[str]], Matrix], **options: Any):
+        from .pipeline import ingest
+
+        return ingest(self, source, embed_fn, **options)
+
+    def export(self, path: str, **options: Any):
+        from .transfer import export
+
+        return export(self, path, **options)
+
+    def _invalidate(self) -> None:
+        if self._query_cache is not None:
+            self._query_cache.invalidate()
+
+
+def _config_matches(config: Dict[str, Any], dimensions: int, schema: Dict[str, Any] | None) -> bool:
+    if config.get("dims") is None or int(config["dims"]) != int(dimensions):
+        return False
+    return schema is None or config.get("schema") == schema
+
 
 class IndexesNamespace:
-    def __init__(self, transport: Transport):
+    def __init__(self, transport: Transport, metadata: MetadataCache | None = None):
         self._t = transport
+        self._meta = metadata if metadata is not None else MetadataCache()
+
+    def _handle(self, namespace: str, index: str) -> IndexHandle:
+        # Handles share the metadata cache but each keeps its own validator, query cache and coalescers.
+        return IndexHandle(self._t, namespace, index, metadata=self._meta)
 
     def create_or_get(
         self,
@@ -421,6 +1178,12 @@ class IndexesNamespace:
         record_id_property: str = "document_id",
     ) -> IndexHandle:
         shard_count = max(1, int(shard_count))
+        handle = self._handle(namespace, index)
+        # Skips the round trip only when the cached config shows the server would accept it as is.
+        config = self._meta.config(handle._path) if self._meta.exists(handle._path) else None
+        if config is not None and _config_matches(config, dimensions, schema):
+            return handle
+
         payload = {
             "namespace": namespace,
             "index": index,
@@ -431,14 +1194,24 @@ class IndexesNamespace:
             "record_id_property": record_id_property,
         }
         self._t.post("/v1/collections/get-or-create", json=payload)
-        return IndexHandle(self._t, namespace, index)
+        self._meta.mark_exists(handle._path)
+        return handle
 
     def open(self, *, namespace: str, index: str) -> IndexHandle:
-        self._t.get(_index_path(namespace, index))
-        return IndexHandle(self._t, namespace, index)
+        handle = self._handle(namespace, index)
+        if not self._meta.exists(handle._path):
+            self._t.get(handle._path)
+            self._meta.mark_exists(handle._path)
+        return handle
 
     def ref(self, *, namespace: str, index: str) -> IndexHandle:
-        return IndexHandle(self._t, namespace, index)
+        return self._handle(namespace, index)
+
+    def refresh(self, *, namespace: str | None = None, index: str | None = None) -> None:
+        if namespace is None or index is None:
+            self._meta.forget()
+        else:
+            self._meta.forget(_index_path(namespace, index))
 
 
 class EigenLakeClient:
@@ -447,20 +1220,80 @@ class EigenLakeClient:
         *,
         url: str,
         api_key: str | None = None,
-        timeout: float = 20.0,
+        timeout: float | httpx.Timeout = 20.0,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
         retries: int = 2,
+        retry_policy: RetryPolicy | None = None,
+        vector_encoding: VectorEncoding = "json",
+        compression: Compression | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        codec: CodecName | JSONCodec = "auto",
+        metadata_ttl: float | None = 30.0,
+        http_transport: httpx.BaseTransport | None = None,
+        metrics: bool = False,
+        hooks: Sequence[Instrumentation] | None = None,
+        warmup: int = 0,
     ):
+        self._metrics = Metrics() if metrics else None
+        self._hooks: List[Instrumentation] = list(hooks or [])
         self._transport = Transport(
             base_url=url,
             api_key=api_key,
-            timeout=timeout,
+            timeout=build_timeout(
+                timeout, connect=connect_timeout, read=read_timeout, write=write_timeout, pool=pool_timeout
+            ),
             retries=retries,
+            retry_policy=retry_policy,
+            vector_encoding=vector_encoding,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            codec=codec,
+            http_transport=http_transport,
+            instrumentation=combine([self._metrics, *self._hooks]),
+            limits=build_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+            http2=http2,
         )
-        self.indexes = IndexesNamespace(self._transport)
+        if warmup:
+            self._transport.warm_up(warmup)
+        self.indexes = IndexesNamespace(self._transport, MetadataCache(ttl=metadata_ttl))
+
+    def compression_stats(self) -> CompressionTotals | None:
+        compressor = self._transport.compressor
+        return compressor.totals() if compressor is not None else None
+
+    def stats(self) -> ClientStats | None:
+        # None unless the client was created with metrics=True.
+        if self._metrics is None:
+            return None
+        return self._metrics.snapshot(self._transport.pool_stats())
+
+    def pool_stats(self) -> PoolStats:
+        return self._transport.pool_stats()
+
+    def add_hook(self, hook: Instrumentation) -> None:
+        self._hooks.append(hook)
+        self._transport.instrumentation = combine([self._metrics, *self._hooks])
+
+    def remove_hook(self, hook: Instrumentation) -> None:
+        self._hooks.remove(hook)
+        self._transport.instrumentation = combine([self._metrics, *self._hooks])
+
+    def capabilities(self) -> frozenset[str]:
+        return self._transport.capabilities()
+
+    def warm_up(self, connections: int = 1) -> int:
+        return self._transport.warm_up(connections)
 
     def ready(self) -> bool:
         try:
-            payload = self._transport.get("/v1/health/ready").json()
+            payload = self._transport.get_json("/v1/health/ready")
             return bool(payload.get("ready"))
         except Exception:
             return False
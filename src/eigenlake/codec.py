@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Literal, Protocol, runtime_checkable
+
+from ._vectors import json_default
+
+CodecName = Literal["auto", "stdlib", "orjson", "msgspec"]
+
+
+@runtime_checkable
+class JSONCodec(Protocol):
+    name: str
+
+    def dumps(self, value: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+class StdlibCodec:
+    name = "stdlib"
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(separators=(",", ":"), default=json_default)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        # NumPy arrays are serialized natively, without a .tolist() round trip.
+        self._options = orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value, default=json_default, option=self._options)
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec:
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder(enc_hook=json_default)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+_CODECS = {"stdlib": StdlibCodec, "orjson": OrjsonCodec, "msgspec": MsgspecCodec}
+
+
+def get_codec(codec: CodecName | JSONCodec = "auto") -> JSONCodec:
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "auto":
+        for name in ("orjson", "msgspec"):
+            try:
+                return _CODECS[name]()
+            except ImportError:
+                continue
+        return StdlibCodec()
+    if codec not in _CODECS:
+        raise ValueError(f"Unsupported JSON codec: {codec!r}")
+    return _CODECS[codec]()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import gzip
+import threading
+import time
+from dataclasses import dataclass
+from typing import Literal
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+Compression = Literal["auto", "gzip", "zstd"]
+
+DEFAULT_COMPRESSION_THRESHOLD = 32 * 1024
+
+
+@dataclass(frozen=True)
+class CompressionStats:
+    encoding: str
+    original_bytes: int
+    compressed_bytes: int
+    seconds: float
+
+    @property
+    def ratio(self) -> float:
+        if not self.compressed_bytes:
+            return 1.0
+        return self.original_bytes / self.compressed_bytes
+
+
+@dataclass(frozen=True)
+class CompressionTotals:
+    requests: int = 0
+    skipped: int = 0
+    original_bytes: int = 0
+    compressed_bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def ratio(self) -> float:
+        if not self.compressed_bytes:
+            return 1.0
+        return self.original_bytes / self.compressed_bytes
+
+
+def accept_encoding() -> str:
+    return "zstd, gzip, deflate" if zstandard is not None else "gzip, deflate"
+
+
+class BodyCompressor:
+    def __init__(
+        self,
+        compression: Compression,
+        *,
+        threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        level: int | None = None,
+    ):
+        if compression == "auto":
+            compression = "zstd" if zstandard is not None else "gzip"
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstd compression requires zstandard: pip install 'eigenlake[zstd]'")
+        if compression not in ("gzip", "zstd"):
+            raise ValueError(f"Unsupported compression: {compression!r}")
+
+        self.encoding: str = compression
+        self.threshold = max(0, int(threshold))
+        self._level = level
+        self._lock = threading.Lock()
+        self._totals = CompressionTotals()
+
+    def compress(self, body: bytes) -> tuple[bytes, CompressionStats | None]:
+        if len(body) < self.threshold:
+            with self._lock:
+                self._totals = _add(self._totals, skipped=1)
+            return body, None
+
+        started = time.perf_counter()
+        if self.encoding == "zstd":
+            level = 3 if self._level is None else self._level
+            compressed = zstandard.ZstdCompressor(level=level).compress(body)
+        else:
+            level = 6 if self._level is None else self._level
+            compressed = gzip.compress(body, compresslevel=level, mtime=0)
+        stats = CompressionStats(
+            encoding=self.encoding,
+            original_bytes=len(body),
+            compressed_bytes=len(compressed),
+            seconds=time.perf_counter() - started,
+        )
+        with self._lock:
+            self._totals = _add(
+                self._totals,
+                requests=1,
+                original_bytes=stats.original_bytes,
+                compressed_bytes=stats.compressed_bytes,
+                seconds=stats.seconds,
+            )
+        return compressed, stats
+
+    def totals(self) -> CompressionTotals:
+        with self._lock:
+            return self._totals
+
+
+def _add(totals: CompressionTotals, **delta) -> CompressionTotals:
+    return CompressionTotals(
+        requests=totals.requests + delta.get("requests", 0),
+        skipped=totals.skipped + delta.get("skipped", 0),
+        original_bytes=totals.original_bytes + delta.get("original_bytes", 0),
+        compressed_bytes=totals.compressed_bytes + delta.get("compressed_bytes", 0),
+        seconds=totals.seconds + delta.get("seconds", 0.0),
+    )
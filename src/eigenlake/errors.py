@@ -27,3 +27,23 @@ class APIError(EigenlakeError):
 
 class NetworkError(EigenlakeError):
     pass
+
+
+class RateLimitError(APIError):
+    pass
+
+
+class PayloadTooLargeError(APIError):
+    pass
+
+
+class ServerError(APIError):
+    pass
+
+
+class CircuitOpenError(NetworkError):
+    pass
+
+
+class DeadlineExceededError(NetworkError):
+    pass
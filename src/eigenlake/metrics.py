@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Sequence
+
+# Log-spaced latency buckets ~4% wide starting at 1µs, so percentiles are within one bucket width.
+_BUCKET_FLOOR = 1e-6
+_BUCKET_GROWTH = 1.04
+_LOG_GROWTH = math.log(_BUCKET_GROWTH)
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    method: str
+    endpoint: str
+    path: str
+    attempt: int
+    seconds: float
+    status: int | None = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    error: BaseException | None = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or (self.status is not None and self.status >= 400)
+
+
+@dataclass(frozen=True)
+class EndpointStats:
+    requests: int
+    errors: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    connections: int | None
+    idle: int | None
+    max_connections: int | None
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    # Requests sent while every connection was busy, so they waited for a free one.
+    queued: int = 0
+    pool_timeouts: int = 0
+
+    @property
+    def saturation(self) -> float:
+        # Peak concurrent requests as a fraction of the pool; at or above 1.0 requests queue.
+        if not self.max_connections:
+            return 0.0
+        return self.peak_in_flight / self.max_connections
+
+
+@dataclass(frozen=True)
+class ClientStats:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    encode_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    network_seconds: float = 0.0
+    endpoints: Dict[str, EndpointStats] = field(default_factory=dict)
+    pool: PoolStats | None = None
+
+
+class Instrumentation:
+    """Base class for transport hooks; every method is a no-op to override as needed.
+
+    ``request_started`` and ``request_finished`` run once per attempt, so a retried call
+    reports every attempt. ``retry`` follows a finished attempt that will be retried after
+    ``delay`` seconds, and ``error`` one whose failure is raised to the caller. Hooks run
+    on the calling thread (or event loop) and should return quickly.
+    """
+
+    def request_started(self, method: str, endpoint: str, attempt: int) -> None:
+        pass
+
+    def request_finished(self, event: RequestEvent) -> None:
+        pass
+
+    def retry(self, event: RequestEvent, delay: float) -> None:
+        pass
+
+    def error(self, event: RequestEvent) -> None:
+        pass
+
+    def encoded(self, seconds: float, nbytes: int) -> None:
+        pass
+
+    def decoded(self, seconds: float, nbytes: int) -> None:
+        pass
+
+
+class _Fanout(Instrumentation):
+    def __init__(self, hooks: Sequence[Instrumentation]):
+        self.hooks = list(hooks)
+
+    def request_started(self, method: str, endpoint: str, attempt: int) -> None:
+        for hook in self.hooks:
+            hook.request_started(method, endpoint, attempt)
+
+    def request_finished(self, event: RequestEvent) -> None:
+        for hook in self.hooks:
+            hook.request_finished(event)
+
+    def retry(self, event: RequestEvent, delay: float) -> None:
+        for hook in self.hooks:
+            hook.retry(event, delay)
+
+    def error(self, event: RequestEvent) -> None:
+        for hook in self.hooks:
+            hook.error(event)
+
+    def encoded(self, seconds: float, nbytes: int) -> None:
+        for hook in self.hooks:
+            hook.encoded(seconds, nbytes)
+
+    def decoded(self, seconds: float, nbytes: int) -> None:
+        for hook in self.hooks:
+            hook.decoded(seconds, nbytes)
+
+
+def combine(hooks: Sequence[Instrumentation]) -> Instrumentation | None:
+    hooks = [hook for hook in hooks if hook is not None]
+    if not hooks:
+        return None
+    return hooks[0] if len(hooks) == 1 else _Fanout(hooks)
+
+
+def endpoint_name(method: str, path: str) -> str:
+    # "/v1/collections/ns/idx/data/exists/abc" -> "GET /v1/collections/{namespace}/{index}/data/exists/{id}"
+    parts = path.strip("/").split("/")
+    if len(parts) < 4 or parts[:2] != ["v1", "collections"]:
+        return f"{method} {path}"
+    rest = parts[4:]
+    if len(rest) >= 3 or (len(rest) == 2 and rest[0] == "data" and method != "POST"):
+        rest = rest[:-1] + ["{id}"]
+    return " ".join([method, "/".join(["/v1/collections/{namespace}/{index}", *rest]).rstrip("/")])
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        bucket = int(math.log(seconds / _BUCKET_FLOOR) / _LOG_GROWTH) if seconds > _BUCKET_FLOOR else 0
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * q / 100.0))
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return min(self.max, _BUCKET_FLOOR * _BUCKET_GROWTH ** (bucket + 1))
+        return self.max
+
+
+class Metrics(Instrumentation):
+    """Aggregates request events into counters and per-endpoint latency histograms."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms: Dict[str, LatencyHistogram] = {}
+            self._errors: Dict[str, int] = {}
+            self._requests = 0
+            self._failed = 0
+            self._retries = 0
+            self._bytes_sent = 0
+            self._bytes_received = 0
+            self._encode_seconds = 0.0
+            self._decode_seconds = 0.0
+            self._network_seconds = 0.0
+
+    def request_finished(self, event: RequestEvent) -> None:
+        with self._lock:
+            histogram = self._histograms.get(event.endpoint)
+            if histogram is None:
+                histogram = self._histograms[event.endpoint] = LatencyHistogram()
+            histogram.record(event.seconds)
+            self._requests += 1
+            self._bytes_sent += event.bytes_sent
+            self._bytes_received += event.bytes_received
+            self._network_seconds += event.seconds
+            if event.failed:
+                self._errors[event.endpoint] = self._errors.get(event.endpoint, 0) + 1
+
+    def retry(self, event: RequestEvent, delay: float) -> None:
+        with self._lock:
+            self._retries += 1
+
+    def error(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._failed += 1
+
+    def encoded(self, seconds: float, nbytes: int) -> None:
+        with self._lock:
+            self._encode_seconds += seconds
+
+    def decoded(self, seconds: float, nbytes: int) -> None:
+        with self._lock:
+            self._decode_seconds += seconds
+
+    def snapshot(self, pool: PoolStats | None = None) -> ClientStats:
+        with self._lock:
+            endpoints = {
+                name: EndpointStats(
+                    requests=histogram.count,
+                    errors=self._errors.get(name, 0),
+                    mean=histogram.total / histogram.count if histogram.count else 0.0,
+                    p50=histogram.percentile(50),
+                    p95=histogram.percentile(95),
+                    p99=histogram.percentile(99),
+                    max=histogram.max,
+                )
+                for name, histogram in sorted(self._histograms.items())
+            }
+            return ClientStats(
+                requests=self._requests,
+                errors=self._failed,
+                retries=self._retries,
+                bytes_sent=self._bytes_sent,
+                bytes_received=self._bytes_received,
+                encode_seconds=self._encode_seconds,
+                decode_seconds=self._decode_seconds,
+                network_seconds=self._network_seconds,
+                endpoints=endpoints,
+                pool=pool,
+            )
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Reports request events as OpenTelemetry metrics.
+
+    Records ``eigenlake.client.request.duration`` (seconds) per attempt with method,
+    endpoint and status attributes, plus counters for retries, errors and bytes.
+    ``meter`` defaults to the global meter provider's ``eigenlake`` meter.
+    """
+
+    def __init__(self, meter: Any = None):
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError as exc:  # pragma: no cover - depends on environment
+                raise ImportError(
+                    "OpenTelemetry support requires opentelemetry-api: pip install 'eigenlake[otel]'"
+                ) from exc
+            meter = metrics.get_meter("eigenlake")
+        self._duration = meter.create_histogram(
+            "eigenlake.client.request.duration", unit="s", description="Duration of each HTTP attempt"
+        )
+        self._retries = meter.create_counter("eigenlake.client.retries", description="Retried attempts")
+        self._errors = meter.create_counter("eigenlake.client.errors", description="Requests that raised")
+        self._bytes_sent = meter.create_counter("eigenlake.client.bytes_sent", unit="By")
+        self._bytes_received = meter.create_counter("eigenlake.client.bytes_received", unit="By")
+        self._encode = meter.create_histogram("eigenlake.client.encode.duration", unit="s")
+        self._decode = meter.create_histogram("eigenlake.client.decode.duration", unit="s")
+
+    @staticmethod
+    def _attributes(event: RequestEvent) -> Dict[str, Any]:
+        attributes: Dict[str, Any] = {"http.request.method": event.method, "eigenlake.endpoint": event.endpoint}
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        if event.error is not None:
+            attributes["error.type"] = type(event.error).__name__
+        return attributes
+
+    def request_finished(self, event: RequestEvent) -> None:
+        attributes = self._attributes(event)
+        self._duration.record(event.seconds, attributes)
+        self._bytes_sent.add(event.bytes_sent, attributes)
+        self._bytes_received.add(event.bytes_received, attributes)
+
+    def retry(self, event: RequestEvent, delay: float) -> None:
+        self._retries.add(1, self._attributes(event))
+
+    def error(self, event: RequestEvent) -> None:
+        self._errors.add(1, self._attributes(event))
+
+    def encoded(self, seconds: float, nbytes: int) -> None:
+        self._encode.record(seconds)
+
+    def decoded(self, seconds: float, nbytes: int) -> None:
+        self._decode.record(seconds)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Sequence
+
+from ._concurrency import bounded_map, chunked
+from ._vectors import Matrix, iter_rows
+from .client import (
+    _DEFAULT_CHUNK_BYTES,
+    AddManyResult,
+    FailedRecord,
+    IndexHandle,
+    _chunk_encoded,
+    _failed_records,
+    _validated,
+)
+
+EmbedFn = Callable[[List[str]], Matrix]
+
+
+@dataclass(frozen=True)
+class StageStats:
+    name: str
+    records: int
+    busy_seconds: float
+    in_flight: int
+    records_per_second: float
+
+
+@dataclass(frozen=True)
+class IngestStats:
+    elapsed: float
+    stages: Dict[str, StageStats]
+
+    @property
+    def records_per_second(self) -> float:
+        upload = self.stages.get("upload")
+        return upload.records_per_second if upload is not None else 0.0
+
+
+class IngestResult(AddManyResult):
+    def __init__(self, ids: Iterable[str], *, failed_records: List[FailedRecord] | None = None, stats: IngestStats):
+        super().__init__(ids, failed_records=failed_records)
+        self.stats = stats
+
+
+class _Stage:
+    def __init__(self, name: str, started: float):
+        self.name = name
+        self._started = started
+        self._lock = threading.Lock()
+        self._records = 0
+        self._busy = 0.0
+        self._in_flight = 0
+
+    def run(self, fn: Callable[[Any], Any], item: Any, records: int) -> Any:
+        with self._lock:
+            self._in_flight += 1
+        begun = time.perf_counter()
+        try:
+            return fn(item)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._busy += time.perf_counter() - begun
+                self._records += records
+
+    def snapshot(self) -> StageStats:
+        with self._lock:
+            elapsed = time.perf_counter() - self._started
+            return StageStats(
+                name=self.name,
+                records=self._records,
+                busy_seconds=self._busy,
+                in_flight=self._in_flight,
+                records_per_second=self._records / elapsed if elapsed > 0 else 0.0,
+            )
+
+
+def _embed(embed_fn: EmbedFn, texts: List[str]) -> List[Any]:
+    # Runs in the worker process; rows come back as whatever embed_fn returned (lists or ndarrays).
+    return list(iter_rows(embed_fn(texts)))
+
+
+def ingest(
+    handle: IndexHandle,
+    source: Iterable[Dict[str, Any]],
+    embed_fn: EmbedFn,
+    *,
+    text_key: str = "text",
+    processes: int | None = None,
+    embed_batch_size: int = 64,
+    serialize_threads: int = 2,
+    upload_concurrency: int = 4,
+    chunk_size: int = 500,
+    chunk_bytes: int = _DEFAULT_CHUNK_BYTES,
+    queue_size: int | None = None,
+    on_duplicate: Literal["error", "replace", "skip"] = "error",
+    on_progress: Callable[[IngestStats], None] | None = None,
+    executor: Executor | None = None,
+) -> IngestResult:
+    """Embeds and uploads ``source`` records in three overlapping stages.
+
+    Each record is a dict with ``text_key`` (passed to ``embed_fn`` in batches of
+    ``embed_batch_size``), optional ``id`` and optional ``properties``. Embedding runs
+    in a process pool of ``processes`` workers (``0`` embeds on threads instead), so
+    ``embed_fn`` must be picklable. Encoding runs on ``serialize_threads`` threads and
+    ``insert-many`` uploads on ``upload_concurrency`` threads sharing the client's
+    connection pool. Every stage holds at most ``queue_size`` batches in flight.
+    """
+    started = time.perf_counter()
+    stages = {name: _Stage(name, started) for name in ("embed", "serialize", "upload")}
+    failed: List[FailedRecord] = []
+    uuids: List[str] = []
+    fields = {"on_duplicate": on_duplicate, "on_error": "continue"}
+    transport = handle._t
+
+    def stats() -> IngestStats:
+        return IngestStats(
+            elapsed=time.perf_counter() - started,
+            stages={name: stage.snapshot() for name, stage in stages.items()},
+        )
+
+    processes = (os.cpu_count() or 1) if processes is None else max(0, int(processes))
+    pool = executor
+    if pool is None and processes > 0:
+        pool = ProcessPoolExecutor(max_workers=processes)
+
+    def embed(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        texts = [record[text_key] for record in batch]
+        if pool is not None:
+            vectors = pool.submit(_embed, embed_fn, texts).result()
+        else:
+            vectors = _embed(embed_fn, texts)
+        if len(vectors) != len(batch):
+            raise ValueError(f"embed_fn returned {len(vectors)} vectors for {len(batch)} texts")
+        return [
+            {"id": record.get("id"), "properties": record.get("properties") or {}, "vector": vector}
+            for record, vector in zip(batch, vectors)
+        ]
+
+    def serialize(records: List[Dict[str, Any]]) -> List[bytes]:
+        valid = _validated(records, handle._validator, failed)
+        return [transport.encode_record(record) for record in valid]
+
+    def upload(parts: List[bytes]) -> Dict[str, Any]:
+        return handle.records._insert_encoded(parts, fields)
+
+    embed_depth = max(1, processes) * 2 if queue_size is None else max(1, int(queue_size))
+    serialize_depth = max(1, int(serialize_threads)) if queue_size is None else max(1, int(queue_size))
+    upload_depth = max(1, int(upload_concurrency))
+
+    batches: Iterator[List[Dict[str, Any]]] = chunked(source, embed_batch_size)
+    embedded = bounded_map(
+        lambda batch: stages["embed"].run(embed, batch, len(batch)),
+        batches,
+        concurrency=embed_depth,
+        thread_name_prefix="eigenlake-embed",
+    )
+    encoded = bounded_map(
+        lambda records: stages["serialize"].run(serialize, records, len(records)),
+        embedded,
+        concurrency=serialize_depth,
+        thread_name_prefix="eigenlake-serialize",
+    )
+    parts: Iterator[bytes] = (part for batch in encoded for part in batch)
+    chunks: Iterator[Sequence[bytes]] = _chunk_encoded(parts, chunk_size=chunk_size, chunk_bytes=chunk_bytes)
+    try:
+        for resp in bounded_map(
+            lambda chunk: stages["upload"].run(upload, chunk, len(chunk)),
+            chunks,
+            concurrency=upload_depth,
+            thread_name_prefix="eigenlake-upload",
+        ):
+            uuids.extend(resp.get("uuids") or [])
+            failed.extend(_failed_records(resp))
+            if on_progress is not None:
+                on_progress(stats())
+    finally:
+        if pool is not None and executor is None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        handle._invalidate()
+    return IngestResult(uuids, failed_records=failed, stats=stats())
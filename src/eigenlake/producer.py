@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import contextvars
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Literal, Set
+from uuid import uuid4
+
+from ._vectors import Vector
+from .errors import APIError, ValidationError
+
+if TYPE_CHECKING:
+    from .client import IndexHandle
+
+DEFAULT_BATCH_BYTES = 4 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ProducerStats:
+    batches: int
+    records: int
+    failed: int
+    queued: int
+    in_flight: int
+
+
+@dataclass
+class _Pending:
+    id: str
+    body: bytes
+    future: Future
+    enqueued_at: float
+    # Context of the add() call; the batch is sent in its first record's context.
+    context: contextvars.Context
+
+
+class BatchProducer:
+    """Thread-safe producer that coalesces ``add()`` calls into ``insert-many`` requests.
+
+    A batch is sent once it holds ``batch_size`` records or ``batch_bytes`` of encoded
+    JSON, or ``linger`` seconds after its first record was queued, whichever comes
+    first. ``add()`` returns a future that resolves to the record id, or fails with the
+    error the server reported for that record. At most ``max_queue`` records wait to be
+    sent; past that ``add()`` blocks, and raises ``queue.Full`` if ``timeout`` expires.
+    """
+
+    def __init__(
+        self,
+        handle: "IndexHandle",
+        *,
+        batch_size: int = 500,
+        batch_bytes: int = DEFAULT_BATCH_BYTES,
+        linger: float = 0.005,
+        max_queue: int = 10_000,
+        max_in_flight: int = 4,
+        on_duplicate: Literal["error", "replace", "skip"] = "error",
+    ):
+        self._h = handle
+        self._batch_size = max(1, int(batch_size))
+        self._batch_bytes = max(1, int(batch_bytes))
+        self._linger = max(0.0, float(linger))
+        self._max_queue = max(1, int(max_queue))
+        self._fields = {"on_duplicate": on_duplicate, "on_error": "continue"}
+
+        self._queue: Deque[_Pending] = deque()
+        self._queued_bytes = 0
+        self._pending: Set[Future] = set()
+        self._cond = threading.Condition()
+        self._flushing = 0
+        self._closed = False
+        self._batches = 0
+        self._records = 0
+        self._failed = 0
+        self._in_flight = 0
+
+        max_in_flight = max(1, int(max_in_flight))
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="eigenlake-producer")
+        self._sender = threading.Thread(target=self._run, name="eigenlake-producer-sender", daemon=True)
+        self._sender.start()
+
+    def __enter__(self) -> "BatchProducer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+    def add(
+        self,
+        *,
+        properties: Dict[str, Any],
+        vector: Vector,
+        id: str | None = None,
+        timeout: float | None = None,
+    ) -> "Future[str]":
+        out_id = str(id) if id is not None else str(uuid4())
+        future: Future = Future()
+        validator = self._h._validator
+        error = validator.validate(properties, vector) if validator is not None else None
+        if error is not None:
+            future.set_exception(ValidationError(f"record {out_id}: {error}"))
+            return future
+
+        # Encoding happens on the calling thread so the sender only concatenates bytes.
+        body = self._h._t.encode_record({"id": out_id, "properties": properties, "vector": vector})
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while len(self._queue) >= self._max_queue and not self._closed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Full(f"producer queue is full ({self._max_queue} records)")
+                self._cond.wait(remaining)
+            if self._closed:
+                raise RuntimeError("producer is closed")
+            self._queue.append(_Pending(out_id, body, future, time.monotonic(), contextvars.copy_context()))
+            self._queued_bytes += len(body) + 1
+            self._pending.add(future)
+            self._cond.notify_all()
+        future.add_done_callback(self._discard)
+        return future
+
+    def flush(self, timeout: float | None = None) -> bool:
+        # Sends everything queued so far without waiting for linger; returns False on timeout.
+        with self._cond:
+            snapshot = list(self._pending)
+            self._flushing += 1
+            self._cond.notify_all()
+        try:
+            _, not_done = wait(snapshot, timeout=timeout)
+            return not not_done
+        finally:
+            with self._cond:
+                self._flushing -= 1
+
+    def close(self, timeout: float | None = None) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._sender.join(timeout)
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> ProducerStats:
+        with self._cond:
+            return ProducerStats(
+                batches=self._batches,
+                records=self._records,
+                failed=self._failed,
+                queued=len(self._queue),
+                in_flight=self._in_flight,
+            )
+
+    def _discard(self, future: Future) -> None:
+        with self._cond:
+            self._pending.discard(future)
+
+    def _ready(self) -> bool:
+        return (
+            self._closed
+            or self._flushing > 0
+            or len(self._queue) >= self._batch_size
+            or self._queued_bytes >= self._batch_bytes
+        )
+
+    def _take(self) -> List[_Pending]:
+        batch: List[_Pending] = []
+        size = 0
+        while self._queue and len(batch) < self._batch_size:
+            item = self._queue[0]
+            if batch and size + len(item.body) > self._batch_bytes:
+                break
+            self._queue.popleft()
+            self._queued_bytes -= len(item.body) + 1
+            # A future cancelled by the caller is dropped; the rest can no longer be cancelled.
+            if not item.future.set_running_or_notify_cancel():
+                continue
+            size += len(item.body) + 1
+            batch.append(item)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                deadline = self._queue[0].enqueued_at + self._linger
+                while not self._ready():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._take()
+                if batch:
+                    self._in_flight += 1
+                # Wakes producers blocked on a full queue.
+                self._cond.notify_all()
+            if not batch:
+                continue
+
+            self._slots.acquire()
+            try:
+                future = self._executor.submit(batch[0].context.run, self._send, batch)
+                future.add_done_callback(lambda _: self._slots.release())
+            except BaseException as exc:
+                self._slots.release()
+                self._settle(batch, error=exc)
+
+    def _send(self, batch: List[_Pending]) -> None:
+        try:
+            resp = self._h.records._insert_encoded([item.body for item in batch], self._fields)
+        except BaseException as exc:
+            self._settle(batch, error=exc)
+        else:
+            failed = {
+                str(item.get("uuid") or ""): str(item.get("error") or "") for item in resp.get("failed_objects") or []
+            }
+            self._settle(batch, failed=failed)
+        finally:
+            self._h._invalidate()
+
+    def _settle(
+        self,
+        batch: List[_Pending],
+        *,
+        error: BaseException | None = None,
+        failed: Dict[str, str] | None = None,
+    ) -> None:
+        failures = 0
+        for item in batch:
+            if error is not None:
+                item.future.set_exception(error)
+                failures += 1
+            elif failed and item.id in failed:
+                item.future.set_exception(APIError(f"record {item.id}: {failed[item.id]}"))
+                failures += 1
+            else:
+                item.future.set_result(item.id)
+        with self._cond:
+            self._in_flight -= 1
+            self._batches += 1
+            self._records += len(batch)
+            self._failed += failures
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import contextlib
+import random
+import threading
+import time
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterable, Iterator, Literal
+
+import httpx
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# PATCH merges properties here, so replaying it is harmless.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "PATCH"})
+
+# POST endpoints that only read, or write the same end state however often they run.
+IDEMPOTENT_POSTS = frozenset(
+    {
+        "/v1/collections/get-or-create",
+        "/data/get-by-id",
+        "/data/get-by-filter",
+        "/data/get-many",
+        "/data/exists-many",
+        "/data/update-many",
+        "/data/replace-many",
+        "/data/delete-by-ids",
+        "/query/near-vector",
+        "/query/near-vector-batch",
+    }
+)
+
+# Failures raised before the request left the client; safe to retry for any method.
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+_deadline: ContextVar[float | None] = ContextVar("eigenlake_deadline", default=None)
+
+BreakerState = Literal["closed", "open", "half-open"]
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Bounds every request made inside the block, retries and backoff included.
+
+    Applies to the current thread or asyncio task. Nested deadlines keep the earlier
+    one. Once it passes, requests raise ``DeadlineExceededError`` and no retry starts
+    that could not finish in time.
+    """
+    at = time.monotonic() + max(0.0, float(seconds))
+    current = _deadline.get()
+    token = _deadline.set(at if current is None else min(current, at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    at = _deadline.get()
+    return None if at is None else at - time.monotonic()
+
+
+def retry_after(resp: httpx.Response) -> float | None:
+    value = (resp.headers.get("Retry-After") or "").strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryBudget:
+    """Client-wide token bucket that caps retries at a fraction of request volume.
+
+    Every request deposits ``ratio`` tokens and every retry spends one, so in steady
+    state at most ``ratio`` extra load is added. ``min_per_second`` tokens are added
+    over time so a quiet client can still retry. The bucket holds at most ``burst``.
+    """
+
+    def __init__(
+        self,
+        *,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        burst: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ratio = max(0.0, float(ratio))
+        self.min_per_second = max(0.0, float(min_per_second))
+        self.burst = max(1.0, float(burst))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+
+class CircuitBreaker:
+    """Fails requests fast after ``failure_threshold`` consecutive server-side failures.
+
+    While open, requests raise ``CircuitOpenError`` without touching the network. After
+    ``reset_timeout`` seconds, up to ``half_open_requests`` trial requests go through.
+    A success closes the circuit, and a failure opens it again.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 10.0,
+        half_open_requests: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = max(0.0, float(reset_timeout))
+        self.half_open_requests = max(1, int(half_open_requests))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: BreakerState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            if self._state == "open" and self._clock() - self._opened_at >= self.reset_timeout:
+                return "half-open"
+            return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == "open":
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = "half-open"
+                self._trials = 0
+            if self._state == "half-open":
+                if self._trials >= self.half_open_requests:
+                    return False
+                self._trials += 1
+            return True
+
+    def release_trial(self) -> None:
+        # Hands back a half-open slot taken by an attempt that ended without an outcome.
+        with self._lock:
+            if self._state == "half-open" and self._trials > 0:
+                self._trials -= 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == "half-open" or self._failures >= self.failure_threshold:
+                self._state = "open"
+                self._opened_at = self._clock()
+                self._failures = 0
+
+
+class RetryPolicy:
+    """Decides whether and when a failed attempt is retried.
+
+    Delays use decorrelated jitter between ``base_delay`` and ``max_delay``, so clients
+    that failed together do not retry together. A ``Retry-After`` header on 429 or 503
+    replaces the computed delay, and a hint longer than ``max_retry_after`` ends the
+    retries. Idempotent requests (``IDEMPOTENT_METHODS``, ``IDEMPOTENT_POSTS`` and
+    ``idempotent_endpoints`` suffixes) retry on ``retry_statuses`` and network errors.
+    Other requests retry only on 429 or when the connection was never established.
+    ``budget`` and ``breaker`` are shared by every request that uses the policy.
+    """
+
+    def __init__(
+        self,
+        *,
+        retries: int = 2,
+        base_delay: float = 0.1,
+        max_delay: float = 10.0,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        max_retry_after: float = 60.0,
+        idempotent_endpoints: Iterable[str] = (),
+        budget: RetryBudget | None = None,
+        breaker: CircuitBreaker | None = None,
+        seed: int | None = None,
+    ):
+        self.retries = max(0, int(retries))
+        self.base_delay = max(0.0, float(base_delay))
+        self.max_delay = max(self.base_delay, float(max_delay))
+        self.retry_statuses = frozenset(int(status) for status in retry_statuses)
+        self.max_retry_after = float(max_retry_after)
+        self._idempotent_posts = IDEMPOTENT_POSTS | {"/" + suffix.strip("/") for suffix in idempotent_endpoints}
+        self.budget = budget
+        self.breaker = breaker
+        self._random = random.Random(seed)
+
+    def is_idempotent(self, method: str, endpoint: str) -> bool:
+        if method in IDEMPOTENT_METHODS:
+            return True
+        return method == "POST" and endpoint.endswith(tuple(self._idempotent_posts))
+
+    def backoff(self, previous: float) -> float:
+        # Decorrelated jitter: uniform between the base and three times the previous delay.
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, self._random.uniform(self.base_delay, upper))
+
+    def started(self) -> None:
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def allow(self) -> bool:
+        return self.breaker is None or self.breaker.allow()
+
+    def release(self) -> None:
+        if self.breaker is not None:
+            self.breaker.release_trial()
+
+    def record(self, *, status: int | None = None, error: BaseException | None = None) -> None:
+        if self.breaker is None:
+            return
+        if error is not None or (status is not None and status >= 500):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+    def delay(
+        self,
+        attempt: int,
+        method: str,
+        endpoint: str,
+        previous: float,
+        *,
+        resp: httpx.Response | None = None,
+        error: BaseException | None = None,
+    ) -> float | None:
+        # Seconds to wait before the next attempt, or None to stop and surface this outcome.
+        if attempt >= self.retries:
+            return None
+        status = resp.status_code if resp is not None else None
+        if status is not None and status not in self.retry_statuses:
+            return None
+        if not self.is_idempotent(method, endpoint) and status != 429 and not isinstance(error, _NOT_SENT):
+            return None
+
+        wait = self.backoff(previous)
+        if resp is not None and status in (429, 503):
+            hinted = retry_after(resp)
+            if hinted is not None:
+                if hinted > self.max_retry_after:
+                    return None
+                wait = hinted
+        left = remaining()
+        if left is not None and wait >= left:
+            return None
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+        return wait
+
+
+def clip_timeout(timeout: httpx.Timeout | float | None, left: float) -> httpx.Timeout:
+    def clip(value: float | None) -> float:
+        return left if value is None else min(value, left)
+
+    timeout = timeout if isinstance(timeout, httpx.Timeout) else httpx.Timeout(timeout)
+
+    return httpx.Timeout(
+        connect=clip(timeout.connect), read=clip(timeout.read), write=clip(timeout.write), pool=clip(timeout.pool)
+    )
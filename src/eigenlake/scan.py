@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import base64
+import contextvars
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List
+
+
+@dataclass
+class ScanStats:
+    pages: int = 0
+    objects: int = 0
+    fetch_seconds: float = 0.0
+    in_flight: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def objects_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.objects / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.pages / elapsed if elapsed > 0 else 0.0
+
+
+class OffsetScan(Iterator[Dict[str, Any]]):
+    """Iterator over ``query/objects`` pages returned by ``IndexSearch.iterate``.
+
+    With ``prefetch=0`` and ``parallel=1`` pages are fetched one at a time and the
+    server's ``next_offset`` is followed. Otherwise the first page sets the stride (its
+    ``next_offset``, which is below ``page_size`` when the server caps ``limit``) and up
+    to ``parallel * (prefetch + 1)`` pages at offsets ``n * stride`` are in flight while
+    earlier pages are consumed; a short page is completed with sequential requests.
+    ``ordered=False`` yields each page as soon as it arrives.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], Dict[str, Any]],
+        *,
+        page_size: int,
+        prefetch: int = 0,
+        parallel: int = 1,
+        ordered: bool = True,
+    ):
+        self._fetch_page = fetch
+        self._page_size = max(1, int(page_size))
+        self._window = max(1, int(parallel)) * (max(0, int(prefetch)) + 1)
+        self._ordered = ordered
+        self._lock = threading.Lock()
+        self.stats = ScanStats()
+        self._objects = self._sequential() if self._window == 1 else self._windowed()
+
+    def __iter__(self) -> "OffsetScan":
+        return self
+
+    def __next__(self) -> Dict[str, Any]:
+        return next(self._objects)
+
+    def __enter__(self) -> "OffsetScan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+    def close(self) -> None:
+        self._objects.close()
+
+    def _fetch(self, offset: int) -> Dict[str, Any]:
+        with self._lock:
+            self.stats.in_flight += 1
+        started = time.perf_counter()
+        try:
+            return self._fetch_page(offset)
+        finally:
+            with self._lock:
+                self.stats.in_flight -= 1
+                self.stats.fetch_seconds += time.perf_counter() - started
+
+    def _consume(self, page: Dict[str, Any]) -> List[Dict[str, Any]]:
+        objects = page.get("objects") or []
+        with self._lock:
+            self.stats.pages += 1
+            self.stats.objects += len(objects)
+        return objects
+
+    def _sequential(self) -> Iterator[Dict[str, Any]]:
+        offset = 0
+        while True:
+            page = self._fetch(offset)
+            objects = self._consume(page)
+            if not objects:
+                return
+            yield from objects
+            offset = _advance(offset, page, objects)
+
+    def _windowed(self) -> Iterator[Dict[str, Any]]:
+        # The first page fixes the stride: a server that caps ``limit`` returns fewer than
+        # page_size objects, and windowed offsets must step by what it actually returns.
+        page = self._fetch(0)
+        objects = self._consume(page)
+        if not objects:
+            return
+        stride = _advance(0, page, objects)
+        if stride <= 0:
+            yield from objects
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self._window, thread_name_prefix="eigenlake-scan")
+        pending: Dict[int, Future] = {}
+        next_page = 1
+        end_page: int | None = None
+
+        def schedule() -> None:
+            nonlocal next_page
+            while len(pending) < self._window and (end_page is None or next_page < end_page):
+                offset = next_page * stride
+                pending[next_page] = executor.submit(contextvars.copy_context().run, self._fetch, offset)
+                next_page += 1
+
+        def mark_end(page_index: int) -> None:
+            # Nothing lies past an empty page: drop everything scheduled after it.
+            nonlocal end_page
+            end_page = page_index + 1 if end_page is None else min(end_page, page_index + 1)
+            for index in [index for index in pending if index >= end_page]:
+                pending.pop(index).cancel()
+
+        def take(index: int, page: Dict[str, Any]) -> List[Dict[str, Any]]:
+            objects, ended = self._fill(index * stride, stride, page)
+            if ended:
+                mark_end(index)
+            return objects
+
+        try:
+            schedule()
+            yield from objects
+            if self._ordered:
+                current = 1
+                while current in pending:
+                    objects = take(current, pending.pop(current).result())
+                    yield from objects
+                    current += 1
+                    schedule()
+            else:
+                while pending:
+                    done, _ = wait(list(pending.values()), return_when=FIRST_COMPLETED)
+                    for index in sorted(index for index, future in pending.items() if future in done):
+                        future = pending.pop(index, None)
+                        if future is None:
+                            continue
+                        yield from take(index, future.result())
+                    schedule()
+        finally:
+            for future in pending.values():
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fill(self, offset: int, stride: int, page: Dict[str, Any]) -> tuple[List[Dict[str, Any]], bool]:
+        # Objects in [offset, offset + stride), fetching the rest sequentially when the page
+        # came back short. The flag is set once the scan has no objects past this window.
+        limit = offset + stride
+        objects: List[Dict[str, Any]] = []
+        while True:
+            found = self._consume(page)
+            if not found:
+                return objects, True
+            objects.extend(found[: limit - offset])
+            advanced = _advance(offset, page, found)
+            if advanced <= offset:
+                return objects, True
+            if advanced >= limit:
+                return objects, False
+            offset = advanced
+            page = self._fetch(offset)
+
+
+def _advance(offset: int, page: Dict[str, Any], objects: List[Dict[str, Any]]) -> int:
+    return int(page.get("next_offset") or offset + len(objects))
+
+
+class CursorScan(Iterator[Dict[str, Any]]):
+    """Iterator over ``data/get-by-filter`` pages returned by ``IndexRecords.scan``.
+
+    Follows the keyset ``after`` cursor (the last object's id), requesting the next
+    page as soon as the current one arrives, and stops on an empty page or an explicit
+    ``next_after: null``. ``checkpoint()`` returns a token naming the last object
+    yielded; passing it back as ``checkpoint=`` resumes right after that object.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str | None], Dict[str, Any]],
+        *,
+        filter: Dict[str, Any] | None,
+        page_size: int,
+        checkpoint: str | None = None,
+        pipeline: bool = True,
+    ):
+        self._fetch_page = fetch
+        self._page_size = max(1, int(page_size))
+        self._filter_key = _filter_key(filter)
+        self._pipeline = pipeline
+        self._lock = threading.Lock()
+        self.stats = ScanStats()
+
+        self._after: str | None = None
+        if checkpoint is not None:
+            state = decode_checkpoint(checkpoint)
+            if state.get("filter") != self._filter_key:
+                raise ValueError("checkpoint was taken for a different filter")
+            self._after = state.get("after")
+            self.stats.objects = int(state.get("objects") or 0)
+        self._objects = self._scan()
+
+    def __iter__(self) -> "CursorScan":
+        return self
+
+    def __next__(self) -> Dict[str, Any]:
+        return next(self._objects)
+
+    def __enter__(self) -> "CursorScan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+    def close(self) -> None:
+        self._objects.close()
+
+    def checkpoint(self) -> str:
+        return encode_checkpoint({"after": self._after, "filter": self._filter_key, "objects": self.stats.objects})
+
+    def _fetch(self, after: str | None) -> Dict[str, Any]:
+        with self._lock:
+            self.stats.in_flight += 1
+        started = time.perf_counter()
+        try:
+            return self._fetch_page(after)
+        finally:
+            with self._lock:
+                self.stats.in_flight -= 1
+                self.stats.fetch_seconds += time.perf_counter() - started
+
+    def _next_cursor(self, page: Dict[str, Any], objects: List[Dict[str, Any]]) -> str | None:
+        # The cursor is always the last object's id, so a checkpoint taken mid-page resumes the same
+        # way as one taken at a page boundary. A short page is not the end: the server may cap limit.
+        if not objects or ("next_after" in page and page["next_after"] is None):
+            return None
+        return _object_id(objects[-1])
+
+    def _scan(self) -> Iterator[Dict[str, Any]]:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eigenlake-scan") if self._pipeline else None
+        try:
+            page = self._fetch(self._after)
+            while True:
+                objects = page.get("objects") or []
+                self.stats.pages += 1
+                cursor = self._next_cursor(page, objects) if objects else None
+                upcoming = None
+                if executor is not None and cursor:
+                    upcoming = executor.submit(contextvars.copy_context().run, self._fetch, cursor)
+                for obj in objects:
+                    self._after = _object_id(obj) or self._after
+                    self.stats.objects += 1
+                    yield obj
+                if not cursor:
+                    return
+                page = upcoming.result() if upcoming is not None else self._fetch(cursor)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _object_id(obj: Dict[str, Any]) -> str | None:
+    value = obj.get("uuid", obj.get("id"))
+    return None if value is None else str(value)
+
+
+def _filter_key(filter: Dict[str, Any] | None) -> str:
+    canonical = json.dumps(filter or {}, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_checkpoint(state: Dict[str, Any]) -> str:
+    raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_checkpoint(token: str) -> Dict[str, Any]:
+    try:
+        state = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError("invalid scan checkpoint") from exc
+    if not isinstance(state, dict):
+        raise ValueError("invalid scan checkpoint")
+    return state
@@ -0,0 +1,425 @@
+from __future__ import annotations
+
+import base64
+import collections
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Tuple
+from uuid import uuid4
+
+from ._concurrency import bounded_map, chunked
+from ._vectors import Vector, VectorCodec
+from .client import FailedRecord, IndexHandle, _failed_records
+from .errors import (
+    AuthenticationError,
+    EigenlakeError,
+    NetworkError,
+    NotFoundError,
+    PayloadTooLargeError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+)
+
+_MAGIC = b"ELSPOOL1"
+_LENGTH = struct.Struct("<I")
+_ID_LENGTH = struct.Struct("<H")
+_NO_VECTOR = 0xFFFFFFFF
+_FLOAT32 = VectorCodec("float32")
+_FATAL = (AuthenticationError, NotFoundError)
+_TRANSIENT = (NetworkError, RateLimitError, ServerError)
+
+
+@dataclass(frozen=True)
+class SpoolStats:
+    segments: int
+    depth_records: int
+    depth_bytes: int
+    appended: int
+    uploaded: int
+    failed: int
+    drain_rate: float
+    last_error: str | None
+
+
+@dataclass(frozen=True)
+class _Frame:
+    id: str
+    properties: bytes
+    vector: bytes | None
+
+
+def _frame(id: str, properties: bytes, vector: bytes | None) -> bytes:
+    # <len><id_len><id><props_len><props><dims><float32 vector><crc32 of everything after len>
+    raw_id = id.encode("utf-8")
+    body = b"".join(
+        (
+            _ID_LENGTH.pack(len(raw_id)),
+            raw_id,
+            _LENGTH.pack(len(properties)),
+            properties,
+            _LENGTH.pack(_NO_VECTOR if vector is None else len(vector) // 4),
+            vector or b"",
+        )
+    )
+    return _LENGTH.pack(len(body)) + body + _LENGTH.pack(zlib.crc32(body))
+
+
+def _size(path: Path) -> int:
+    # The uploader unlinks finished segments without holding the lock.
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _read_frames(data: Any, start: int = len(_MAGIC)) -> Iterator[Tuple[int, _Frame]]:
+    # Yields (end offset, frame); stops at the first torn or corrupt frame.
+    view = memoryview(data)
+    try:
+        yield from _parse_frames(view, start)
+    finally:
+        view.release()
+
+
+def _parse_frames(view: memoryview, offset: int) -> Iterator[Tuple[int, _Frame]]:
+    while offset + _LENGTH.size <= len(view):
+        (length,) = _LENGTH.unpack_from(view, offset)
+        end = offset + _LENGTH.size + length + _LENGTH.size
+        if end > len(view):
+            return
+        body = view[offset + _LENGTH.size : end - _LENGTH.size]
+        if zlib.crc32(body) != _LENGTH.unpack_from(view, end - _LENGTH.size)[0]:
+            return
+        (id_length,) = _ID_LENGTH.unpack_from(body, 0)
+        position = _ID_LENGTH.size
+        id = bytes(body[position : position + id_length]).decode("utf-8")
+        position += id_length
+        (props_length,) = _LENGTH.unpack_from(body, position)
+        position += _LENGTH.size
+        properties = bytes(body[position : position + props_length])
+        position += props_length
+        (dims,) = _LENGTH.unpack_from(body, position)
+        position += _LENGTH.size
+        vector = None if dims == _NO_VECTOR else bytes(body[position : position + dims * 4])
+        del body
+        yield end, _Frame(id, properties, vector)
+        offset = end
+
+
+class Spool:
+    """Disk-backed write-ahead spool for ``IndexBatch.spooled``.
+
+    ``add()`` appends a CRC-framed record (JSON properties, raw float32 vector) to the
+    open segment file and returns immediately. Segments are sealed when they reach
+    ``segment_records`` / ``segment_bytes`` or ``max_segment_age`` seconds, and a
+    background thread uploads sealed segments with ``insert-many``, recording progress
+    in an ``.ack`` file. On start, segments left by a previous process are replayed
+    from their last acknowledged record; ``on_duplicate="replace"`` keeps that replay
+    idempotent. Network errors, 429 and 5xx are retried until the server is back; records
+    the server rejects for good end up in ``failed_records``. ``close()`` (and leaving the
+    ``with`` block) waits at most ``timeout`` seconds, 30 by default, for the upload to drain.
+    """
+
+    def __init__(
+        self,
+        handle: IndexHandle,
+        directory: str | os.PathLike[str],
+        *,
+        segment_records: int = 10_000,
+        segment_bytes: int = 64 * 1024 * 1024,
+        max_segment_age: float = 1.0,
+        batch_size: int = 500,
+        concurrency: int = 2,
+        fsync: bool = False,
+        on_duplicate: str = "replace",
+    ):
+        self._h = handle
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segment_records = max(1, int(segment_records))
+        self._segment_bytes = max(1, int(segment_bytes))
+        self._max_segment_age = max(0.0, float(max_segment_age))
+        self._batch_size = max(1, int(batch_size))
+        self._concurrency = max(1, int(concurrency))
+        self._fsync = fsync
+        self._fields = {"on_duplicate": on_duplicate, "on_error": "continue"}
+
+        self.failed_records: List[FailedRecord] = []
+        self._cond = threading.Condition()
+        self._closing = False
+        self._error: BaseException | None = None
+        self._last_error: str | None = None
+        self._appended = 0
+        self._uploaded = 0
+        self._failed = 0
+        self._depth = 0
+        self._drained: Deque[Tuple[float, int]] = collections.deque()
+
+        self._file: Any = None
+        self._file_path: Path | None = None
+        self._file_records = 0
+        self._file_bytes = 0
+        self._file_opened_at = 0.0
+        self._next_segment = self._recover()
+
+        self._uploader = threading.Thread(target=self._run, name="eigenlake-spool", daemon=True)
+        self._uploader.start()
+
+    def __enter__(self) -> "Spool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+    def add(self, *, properties: Dict[str, Any], vector: Vector, id: str | None = None) -> str:
+        out_id = str(id) if id is not None else str(uuid4())
+        validator = self._h._validator
+        error = validator.validate(properties, vector) if validator is not None else None
+        if error is not None:
+            raise ValidationError(f"record {out_id}: {error}")
+        frame = _frame(
+            out_id,
+            self._h._t.codec.dumps(properties or {}),
+            _FLOAT32.to_bytes(vector) if vector is not None else None,
+        )
+        with self._cond:
+            self._raise_pending_error()
+            if self._closing:
+                raise RuntimeError("spool is closed")
+            if self._file is None:
+                self._open_segment()
+            self._file.write(frame)
+            # Reaches the OS page cache on every add, so a process crash loses nothing.
+            self._file.flush()
+            self._file_records += 1
+            self._file_bytes += len(frame)
+            self._appended += 1
+            self._depth += 1
+            if self._file_records >= self._segment_records or self._file_bytes >= self._segment_bytes:
+                self._seal()
+        return out_id
+
+    def flush(self) -> None:
+        # Seals the open segment so it is uploaded without waiting for max_segment_age.
+        with self._cond:
+            self._seal()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._seal()
+            while self._depth > 0 and self._error is None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            self._raise_pending_error()
+        return True
+
+    def close(self, *, drain: bool = True, timeout: float | None = 30.0) -> None:
+        # Retries never give up while the server is down, so the drain is bounded by default;
+        # whatever is left stays on disk and is replayed by the next spool on this directory.
+        try:
+            if drain:
+                self.drain(timeout)
+        finally:
+            with self._cond:
+                self._seal()
+                self._closing = True
+                self._cond.notify_all()
+            self._uploader.join()
+
+    def stats(self) -> SpoolStats:
+        with self._cond:
+            now = time.monotonic()
+            while self._drained and now - self._drained[0][0] > 10.0:
+                self._drained.popleft()
+            window = now - self._drained[0][0] if self._drained else 0.0
+            drained = sum(count for _, count in self._drained)
+            segments = self._segments(".ready") + ([self._file_path] if self._file_path is not None else [])
+            return SpoolStats(
+                segments=len(segments),
+                depth_records=self._depth,
+                depth_bytes=sum(_size(path) for path in segments),
+                appended=self._appended,
+                uploaded=self._uploaded,
+                failed=self._failed,
+                drain_rate=drained / window if window > 0 else 0.0,
+                last_error=self._last_error,
+            )
+
+    # Segment files
+
+    def _segments(self, suffix: str) -> List[Path]:
+        return sorted(self.directory.glob(f"*{suffix}"))
+
+    @staticmethod
+    def _acked(segment: Path) -> int:
+        ack = segment.with_suffix(".ack")
+        try:
+            return int(ack.read_text() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _recover(self) -> int:
+        # Seals segments left open by a crashed process, dropping any torn final frame.
+        last = 0
+        for path in self._segments(".open"):
+            data = path.read_bytes()
+            if not data.startswith(_MAGIC):
+                path.unlink()
+                continue
+            end = len(_MAGIC)
+            for end, _ in _read_frames(data):
+                pass
+            with open(path, "r+b") as handle:
+                handle.truncate(end)
+            path.rename(path.with_suffix(".ready"))
+        for path in self._segments(".ready"):
+            last = max(last, int(path.stem))
+            self._depth += sum(1 for _ in _read_frames(path.read_bytes())) - self._acked(path)
+        return last + 1
+
+    def _open_segment(self) -> None:
+        self._file_path = self.directory / f"{self._next_segment:012d}.open"
+        self._next_segment += 1
+        self._file = open(self._file_path, "wb")
+        self._file.write(_MAGIC)
+        self._file_records = 0
+        self._file_bytes = len(_MAGIC)
+        self._file_opened_at = time.monotonic()
+
+    def _seal(self) -> None:
+        if self._file is None:
+            return
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+        self._file.close()
+        self._file_path.rename(self._file_path.with_suffix(".ready"))
+        self._file = None
+        self._file_path = None
+        self._cond.notify_all()
+
+    # Uploader
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                ready = self._segments(".ready")
+                while not ready and not self._closing:
+                    if self._file is not None and time.monotonic() - self._file_opened_at >= self._max_segment_age:
+                        self._seal()
+                    else:
+                        self._cond.wait(self._max_segment_age or 0.05)
+                    ready = self._segments(".ready")
+                if not ready:
+                    return
+            try:
+                self._upload_segment(ready[0])
+            except BaseException as exc:
+                with self._cond:
+                    self._error = exc
+                    self._last_error = str(exc)
+                    self._cond.notify_all()
+                return
+
+    def _upload_segment(self, segment: Path) -> None:
+        acked = self._acked(segment)
+        with open(segment, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            frames = _read_frames(data)
+            try:
+                pending = (frame for position, (_, frame) in enumerate(frames) if position >= acked)
+                batches = chunked(pending, self._batch_size)
+                for count in bounded_map(self._send, batches, concurrency=self._concurrency):
+                    acked += count
+                    self._write_ack(segment, acked)
+                    with self._cond:
+                        self._depth -= count
+                        self._drained.append((time.monotonic(), count))
+                        self._cond.notify_all()
+            finally:
+                frames.close()
+        segment.unlink()
+        segment.with_suffix(".ack").unlink(missing_ok=True)
+
+    @staticmethod
+    def _write_ack(segment: Path, acked: int) -> None:
+        temporary = segment.with_suffix(".ack.tmp")
+        temporary.write_text(str(acked))
+        os.replace(temporary, segment.with_suffix(".ack"))
+
+    def _encode(self, frame: _Frame) -> bytes:
+        codec = self._h._t.codec
+        if frame.vector is None:
+            vector = b"null"
+        elif self._h._t.vectors.encoding == "json":
+            vector = codec.dumps(_FLOAT32.from_bytes(frame.vector))
+        elif self._h._t.vectors.encoding == "float32":
+            vector = codec.dumps(base64.b64encode(frame.vector).decode("ascii"))
+        else:
+            vector = codec.dumps(self._h._t.vectors.encode(_FLOAT32.from_bytes(frame.vector)))
+        return b"".join(
+            (b'{"uuid":', codec.dumps(frame.id), b',"properties":', frame.properties, b',"vector":', vector, b"}")
+        )
+
+    def _send(self, frames: List[_Frame]) -> int:
+        parts = [self._encode(frame) for frame in frames]
+        self._post(frames, parts)
+        self._h._invalidate()
+        return len(frames)
+
+    def _post(self, frames: List[_Frame], parts: List[bytes]) -> None:
+        attempt = 0
+        while True:
+            try:
+                resp = self._h.records._insert_encoded(parts, self._fields)
+            except _FATAL:
+                raise
+            except (ValidationError, PayloadTooLargeError) as exc:
+                # The batch was rejected as a whole: isolate the offending records.
+                if len(frames) > 1:
+                    middle = len(frames) // 2
+                    self._post(frames[:middle], parts[:middle])
+                    self._post(frames[middle:], parts[middle:])
+                    return
+                self._record_failures([FailedRecord(id=frames[0].id, error=str(exc))])
+                return
+            except _TRANSIENT as exc:
+                # Keep the data and retry until the server is back.
+                with self._cond:
+                    self._last_error = str(exc)
+                    if self._closing:
+                        raise
+                    self._cond.wait(min(5.0, 0.2 * 2**attempt))
+                attempt += 1
+                continue
+            except EigenlakeError as exc:
+                # Any other rejection is permanent; retrying would stall the spool forever.
+                self._record_failures([FailedRecord(id=frame.id, error=str(exc)) for frame in frames])
+                return
+            failed = _failed_records(resp)
+            self._record_failures(failed)
+            with self._cond:
+                self._uploaded += len(frames) - len(failed)
+            return
+
+    def _record_failures(self, failed: List[FailedRecord]) -> None:
+        if not failed:
+            return
+        with self._cond:
+            self._failed += len(failed)
+            self.failed_records.extend(failed)
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
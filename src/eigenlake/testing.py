@@ -0,0 +1,532 @@
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+import json
+import random
+import re
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from urllib.parse import unquote
+
+import httpx
+
+from ._vectors import VECTOR_ENCODING_HEADER
+from .async_client import AsyncEigenLakeClient
+from .client import EigenLakeClient
+
+_INDEX = r"/v1/collections/(?P<ns>[^/]+)/(?P<index>[^/]+)"
+
+
+@dataclass
+class _FakeRecord:
+    seq: int
+    properties: Dict[str, Any]
+    vector: bytes | None
+
+
+@dataclass
+class _FakeIndex:
+    dims: int
+    schema: Dict[str, Any] | None
+    index_options: Dict[str, Any] | None
+    shard_count: int
+    records: Dict[str, _FakeRecord] = field(default_factory=dict)
+    seq: int = 0
+
+
+class FakeEigenLake:
+    """In-memory stand-in for the EigenLake HTTP API, served through ``httpx.MockTransport``.
+
+    Vectors are stored as little-endian float32 bytes, so values round-trip exactly
+    through both the JSON and the base64 vector encodings. Filters are matched as
+    property equality (``{"field": value, ...}``).
+
+    For load tests, ``latency`` (seconds, or a callable taking the request) delays
+    every response and ``error_rate`` answers that fraction of index requests with
+    ``error_status`` before they touch any data. ``max_limit`` caps the page size of
+    ``get-by-filter`` and ``query/objects`` the way some deployments do, and
+    ``cursor_hints=False`` leaves ``next_after`` out of ``get-by-filter`` pages.
+    """
+
+    FEATURES = frozenset(
+        {"near-vector-batch", "get-many", "exists-many", "update-many", "replace-many", "delete-by-ids"}
+    )
+
+    def __init__(
+        self,
+        *,
+        api_key: str | None = None,
+        features: Iterable[str] | None = None,
+        latency: float | Callable[[httpx.Request], float] = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int | None = None,
+        max_limit: int | None = None,
+        cursor_hints: bool = True,
+    ):
+        self.api_key = api_key
+        self.features = frozenset(self.FEATURES if features is None else features)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.max_limit = max_limit
+        self.cursor_hints = cursor_hints
+        self._random = random.Random(seed)
+        self.indexes: Dict[Tuple[str, str], _FakeIndex] = {}
+        self.requests: Counter[str] = Counter()
+        self._lock = threading.RLock()
+        self._routes: List[Tuple[str, re.Pattern[str], Callable[..., Any]]] = [
+            ("GET", re.compile(r"/v1/health/ready"), self._ready),
+            ("GET", re.compile(r"/v1/capabilities"), self._capabilities),
+            ("POST", re.compile(r"/v1/collections/get-or-create"), self._get_or_create),
+            ("GET", re.compile(_INDEX + r"/config"), self._config),
+            ("POST", re.compile(_INDEX + r"/data/insert"), self._insert),
+            ("POST", re.compile(_INDEX + r"/data/insert-many"), self._insert_many),
+            ("POST", re.compile(_INDEX + r"/data/insert-vectors"), self._insert_vectors),
+            ("POST", re.compile(_INDEX + r"/data/get-by-id"), self._get_by_id),
+            ("POST", re.compile(_INDEX + r"/data/get-by-filter"), self._get_by_filter),
+            ("POST", re.compile(_INDEX + r"/data/get-many"), self._get_many),
+            ("POST", re.compile(_INDEX + r"/data/exists-many"), self._exists_many),
+            ("POST", re.compile(_INDEX + r"/data/delete-many"), self._delete_many),
+            ("POST", re.compile(_INDEX + r"/data/update-many"), self._update_many),
+            ("POST", re.compile(_INDEX + r"/data/replace-many"), self._replace_many),
+            ("POST", re.compile(_INDEX + r"/data/delete-by-ids"), self._delete_by_ids),
+            ("GET", re.compile(_INDEX + r"/data/exists/(?P<id>[^/]+)"), self._exists),
+            ("GET", re.compile(_INDEX + r"/data/delete-jobs/(?P<job>\d+)"), self._delete_job),
+            ("PATCH", re.compile(_INDEX + r"/data/(?P<id>[^/]+)"), self._update),
+            ("PUT", re.compile(_INDEX + r"/data/(?P<id>[^/]+)"), self._replace),
+            ("DELETE", re.compile(_INDEX + r"/data/(?P<id>[^/]+)"), self._remove),
+            ("POST", re.compile(_INDEX + r"/query/near-vector"), self._near_vector),
+            ("POST", re.compile(_INDEX + r"/query/near-vector-batch"), self._near_vector_batch),
+            ("GET", re.compile(_INDEX + r"/query/object/(?P<id>[^/]+)"), self._query_object),
+            ("GET", re.compile(_INDEX + r"/query/objects"), self._query_objects),
+            ("POST", re.compile(_INDEX + r"/admin/delete-by-filter"), self._delete_many),
+            ("GET", re.compile(_INDEX), self._open),
+            ("DELETE", re.compile(_INDEX), self._drop),
+        ]
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def client(self, **kwargs: Any) -> EigenLakeClient:
+        kwargs.setdefault("url", "http://eigenlake.test")
+        kwargs.setdefault("api_key", self.api_key)
+        return EigenLakeClient(http_transport=self.transport(), **kwargs)
+
+    def async_client(self, **kwargs: Any) -> AsyncEigenLakeClient:
+        kwargs.setdefault("url", "http://eigenlake.test")
+        kwargs.setdefault("api_key", self.api_key)
+        return AsyncEigenLakeClient(http_transport=self.transport(), **kwargs)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        delay = self.latency(request) if callable(self.latency) else self.latency
+        if delay > 0:
+            time.sleep(delay)
+        if self.api_key and request.headers.get("X-API-Key") != self.api_key:
+            return httpx.Response(401, json={"detail": "invalid api key"})
+
+        path = request.url.path
+        if self.error_rate > 0 and path.startswith("/v1/collections/"):
+            with self._lock:
+                injected = self._random.random() < self.error_rate
+                if injected:
+                    self.requests["injected_error"] += 1
+            if injected:
+                return httpx.Response(self.error_status, json={"detail": "injected error"})
+        for method, pattern, route in self._routes:
+            match = pattern.fullmatch(path)
+            if method != request.method or match is None:
+                continue
+            params = {key: unquote(value) for key, value in match.groupdict().items()}
+            with self._lock:
+                self.requests[route.__name__.lstrip("_")] += 1
+                try:
+                    status, body, *headers = route(request, **params)
+                except _HTTPError as exc:
+                    return httpx.Response(exc.status, json={"detail": exc.detail})
+            return self._respond(request, status, body, *headers)
+        return httpx.Response(404, json={"detail": f"no route for {request.method} {path}"})
+
+    # Encoding helpers
+
+    @staticmethod
+    def _wire_encoding(request: httpx.Request) -> str | None:
+        value = request.headers.get(VECTOR_ENCODING_HEADER)
+        return value if value in ("base64-float32", "base64-float16") else None
+
+    def _read_vector(self, request: httpx.Request, value: Any, dims: int) -> bytes | None:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            raw = base64.b64decode(value)
+            if self._wire_encoding(request) == "base64-float16":
+                raw = struct.pack(f"<{len(raw) // 2}f", *struct.unpack(f"<{len(raw) // 2}e", raw))
+        else:
+            raw = array("f", value).tobytes()
+        if dims and len(raw) != dims * 4:
+            raise _HTTPError(422, f"vector has {len(raw) // 4} dimensions, expected {dims}")
+        return raw
+
+    def _write_vector(self, request: httpx.Request, raw: bytes) -> Any:
+        encoding = self._wire_encoding(request)
+        if encoding == "base64-float32":
+            return base64.b64encode(raw).decode("ascii")
+        values = array("f")
+        values.frombytes(raw)
+        if encoding == "base64-float16":
+            return base64.b64encode(struct.pack(f"<{len(values)}e", *values)).decode("ascii")
+        return values.tolist()
+
+    def _respond(
+        self, request: httpx.Request, status: int, body: Any, extra: Dict[str, str] | None = None
+    ) -> httpx.Response:
+        if status == 304:
+            return httpx.Response(304, headers=extra)
+        headers = {"Content-Type": "application/json", **(extra or {})}
+        encoding = self._wire_encoding(request)
+        if encoding is not None:
+            headers[VECTOR_ENCODING_HEADER] = encoding
+        content = json.dumps(body).encode("utf-8")
+        if len(content) >= 1024 and "gzip" in request.headers.get("Accept-Encoding", ""):
+            content = gzip.compress(content, mtime=0)
+            headers["Content-Encoding"] = "gzip"
+        return httpx.Response(status, content=content, headers=headers)
+
+    def _object(self, request: httpx.Request, id: str, record: _FakeRecord, *, vector: bool, properties: bool = True):
+        out: Dict[str, Any] = {"uuid": id}
+        if properties:
+            out["properties"] = dict(record.properties)
+        if vector and record.vector is not None:
+            out["vector"] = self._write_vector(request, record.vector)
+        return out
+
+    @staticmethod
+    def _body(request: httpx.Request) -> Dict[str, Any]:
+        content = request.content or b"{}"
+        encoding = request.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            content = gzip.decompress(content)
+        elif encoding == "zstd":
+            import zstandard
+
+            content = zstandard.ZstdDecompressor().decompress(content)
+        return json.loads(content)
+
+    @staticmethod
+    def _flag(request: httpx.Request, name: str, default: bool = False) -> bool:
+        value = request.url.params.get(name)
+        return default if value is None else value.lower() == "true"
+
+    def _limit(self, value: Any) -> int:
+        limit = int(value)
+        return limit if self.max_limit is None else min(limit, self.max_limit)
+
+    def _index(self, ns: str, index: str) -> _FakeIndex:
+        found = self.indexes.get((ns, index))
+        if found is None:
+            raise _HTTPError(404, f"index {ns}/{index} not found")
+        return found
+
+    @staticmethod
+    def _matches(record: _FakeRecord, where: Dict[str, Any] | None) -> bool:
+        return all(record.properties.get(key) == value for key, value in (where or {}).items())
+
+    def _put(self, idx: _FakeIndex, id: str, properties: Dict[str, Any] | None, vector: bytes | None) -> None:
+        idx.seq += 1
+        idx.records[id] = _FakeRecord(seq=idx.seq, properties=dict(properties or {}), vector=vector)
+
+    # Routes
+
+    def _ready(self, request):
+        return 200, {"ready": True}
+
+    def _capabilities(self, request):
+        return 200, {"features": sorted(self.features)}
+
+    def _require(self, feature: str) -> None:
+        if feature not in self.features:
+            raise _HTTPError(404, f"{feature} is not enabled")
+
+    def _get_or_create(self, request):
+        body = self._body(request)
+        key = (body["namespace"], body["index"])
+        created = key not in self.indexes
+        if created:
+            self.indexes[key] = _FakeIndex(
+                dims=int(body.get("dimensions") or 0),
+                schema=body.get("schema"),
+                index_options=body.get("index_options"),
+                shard_count=int(body.get("shard_count") or 1),
+            )
+        return 200, {"namespace": key[0], "index": key[1], "created": created}
+
+    def _config(self, request, ns, index):
+        idx = self._index(ns, index)
+        config = {
+            "dims": idx.dims,
+            "schema": idx.schema or {},
+            "index_options": idx.index_options or {},
+            "shards": {"count": idx.shard_count},
+        }
+        etag = '"%s"' % hashlib.sha1(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        if request.headers.get("If-None-Match") == etag:
+            return 304, None, {"ETag": etag}
+        return 200, config, {"ETag": etag}
+
+    def _open(self, request, ns, index):
+        return self._config(request, ns, index)[:2]
+
+    def _drop(self, request, ns, index):
+        self._index(ns, index)
+        del self.indexes[(ns, index)]
+        return 200, {"deleted": True}
+
+    def _insert(self, request, ns, index):
+        idx = self._index(ns, index)
+        body = self._body(request)
+        id = str(body.get("uuid") or f"{ns}-{index}-{idx.seq + 1}")
+        if id in idx.records:
+            if body.get("on_duplicate", "error") == "error":
+                raise _HTTPError(409, f"record {id} already exists")
+            if body.get("on_duplicate") == "skip":
+                return 200, {"uuid": id}
+        self._put(idx, id, body.get("properties"), self._read_vector(request, body.get("vector"), idx.dims))
+        return 200, {"uuid": id}
+
+    def _insert_many(self, request, ns, index):
+        idx = self._index(ns, index)
+        body = self._body(request)
+        on_duplicate = body.get("on_duplicate", "error")
+        uuids: List[str] = []
+        failed: List[Dict[str, str]] = []
+        for item in body.get("objects") or []:
+            id = str(item.get("uuid") or f"{ns}-{index}-{idx.seq + 1}")
+            try:
+                if id in idx.records and on_duplicate == "error":
+                    raise _HTTPError(409, f"record {id} already exists")
+                vector = self._read_vector(request, item.get("vector"), idx.dims)
+            except _HTTPError as exc:
+                if body.get("on_error", "raise") == "raise":
+                    raise
+                failed.append({"uuid": id, "error": exc.detail})
+                continue
+            if not (id in idx.records and on_duplicate == "skip"):
+                self._put(idx, id, item.get("properties"), vector)
+            uuids.append(id)
+        return 200, {"uuids": uuids, "failed_objects": failed}
+
+    def _insert_vectors(self, request, ns, index):
+        idx = self._index(ns, index)
+        body = self._body(request)
+        items = body.get("vectors") or []
+        for item in items:
+            id = str(item["uuid"])
+            existing = idx.records.get(id)
+            properties = item.get("properties", existing.properties if existing else None)
+            self._put(idx, id, properties, self._read_vector(request, item.get("vector"), idx.dims))
+        return 200, {"inserted": len(items)}
+
+    def _get_by_id(self, request, ns, index):
+        idx = self._index(ns, index)
+        body = self._body(request)
+        id = str(body["uuid"])
+        record = idx.records.get(id)
+        if record is None:
+            return 200, {"object": None}
+        return 200, {"object": self._object(request, id, record, vector=True, properties=body.get("return_data", True))}
+
+    def _get_many(self, request, ns, index):
+        self._require("get-many")
+        idx = self._index(ns, index)
+        body = self._body(request)
+        objects = []
+        for id in body.get("uuids") or []:
+            record = idx.records.get(str(id))
+            objects.append(
+                None
+                if record is None
+                else self._object(request, str(id), record, vector=True, properties=body.get("return_data", True))
+            )
+        return 200, {"objects": objects}
+
+    def _get_by_filter(self, request, ns, index):
+        idx = self._index(ns, index)
+        body = self._body(request)
+        limit = self._limit(body.get("limit") or 100)
+        ids = sorted(id for id, record in idx.records.items() if self._matches(record, body.get("where")))
+        start = bisect_right(ids, body["after"]) if body.get("after") else 0
+        page = ids[start : start + limit]
+        objects = [
+            self._object(
+                request,
+                id,
+                idx.records[id],
+                vector=bool(body.get("include_vector")),
+                properties=body.get("include_properties", True),
+            )
+            for id in page
+        ]
+        if not self.cursor_hints:
+            return 200, {"objects": objects}
+        next_after = page[-1] if page and start + limit < len(ids) else None
+        return 200, {"objects": objects, "next_after": next_after}
+
+    def _delete_many(self, request, ns, index):
+        idx = self._index(ns, index)
+        body = self._body(request)
+        ids = [id for id, record in idx.records.items() if self._matches(record, body.get("where"))]
+        limit = body.get("limit") or body.get("limit_object_ids")
+        if limit is not None:
+            ids = ids[: int(limit)]
+        for id in ids:
+            del idx.records[id]
+        return 200, {"deleted": len(ids), "job_id": None}
+
+    def _exists(self, request, ns, index, id):
+        return 200, {"exists": id in self._index(ns, index).records}
+
+    def _exists_many(self, request, ns, index):
+        self._require("exists-many")
+        idx = self._index(ns, index)
+        return 200, {"existing": [id for id in self._body(request).get("uuids") or [] if str(id) in idx.records]}
+
+    def _delete_job(self, request, ns, index, job):
+        self._index(ns, index)
+        return 200, {"job_id": int(job), "status": "completed"}
+
+    def _update(self, request, ns, index, id):
+        self._modify(request, self._index(ns, index), id, self._body(request), replace=False)
+        return 200, {"uuid": id}
+
+    def _replace(self, request, ns, index, id):
+        self._modify(request, self._index(ns, index), id, self._body(request), replace=True)
+        return 200, {"uuid": id}
+
+    def _remove(self, request, ns, index, id):
+        idx = self._index(ns, index)
+        if idx.records.pop(id, None) is None:
+            raise _HTTPError(404, f"record {id} not found")
+        return 200, {"deleted": True}
+
+    def _modify(self, request, idx: _FakeIndex, id: str, body: Dict[str, Any], *, replace: bool) -> None:
+        record = idx.records.get(id)
+        if record is None:
+            raise _HTTPError(404, f"record {id} not found")
+        vector = self._read_vector(request, body.get("vector"), idx.dims)
+        if replace:
+            record.properties = dict(body.get("properties") or {})
+        elif body.get("properties"):
+            record.properties.update(body["properties"])
+        if vector is not None:
+            record.vector = vector
+
+    def _modify_many(self, request, ns, index, *, replace: bool):
+        self._require("replace-many" if replace else "update-many")
+        idx = self._index(ns, index)
+        uuids: List[str] = []
+        failed: List[Dict[str, str]] = []
+        for item in self._body(request).get("objects") or []:
+            id = str(item.get("uuid") or "")
+            try:
+                self._modify(request, idx, id, item, replace=replace)
+            except _HTTPError as exc:
+                failed.append({"uuid": id, "error": exc.detail})
+            else:
+                uuids.append(id)
+        return 200, {"uuids": uuids, "failed_objects": failed}
+
+    def _update_many(self, request, ns, index):
+        return self._modify_many(request, ns, index, replace=False)
+
+    def _replace_many(self, request, ns, index):
+        return self._modify_many(request, ns, index, replace=True)
+
+    def _delete_by_ids(self, request, ns, index):
+        self._require("delete-by-ids")
+        idx = self._index(ns, index)
+        uuids: List[str] = []
+        failed: List[Dict[str, str]] = []
+        for id in self._body(request).get("uuids") or []:
+            if idx.records.pop(str(id), None) is None:
+                failed.append({"uuid": str(id), "error": f"record {id} not found"})
+            else:
+                uuids.append(str(id))
+        return 200, {"uuids": uuids, "failed_objects": failed}
+
+    def _near_vector(self, request, ns, index):
+        idx = self._index(ns, index)
+        body = self._body(request)
+        return 200, {"results": self._search(request, idx, body["vector"], body)}
+
+    def _near_vector_batch(self, request, ns, index):
+        self._require("near-vector-batch")
+        idx = self._index(ns, index)
+        body = self._body(request)
+        results = []
+        for vector in body.get("vectors") or []:
+            try:
+                results.append({"results": self._search(request, idx, vector, body)})
+            except _HTTPError as exc:
+                results.append({"error": exc.detail})
+        return 200, {"results": results}
+
+    def _search(self, request, idx: _FakeIndex, vector: Any, body: Dict[str, Any]) -> List[Dict[str, Any]]:
+        query = array("f")
+        query.frombytes(self._read_vector(request, vector, idx.dims) or b"")
+        scored = []
+        for id, record in idx.records.items():
+            if record.vector is None or not self._matches(record, body.get("filter")):
+                continue
+            values = array("f")
+            values.frombytes(record.vector)
+            scored.append((sum(a * b for a, b in zip(query, values)), id))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [
+            {"uuid": id, "score": score, "properties": dict(idx.records[id].properties)}
+            for score, id in scored[: int(body.get("top_k") or 10)]
+        ]
+
+    def _query_object(self, request, ns, index, id):
+        idx = self._index(ns, index)
+        record = idx.records.get(id)
+        if record is None:
+            raise _HTTPError(404, f"record {id} not found")
+        return 200, self._object(request, id, record, vector=self._flag(request, "include_vector"))
+
+    def _query_objects(self, request, ns, index):
+        idx = self._index(ns, index)
+        params = request.url.params
+        limit = self._limit(params.get("limit", 100))
+        offset = int(params.get("offset", 0))
+        newest_first = self._flag(request, "newest_first", True)
+        ordered = sorted(idx.records.items(), key=lambda item: item[1].seq, reverse=newest_first)
+        page = ordered[offset : offset + limit]
+        objects = [
+            self._object(
+                request,
+                id,
+                record,
+                vector=self._flag(request, "include_vector"),
+                properties=self._flag(request, "include_properties", True),
+            )
+            for id, record in page
+        ]
+        return 200, {"objects": objects, "next_offset": offset + len(objects)}
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+__all__ = ["FakeEigenLake"]
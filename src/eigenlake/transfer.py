@@ -0,0 +1,484 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import struct
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Literal, Tuple
+
+from ._concurrency import bounded_map
+from ._vectors import VectorCodec, require_numpy
+from .client import _JSON_HEADERS, FailedRecord, IndexHandle, _array_body, _failed_records
+
+ImportFormat = Literal["jsonl", "npy", "parquet"]
+ExportFormat = Literal["jsonl", "parquet"]
+
+_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".npy": "npy", ".parquet": "parquet"}
+_FLOAT32 = VectorCodec("float32")
+# Fixed-size NPY v1.0 header so the row count can be rewritten in place as the file grows.
+_NPY_HEADER_BYTES = 128
+
+
+def require_pyarrow():
+    try:
+        import pyarrow.parquet
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError("Parquet support requires pyarrow: pip install 'eigenlake[parquet]'") from exc
+    return pyarrow
+
+
+@dataclass
+class ImportResult:
+    rows: int = 0
+    resumed_from: int = 0
+    requests: int = 0
+    seconds: float = 0.0
+    failed_records: List[FailedRecord] = field(default_factory=list)
+
+    @property
+    def number_errors(self) -> int:
+        return len(self.failed_records)
+
+    @property
+    def rows_per_second(self) -> float:
+        return (self.rows - self.resumed_from) / self.seconds if self.seconds > 0 else 0.0
+
+
+class _Checkpoint:
+    # {"source", "size", "mtime_ns", "rows", "offset"}, rewritten atomically after every slice.
+
+    def __init__(self, path: str | os.PathLike[str] | None, source: Path):
+        self.path = Path(path) if path is not None else None
+        stat = source.stat()
+        self._identity = {"source": str(source.resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        self.rows = 0
+        self.offset = 0
+        if self.path is not None and self.path.exists():
+            state = json.loads(self.path.read_text())
+            if any(state.get(key) != value for key, value in self._identity.items()):
+                raise ValueError(f"checkpoint {self.path} was written for a different file")
+            self.rows = int(state.get("rows") or 0)
+            self.offset = int(state.get("offset") or 0)
+
+    def save(self, rows: int, offset: int = 0) -> None:
+        self.rows, self.offset = rows, offset
+        if self.path is None:
+            return
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(json.dumps({**self._identity, "rows": rows, "offset": offset}))
+        os.replace(temporary, self.path)
+
+
+def _jsonl_rows(path: Path, *, start_offset: int = 0, skip: int = 0) -> Iterator[Tuple[bytes, int]]:
+    # Yields (raw line, offset just past it); blank lines are not rows.
+    with open(path, "rb") as handle:
+        handle.seek(start_offset)
+        offset = start_offset
+        for line in handle:
+            offset += len(line)
+            if not line.strip():
+                continue
+            if skip:
+                skip -= 1
+                continue
+            yield line, offset
+
+
+def _parquet_batches(path: Path, batch_size: int, skip: int = 0) -> Iterator[Any]:
+    pyarrow = require_pyarrow()
+    parquet = pyarrow.parquet.ParquetFile(path)
+    for batch in parquet.iter_batches(batch_size=batch_size):
+        if skip >= batch.num_rows:
+            skip -= batch.num_rows
+            continue
+        yield batch.slice(skip) if skip else batch
+        skip = 0
+
+
+def _property_rows(path: Path | None, skip: int, batch_size: int) -> Iterator[Dict[str, Any]] | None:
+    if path is None:
+        return None
+    if _detect(path, None) == "parquet":
+        return (row for batch in _parquet_batches(path, batch_size, skip) for row in batch.to_pylist())
+    return (json.loads(line) for line, _ in _jsonl_rows(path, skip=skip))
+
+
+def _detect(path: Path, format: ImportFormat | None) -> str:
+    if format is not None:
+        return format
+    found = _FORMATS.get(path.suffix.lower())
+    if found is None:
+        raise ValueError(f"Cannot tell the format of {path}; pass format='jsonl', 'npy' or 'parquet'")
+    return found
+
+
+def _vector_matrix(column: Any) -> Any:
+    # FixedSizeList / List<float> column -> (rows, dims) float32 view of the Arrow buffer.
+    np = require_numpy()
+    column = column.combine_chunks() if hasattr(column, "combine_chunks") else column
+    if column.null_count:
+        raise ValueError("vector column contains nulls")
+    values = column.flatten().to_numpy(zero_copy_only=False)
+    return np.asarray(values, dtype=np.float32).reshape(len(column), -1)
+
+
+def import_file(
+    handle: IndexHandle,
+    path: str | os.PathLike[str],
+    *,
+    format: ImportFormat | None = None,
+    properties: str | os.PathLike[str] | None = None,
+    id_field: str = "id",
+    vector_field: str = "vector",
+    id_prefix: str = "",
+    batch_size: int = 1000,
+    concurrency: int = 4,
+    checkpoint: str | os.PathLike[str] | None = None,
+    on_duplicate: Literal["error", "replace", "skip"] = "replace",
+) -> ImportResult:
+    """Streams a JSONL, NPY or Parquet file into the index in ``batch_size`` slices.
+
+    JSONL lines are records as accepted by ``add_many``. An ``.npy`` matrix is opened
+    with ``mmap_mode="r"``; row properties come from the optional ``properties`` file
+    (JSONL or Parquet, one row per vector), and ids from its ``id_field`` or else
+    ``id_prefix + row number``. Parquet files carry the vector in ``vector_field`` and
+    the remaining columns as properties. Only ``concurrency`` slices are held in memory
+    at once. With ``checkpoint``, progress is saved after every slice and a later call
+    with the same file resumes where it stopped.
+    """
+    source = Path(path)
+    kind = _detect(source, format)
+    state = _Checkpoint(checkpoint, source)
+    result = ImportResult(rows=state.rows, resumed_from=state.rows)
+    started = time.perf_counter()
+    transport = handle._t
+    batch_size = max(1, int(batch_size))
+
+    def post(endpoint: str, key: str, parts: List[bytes], fields: Dict[str, Any]) -> Dict[str, Any]:
+        body = _array_body(key, parts, fields, transport.codec)
+        return transport.decode(
+            transport.post(f"{handle._path}/data/{endpoint}", content=body, headers=_JSON_HEADERS)
+        )
+
+    if kind == "jsonl":
+        fields = {"on_duplicate": on_duplicate, "on_error": "continue"}
+
+        def slices() -> Iterator[Tuple[List[bytes], int, int]]:
+            lines: List[bytes] = []
+            offset = state.offset
+            for line, offset in _jsonl_rows(source, start_offset=state.offset):
+                lines.append(line)
+                if len(lines) >= batch_size:
+                    yield lines, len(lines), offset
+                    lines = []
+            if lines:
+                yield lines, len(lines), offset
+
+        def upload(item: Tuple[List[bytes], int, int]) -> Tuple[Dict[str, Any], int, int]:
+            lines, count, offset = item
+            parts = [transport.encode_record(transport.codec.loads(line)) for line in lines]
+            return post("insert-many", "objects", parts, fields), count, offset
+
+    elif kind == "npy":
+        np = require_numpy()
+        matrix = np.load(source, mmap_mode="r")
+        if matrix.ndim != 2:
+            raise ValueError(f"Expected a 2-D matrix in {source}, got shape {matrix.shape}")
+        props = _property_rows(Path(properties) if properties is not None else None, state.rows, batch_size)
+        fields = {}
+
+        def slices() -> Iterator[Tuple[Any, List[Dict[str, Any]] | None, int]]:
+            for start in range(state.rows, matrix.shape[0], batch_size):
+                end = min(start + batch_size, matrix.shape[0])
+                rows = list(itertools.islice(props, end - start)) if props is not None else None
+                if rows is not None and len(rows) < end - start:
+                    raise ValueError(
+                        f"{properties} has {start + len(rows)} property rows but {source} has "
+                        f"{matrix.shape[0]} vectors"
+                    )
+                yield start, rows, end
+
+        def upload(item: Tuple[int, List[Dict[str, Any]] | None, int]) -> Tuple[Dict[str, Any], int, int]:
+            start, rows, end = item
+            block = np.ascontiguousarray(matrix[start:end], dtype=np.float32)
+            parts = []
+            for position, vector in enumerate(block):
+                row = dict(rows[position]) if rows is not None else {}
+                id = row.pop(id_field, None)
+                record = {"uuid": str(id) if id is not None else f"{id_prefix}{start + position}", "vector": vector}
+                if rows is not None:
+                    record["properties"] = row
+                parts.append(transport.encode_record(record))
+            return post("insert-vectors", "vectors", parts, fields), end - start, 0
+
+    else:
+        fields = {}
+
+        def slices() -> Iterator[Tuple[Any, int, int]]:
+            rows = state.rows
+            for batch in _parquet_batches(source, batch_size, skip=state.rows):
+                rows += batch.num_rows
+                yield batch, rows - batch.num_rows, rows
+
+        def upload(item: Tuple[Any, int, int]) -> Tuple[Dict[str, Any], int, int]:
+            batch, start, end = item
+            names = batch.schema.names
+            vectors = _vector_matrix(batch.column(names.index(vector_field)))
+            other = batch.drop_columns([vector_field]) if hasattr(batch, "drop_columns") else batch
+            parts = []
+            for position, row in enumerate(other.to_pylist()):
+                row.pop(vector_field, None)
+                id = row.pop(id_field, None)
+                record = {
+                    "uuid": str(id) if id is not None else f"{id_prefix}{start + position}",
+                    "vector": vectors[position],
+                    "properties": row,
+                }
+                parts.append(transport.encode_record(record))
+            return post("insert-vectors", "vectors", parts, fields), end - start, 0
+
+    try:
+        uploads = bounded_map(upload, slices(), concurrency=concurrency, thread_name_prefix="eigenlake-import")
+        for resp, count, offset in uploads:
+            result.failed_records.extend(_failed_records(resp))
+            result.requests += 1
+            result.rows += count
+            state.save(result.rows, offset)
+    finally:
+        result.seconds = time.perf_counter() - started
+        handle._invalidate()
+    return result
+
+
+@dataclass
+class ExportResult:
+    rows: int = 0
+    resumed_from: int = 0
+    dims: int = 0
+    pages: int = 0
+    seconds: float = 0.0
+    vectors_path: Path | None = None
+    properties_paths: List[Path] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return (self.rows - self.resumed_from) / self.seconds if self.seconds > 0 else 0.0
+
+
+def _npy_header(rows: int, dims: int) -> bytes:
+    header = "{'descr': '<f4', 'fortran_order': False, 'shape': (%d, %d), }" % (rows, dims)
+    header = header.ljust(_NPY_HEADER_BYTES - 10 - 1) + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+def _pages(scan: Any, page_size: int) -> Iterator[Tuple[List[Dict[str, Any]], str]]:
+    # Pairs every page with the scan token taken right after its last object.
+    page: List[Dict[str, Any]] = []
+    for obj in scan:
+        page.append(obj)
+        if len(page) >= page_size:
+            yield page, scan.checkpoint()
+            page = []
+    if page:
+        yield page, scan.checkpoint()
+
+
+class _ExportState:
+    # {"format", "scan", "rows", "dims", "properties_bytes", "parts"}, rewritten atomically.
+
+    def __init__(self, path: Path, format: str):
+        self.path = path
+        self.format = format
+        self.scan: str | None = None
+        self.rows = 0
+        self.dims = 0
+        self.properties_bytes = 0
+        self.parts: List[str] = []
+
+    def load(self) -> bool:
+        if not self.path.exists():
+            return False
+        state = json.loads(self.path.read_text())
+        if state.get("format") != self.format:
+            raise ValueError(f"checkpoint {self.path} was written for format={state.get('format')!r}")
+        self.scan = state.get("scan")
+        self.rows = int(state.get("rows") or 0)
+        self.dims = int(state.get("dims") or 0)
+        self.properties_bytes = int(state.get("properties_bytes") or 0)
+        self.parts = list(state.get("parts") or [])
+        return True
+
+    def save(self) -> None:
+        state = {
+            "format": self.format,
+            "scan": self.scan,
+            "rows": self.rows,
+            "dims": self.dims,
+            "properties_bytes": self.properties_bytes,
+            "parts": self.parts,
+        }
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(json.dumps(state))
+        os.replace(temporary, self.path)
+
+
+def export(
+    handle: IndexHandle,
+    path: str | os.PathLike[str],
+    *,
+    format: ExportFormat = "jsonl",
+    filter: Dict[str, Any] | None = None,
+    with_properties: bool = True,
+    id_field: str = "id",
+    page_size: int = 1000,
+    concurrency: int = 2,
+    checkpoint_every: int = 10,
+    resume: bool = True,
+    fsync: bool = False,
+) -> ExportResult:
+    """Streams the index into ``path`` as ``vectors.npy`` plus row-aligned properties.
+
+    Pages come from ``records.scan`` with the next page requested while the current one
+    is encoded; ``concurrency`` pages are encoded in parallel. Vector rows are appended
+    to a float32 NPY file whose header is rewritten as it grows, so the result opens
+    with ``numpy.load(..., mmap_mode="r")`` and numpy is not needed to write it.
+    Properties go to ``properties.jsonl`` or ``properties-NNNNN.parquet`` parts, one flat
+    row per vector with the record id under ``id_field`` (the layout ``import_file``
+    reads back). Progress is saved to ``export.json`` every ``checkpoint_every`` pages;
+    an interrupted export rerun with the same arguments continues from there.
+    """
+    if format not in ("jsonl", "parquet"):
+        raise ValueError(f"Unsupported export format: {format!r}")
+    pyarrow = require_pyarrow() if format == "parquet" else None
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    vectors_path = directory / "vectors.npy"
+    jsonl_path = directory / "properties.jsonl"
+    state = _ExportState(directory / "export.json", format)
+    resumed = resume and state.load()
+    if not resumed:
+        for stale in directory.glob("properties-*.parquet"):
+            stale.unlink()
+    page_size = max(1, int(page_size))
+    checkpoint_every = max(1, int(checkpoint_every))
+    result = ExportResult(rows=state.rows, resumed_from=state.rows, dims=state.dims, vectors_path=vectors_path)
+    started = time.perf_counter()
+
+    # Anything written after the last checkpoint is discarded and fetched again.
+    vectors = open(vectors_path, "r+b" if resumed and vectors_path.exists() else "w+b")
+    vectors.truncate(_NPY_HEADER_BYTES + state.rows * state.dims * 4)
+    vectors.seek(0, os.SEEK_END)
+    properties = None
+    if format == "jsonl":
+        properties = open(jsonl_path, "r+b" if resumed and jsonl_path.exists() else "w+b")
+        properties.truncate(state.properties_bytes)
+        properties.seek(0, os.SEEK_END)
+    else:
+        for stale in directory.glob("properties-*.parquet"):
+            if stale.name not in state.parts:
+                stale.unlink()
+    writer = None
+
+    def encode(item: Tuple[List[Dict[str, Any]], str]) -> Tuple[bytes, Any, int, int, str]:
+        page, token = item
+        rows: List[Dict[str, Any]] = []
+        blocks: List[bytes] = []
+        dims = 0
+        for obj in page:
+            id = obj.get("uuid", obj.get("id"))
+            vector = obj.get("vector")
+            if vector is None:
+                raise ValueError(f"record {id} has no vector")
+            block = _FLOAT32.to_bytes(vector)
+            if dims and len(block) != dims * 4:
+                raise ValueError(f"record {id} has {len(block) // 4} dimensions, expected {dims}")
+            dims = len(block) // 4
+            blocks.append(block)
+            rows.append({id_field: id, **(obj.get("properties") or {})})
+        if format == "jsonl":
+            lines = (json.dumps(row, separators=(",", ":"), default=str) for row in rows)
+            body = "".join(line + "\n" for line in lines).encode("utf-8")
+        else:
+            body = rows
+        return b"".join(blocks), body, len(page), dims, token
+
+    def write_parquet(rows: List[Dict[str, Any]]) -> None:
+        nonlocal writer
+        table = None
+        if writer is not None and all(key in writer.schema.names for row in rows for key in row):
+            try:
+                table = pyarrow.Table.from_pylist(rows, schema=writer.schema)
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                table = None
+        if table is None:
+            # A page whose columns do not fit the open part starts a new one.
+            close_part()
+            table = pyarrow.Table.from_pylist(rows)
+            name = f"properties-{len(state.parts):05d}.parquet"
+            writer = pyarrow.parquet.ParquetWriter(directory / name, table.schema)
+            state.parts.append(name)
+        writer.write_table(table)
+
+    def close_part() -> None:
+        nonlocal writer
+        if writer is not None:
+            writer.close()
+            writer = None
+
+    def save() -> None:
+        # Data first, header and checkpoint last, so the checkpoint never runs ahead of the files.
+        if format == "parquet":
+            close_part()
+        vectors.seek(0)
+        vectors.write(_npy_header(state.rows, state.dims))
+        vectors.seek(0, os.SEEK_END)
+        for file in (vectors, properties):
+            if file is not None:
+                file.flush()
+                if fsync:
+                    os.fsync(file.fileno())
+        if properties is not None:
+            state.properties_bytes = properties.tell()
+        state.save()
+
+    scan = handle.records.scan(
+        filter=filter,
+        page_size=page_size,
+        with_vector=True,
+        with_properties=with_properties,
+        checkpoint=state.scan,
+    )
+    try:
+        pages = _pages(scan, page_size)
+        encoded = bounded_map(encode, pages, concurrency=concurrency, thread_name_prefix="eigenlake-export")
+        for block, body, count, dims, token in encoded:
+            if state.dims and dims != state.dims:
+                raise ValueError(f"index returned {dims}-dimensional vectors after {state.dims}-dimensional")
+            state.dims = dims
+            vectors.write(block)
+            if properties is not None:
+                properties.write(body)
+            else:
+                write_parquet(body)
+            state.rows += count
+            state.scan = token
+            result.pages += 1
+            if result.pages % checkpoint_every == 0:
+                save()
+        save()
+        state.path.unlink()
+    finally:
+        scan.close()
+        close_part()
+        vectors.close()
+        if properties is not None:
+            properties.close()
+        result.rows = state.rows
+        result.dims = state.dims
+        result.seconds = time.perf_counter() - started
+        parts = [directory / name for name in state.parts]
+        result.properties_paths = [jsonl_path] if format == "jsonl" else parts
+    return result
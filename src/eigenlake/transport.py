@@ -1,29 +1,129 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import httpx
 
-from .errors import APIError, AuthenticationError, ConflictError, NetworkError, NotFoundError, ValidationError
+from ._vectors import VectorCodec, VectorEncoding
+from .codec import CodecName, JSONCodec, get_codec
+from .compression import (
+    DEFAULT_COMPRESSION_THRESHOLD,
+    BodyCompressor,
+    Compression,
+    CompressionStats,
+    accept_encoding,
+)
+from .errors import (
+    APIError,
+    AuthenticationError,
+    CircuitOpenError,
+    ConflictError,
+    DeadlineExceededError,
+    NetworkError,
+    NotFoundError,
+    PayloadTooLargeError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+)
+from .metrics import Instrumentation, PoolStats, RequestEvent, endpoint_name
+from .retry import RetryBudget, RetryPolicy, clip_timeout, remaining
 
+CAPABILITIES_PATH = "/v1/capabilities"
+WARMUP_PATH = "/v1/health/ready"
 
-class Transport:
+# httpx's own defaults, spelled out so connect() can document them.
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+
+def build_timeout(
+    timeout: float | httpx.Timeout,
+    *,
+    connect: float | None = None,
+    read: float | None = None,
+    write: float | None = None,
+    pool: float | None = None,
+) -> httpx.Timeout:
+    # Phases left as None fall back to the scalar timeout rather than to "no timeout".
+    if isinstance(timeout, httpx.Timeout):
+        return timeout
+    default = float(timeout)
+    return httpx.Timeout(
+        default,
+        connect=default if connect is None else float(connect),
+        read=default if read is None else float(read),
+        write=default if write is None else float(write),
+        pool=default if pool is None else float(pool),
+    )
+
+
+def build_limits(
+    max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def _require_h2() -> None:
+    try:
+        import h2  # noqa: F401
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError("HTTP/2 support requires h2: pip install 'eigenlake[http2]'") from exc
+
+
+class _BaseTransport:
     def __init__(
         self,
         *,
-        base_url: str,
-        api_key: str | None,
-        timeout: float = 20.0,
         retries: int = 2,
+        vector_encoding: VectorEncoding = "json",
+        compression: Compression | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        codec: CodecName | JSONCodec = "auto",
+        instrumentation: Instrumentation | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        retry_policy: RetryPolicy | None = None,
     ):
-        normalized = base_url.rstrip("/")
-        self._retries = max(0, int(retries))
-        self._client = httpx.Client(
-            base_url=normalized,
-            timeout=float(timeout),
-            headers=self._auth_headers(api_key),
+        self.retry_policy = (
+            retry_policy if retry_policy is not None else RetryPolicy(retries=retries, budget=RetryBudget())
+        )
+        self.limits = limits if limits is not None else build_limits()
+        self.http2 = bool(http2)
+        if self.http2:
+            _require_h2()
+        self._usage_lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._queued = 0
+        self._pool_timeouts = 0
+        # None keeps the request path free of timing calls.
+        self.instrumentation = instrumentation
+        self.codec = get_codec(codec)
+        self.vectors = VectorCodec(vector_encoding)
+        self.compressor = (
+            BodyCompressor(compression, threshold=compression_threshold) if compression is not None else None
         )
+        self._capabilities: frozenset[str] | None = None
+        self._capabilities_lock = threading.Lock()
+
+    def _default_headers(self, api_key: str | None) -> dict[str, str]:
+        return {
+            **self._auth_headers(api_key),
+            **self.vectors.headers,
+            "Accept-Encoding": accept_encoding(),
+        }
 
     @staticmethod
     def _auth_headers(api_key: str | None) -> dict[str, str]:
@@ -32,10 +132,9 @@ class Transport:
             return {}
         return {"X-API-Key": token}
 
-    @staticmethod
-    def _detail(resp: httpx.Response) -> str:
+    def _detail(self, resp: httpx.Response) -> str:
         try:
-            payload = resp.json()
+            payload = self.decode(resp)
             if isinstance(payload, dict) and payload.get("detail") is not None:
                 return str(payload["detail"])
         except Exception:
@@ -44,7 +143,8 @@ class Transport:
         return text or f"HTTP {resp.status_code}"
 
     def _raise_for_status(self, resp: httpx.Response) -> None:
-        if 200 <= resp.status_code < 300:
+        # 304 answers a conditional GET and is handled by the caller.
+        if 200 <= resp.status_code < 300 or resp.status_code == 304:
             return
 
         detail = self._detail(resp)
@@ -58,36 +158,293 @@ class Transport:
             raise ConflictError(detail)
         if code in (400, 422):
             raise ValidationError(detail)
+        if code == 413:
+            raise PayloadTooLargeError(detail)
+        if code == 429:
+            raise RateLimitError(detail)
+        if code >= 500:
+            raise ServerError(detail)
         raise APIError(detail)
 
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        return path if path.startswith("/") else f"/{path}"
+
+    @staticmethod
+    def _parse_capabilities(payload: Any) -> frozenset[str]:
+        features = payload.get("features") if isinstance(payload, dict) else None
+        return frozenset(str(feature) for feature in (features or []))
+
+    def decode(self, resp: httpx.Response) -> Any:
+        if self.instrumentation is None:
+            return self.codec.loads(resp.content)
+        started = time.perf_counter()
+        payload = self.codec.loads(resp.content)
+        self.instrumentation.decoded(time.perf_counter() - started, len(resp.content))
+        return payload
+
+    def encode_record(self, record: dict[str, Any]) -> bytes:
+        if self.instrumentation is None:
+            return self._encode_record(record)
+        started = time.perf_counter()
+        body = self._encode_record(record)
+        self.instrumentation.encoded(time.perf_counter() - started, len(body))
+        return body
+
+    def _encode_record(self, record: dict[str, Any]) -> bytes:
+        # Renames "id" to "uuid" and applies the vector encoding without copying the record when possible.
+        vector_encoded = self.vectors.encoding != "json" and record.get("vector") is not None
+        if "id" not in record and not vector_encoded:
+            return self.codec.dumps(record)
+        if not vector_encoded and "uuid" not in record and next(iter(record)) == "id":
+            # Splices the key when the codec wrote it compactly; a custom codec may add spacing or reorder keys.
+            body = self.codec.dumps(record)
+            if body.startswith(b'{"id":'):
+                return b'{"uuid":' + body[6:]
+        item = {("uuid" if key == "id" else key): value for key, value in record.items()}
+        return self.codec.dumps(self.vectors.encode_record(item))
+
+    def _prepare_body(self, kwargs: dict[str, Any]) -> tuple[dict[str, Any], CompressionStats | None]:
+        if kwargs.get("json") is not None:
+            kwargs = dict(kwargs)
+            started = time.perf_counter() if self.instrumentation is not None else 0.0
+            body = self.codec.dumps(kwargs.pop("json"))
+            if self.instrumentation is not None:
+                self.instrumentation.encoded(time.perf_counter() - started, len(body))
+            headers = dict(kwargs.get("headers") or {})
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["content"] = body
+            kwargs["headers"] = headers
+
+        content = kwargs.get("content")
+        if self.compressor is None or not isinstance(content, bytes):
+            return kwargs, None
+        compressed, stats = self.compressor.compress(content)
+        if stats is None:
+            return kwargs, None
+        kwargs = dict(kwargs)
+        kwargs["content"] = compressed
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Encoding": stats.encoding}
+        return kwargs, stats
+
+    @staticmethod
+    def _record_compression(resp: httpx.Response, stats: CompressionStats | None) -> None:
+        if stats is not None:
+            resp.extensions["eigenlake.compression"] = stats
+
+    def _begin(self) -> None:
+        with self._usage_lock:
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            # HTTP/2 multiplexes streams, so only HTTP/1.1 requests wait on a busy pool.
+            limit = self.limits.max_connections
+            if not self.http2 and limit is not None and self._in_flight > limit:
+                self._queued += 1
+
+    def _end(self, error: BaseException | None = None) -> None:
+        with self._usage_lock:
+            self._in_flight -= 1
+            if isinstance(error, httpx.PoolTimeout):
+                self._pool_timeouts += 1
+
+    def pool_stats(self) -> PoolStats:
+        # Connection counts come from httpcore's pool through httpx internals; custom transports have none.
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        idle = sum(1 for connection in connections if connection.is_idle()) if connections is not None else None
+        with self._usage_lock:
+            return PoolStats(
+                connections=len(connections) if connections is not None else None,
+                idle=idle,
+                max_connections=self.limits.max_connections,
+                in_flight=self._in_flight,
+                peak_in_flight=self._peak_in_flight,
+                queued=self._queued,
+                pool_timeouts=self._pool_timeouts,
+            )
+
+    def _warmup_count(self, connections: int) -> int:
+        connections = max(0, int(connections))
+        if self.http2:
+            return min(1, connections)
+        limit = self.limits.max_keepalive_connections
+        return connections if limit is None else min(connections, limit)
+
+    def _attempt_kwargs(self, method: str, path: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+        # Fails fast on a spent deadline or an open circuit; otherwise fits the timeout into the deadline.
+        # The deadline is checked first so a half-open trial slot is only taken by an attempt that is sent.
+        left = remaining()
+        if left is not None and left <= 0:
+            raise DeadlineExceededError(f"deadline exceeded before {method} {path}")
+        if not self.retry_policy.allow():
+            raise CircuitOpenError(f"circuit open, not sending {method} {path}")
+        if left is None:
+            return kwargs
+        # A timeout passed for this request wins over the client default; either is clipped.
+        timeout = kwargs.get("timeout", httpx.USE_CLIENT_DEFAULT)
+        if timeout is httpx.USE_CLIENT_DEFAULT:
+            timeout = self._client.timeout
+        return {**kwargs, "timeout": clip_timeout(timeout, left)}
+
+    def _observe(
+        self,
+        method: str,
+        path: str,
+        attempt: int,
+        started: float,
+        kwargs: dict[str, Any],
+        *,
+        resp: httpx.Response | None = None,
+        error: BaseException | None = None,
+        delay: float | None = None,
+    ) -> None:
+        instrumentation = self.instrumentation
+        content = kwargs.get("content")
+        event = RequestEvent(
+            method=method,
+            endpoint=endpoint_name(method, path),
+            path=path,
+            attempt=attempt,
+            seconds=time.perf_counter() - started,
+            status=resp.status_code if resp is not None else None,
+            bytes_sent=len(content) if isinstance(content, bytes) else 0,
+            bytes_received=(resp.num_bytes_downloaded or len(resp.content)) if resp is not None else 0,
+            error=error,
+        )
+        instrumentation.request_finished(event)
+        if delay is not None:
+            instrumentation.retry(event, delay)
+        elif event.failed:
+            instrumentation.error(event)
+
+
+class Transport(_BaseTransport):
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        api_key: str | None,
+        timeout: float | httpx.Timeout = 20.0,
+        retries: int = 2,
+        vector_encoding: VectorEncoding = "json",
+        compression: Compression | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        codec: CodecName | JSONCodec = "auto",
+        http_transport: httpx.BaseTransport | None = None,
+        instrumentation: Instrumentation | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        super().__init__(
+            retries=retries,
+            vector_encoding=vector_encoding,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            codec=codec,
+            instrumentation=instrumentation,
+            limits=limits,
+            http2=http2,
+            retry_policy=retry_policy,
+        )
+        normalized = base_url.rstrip("/")
+        self._client = httpx.Client(
+            base_url=normalized,
+            timeout=build_timeout(timeout),
+            limits=self.limits,
+            http2=self.http2,
+            headers=self._default_headers(api_key),
+            transport=http_transport,
+        )
+
     def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
-        path = path if path.startswith("/") else f"/{path}"
+        method = method.upper()
+        path = self._normalize_path(path)
+        kwargs, compression = self._prepare_body(kwargs)
+        instrumentation = self.instrumentation
+        policy = self.retry_policy
+        endpoint = endpoint_name(method, path)
+        policy.started()
 
-        last_exc: Exception | None = None
-        for attempt in range(self._retries + 1):
+        previous = policy.base_delay
+        attempt = 0
+        while True:
+            attempt_kwargs = self._attempt_kwargs(method, path, kwargs)
+            started = time.perf_counter()
             try:
-                resp = self._client.request(method.upper(), path, **kwargs)
+                if instrumentation is not None:
+                    instrumentation.request_started(method, endpoint, attempt)
+                resp = self._send(method, path, attempt_kwargs)
             except httpx.RequestError as exc:
-                last_exc = exc
-                if attempt >= self._retries:
+                policy.record(error=exc)
+                delay = policy.delay(attempt, method, endpoint, previous, error=exc)
+                if instrumentation is not None:
+                    self._observe(method, path, attempt, started, kwargs, error=exc, delay=delay)
+                if delay is None:
+                    left = remaining()
+                    if isinstance(exc, httpx.TimeoutException) and left is not None and left <= 0:
+                        raise DeadlineExceededError(str(exc)) from exc
                     raise NetworkError(str(exc)) from exc
-                time.sleep(0.2 * (attempt + 1))
-                continue
+            except BaseException:
+                # Cancelled or failed without a response: give back a half-open trial slot.
+                policy.release()
+                raise
+            else:
+                policy.record(status=resp.status_code)
+                delay = policy.delay(attempt, method, endpoint, previous, resp=resp)
+                if instrumentation is not None:
+                    self._observe(method, path, attempt, started, kwargs, resp=resp, delay=delay)
+                if delay is None:
+                    self._raise_for_status(resp)
+                    self._record_compression(resp, compression)
+                    return resp
+            time.sleep(delay)
+            previous = max(delay, policy.base_delay)
+            attempt += 1
+
+    def _send(self, method: str, path: str, kwargs: dict[str, Any]) -> httpx.Response:
+        self._begin()
+        try:
+            resp = self._client.request(method, path, **kwargs)
+        except BaseException as exc:
+            self._end(exc)
+            raise
+        self._end()
+        return resp
+
+    def warm_up(self, connections: int = 1) -> int:
+        """Opens up to ``connections`` pooled connections before the first real request.
 
-            if resp.status_code >= 500 and attempt < self._retries:
-                time.sleep(0.2 * (attempt + 1))
-                continue
+        Sends that many concurrent health checks so each gets its own connection and
+        TLS handshake, capped by the keepalive limit (one connection under HTTP/2).
+        Returns how many succeeded; failures are not raised.
+        """
+        count = self._warmup_count(connections)
 
-            self._raise_for_status(resp)
-            return resp
+        def ping(_: int) -> bool:
+            try:
+                self._client.get(WARMUP_PATH)
+                return True
+            except httpx.HTTPError:
+                return False
 
-        if last_exc is not None:
-            raise NetworkError(str(last_exc)) from last_exc
-        raise NetworkError("Request failed")
+        if count <= 1:
+            return int(ping(0)) if count else 0
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix="eigenlake-warmup") as pool:
+            return sum(pool.map(ping, range(count)))
 
     def get(self, path: str, **kwargs: Any) -> httpx.Response:
         return self.request("GET", path, **kwargs)
 
+    def get_json(self, path: str, **kwargs: Any) -> Any:
+        return self.decode(self.request("GET", path, **kwargs))
+
+    def post_json(self, path: str, **kwargs: Any) -> Any:
+        return self.decode(self.request("POST", path, **kwargs))
+
+    def delete_json(self, path: str, **kwargs: Any) -> Any:
+        return self.decode(self.request("DELETE", path, **kwargs))
+
     def post(self, path: str, **kwargs: Any) -> httpx.Response:
         return self.request("POST", path, **kwargs)
 
@@ -100,5 +457,160 @@ class Transport:
     def put(self, path: str, **kwargs: Any) -> httpx.Response:
         return self.request("PUT", path, **kwargs)
 
+    def capabilities(self) -> frozenset[str]:
+        # Fetched once per transport; servers without the endpoint advertise nothing.
+        if self._capabilities is None:
+            with self._capabilities_lock:
+                if self._capabilities is None:
+                    try:
+                        payload = self.get_json(CAPABILITIES_PATH)
+                    except NotFoundError:
+                        payload = {}
+                    self._capabilities = self._parse_capabilities(payload)
+        return self._capabilities
+
     def close(self) -> None:
         self._client.close()
+
+
+class AsyncTransport(_BaseTransport):
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        api_key: str | None,
+        timeout: float | httpx.Timeout = 20.0,
+        retries: int = 2,
+        vector_encoding: VectorEncoding = "json",
+        compression: Compression | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        codec: CodecName | JSONCodec = "auto",
+        http_transport: httpx.AsyncBaseTransport | None = None,
+        instrumentation: Instrumentation | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        super().__init__(
+            retries=retries,
+            vector_encoding=vector_encoding,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            codec=codec,
+            instrumentation=instrumentation,
+            limits=limits,
+            http2=http2,
+            retry_policy=retry_policy,
+        )
+        normalized = base_url.rstrip("/")
+        self._client = httpx.AsyncClient(
+            base_url=normalized,
+            timeout=build_timeout(timeout),
+            limits=self.limits,
+            http2=self.http2,
+            headers=self._default_headers(api_key),
+            transport=http_transport,
+        )
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        method = method.upper()
+        path = self._normalize_path(path)
+        kwargs, compression = self._prepare_body(kwargs)
+        instrumentation = self.instrumentation
+        policy = self.retry_policy
+        endpoint = endpoint_name(method, path)
+        policy.started()
+
+        previous = policy.base_delay
+        attempt = 0
+        while True:
+            attempt_kwargs = self._attempt_kwargs(method, path, kwargs)
+            started = time.perf_counter()
+            try:
+                if instrumentation is not None:
+                    instrumentation.request_started(method, endpoint, attempt)
+                resp = await self._send(method, path, attempt_kwargs)
+            except httpx.RequestError as exc:
+                policy.record(error=exc)
+                delay = policy.delay(attempt, method, endpoint, previous, error=exc)
+                if instrumentation is not None:
+                    self._observe(method, path, attempt, started, kwargs, error=exc, delay=delay)
+                if delay is None:
+                    left = remaining()
+                    if isinstance(exc, httpx.TimeoutException) and left is not None and left <= 0:
+                        raise DeadlineExceededError(str(exc)) from exc
+                    raise NetworkError(str(exc)) from exc
+            except BaseException:
+                # Cancelled or failed without a response: give back a half-open trial slot.
+                policy.release()
+                raise
+            else:
+                policy.record(status=resp.status_code)
+                delay = policy.delay(attempt, method, endpoint, previous, resp=resp)
+                if instrumentation is not None:
+                    self._observe(method, path, attempt, started, kwargs, resp=resp, delay=delay)
+                if delay is None:
+                    self._raise_for_status(resp)
+                    self._record_compression(resp, compression)
+                    return resp
+            await asyncio.sleep(delay)
+            previous = max(delay, policy.base_delay)
+            attempt += 1
+
+    async def _send(self, method: str, path: str, kwargs: dict[str, Any]) -> httpx.Response:
+        self._begin()
+        try:
+            resp = await self._client.request(method, path, **kwargs)
+        except BaseException as exc:
+            self._end(exc)
+            raise
+        self._end()
+        return resp
+
+    async def warm_up(self, connections: int = 1) -> int:
+        count = self._warmup_count(connections)
+
+        async def ping() -> bool:
+            try:
+                await self._client.get(WARMUP_PATH)
+                return True
+            except httpx.HTTPError:
+                return False
+
+        return sum(await asyncio.gather(*(ping() for _ in range(count))))
+
+    async def get(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", path, **kwargs)
+
+    async def get_json(self, path: str, **kwargs: Any) -> Any:
+        return self.decode(await self.request("GET", path, **kwargs))
+
+    async def post_json(self, path: str, **kwargs: Any) -> Any:
+        return self.decode(await self.request("POST", path, **kwargs))
+
+    async def delete_json(self, path: str, **kwargs: Any) -> Any:
+        return self.decode(await self.request("DELETE", path, **kwargs))
+
+    async def post(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", path, **kwargs)
+
+    async def patch(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", path, **kwargs)
+
+    async def put(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", path, **kwargs)
+
+    async def capabilities(self) -> frozenset[str]:
+        if self._capabilities is None:
+            try:
+                payload = await self.get_json(CAPABILITIES_PATH)
+            except NotFoundError:
+                payload = {}
+            self._capabilities = self._parse_capabilities(payload)
+        return self._capabilities
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
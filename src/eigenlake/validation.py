@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import math
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+from .schema import SchemaBuilder
+
+# A check returns an error message, or None when the value is acceptable.
+_Check = Callable[[Any], "str | None"]
+
+
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return True
+    if isinstance(value, float):
+        return value.is_integer()
+    return hasattr(value, "dtype") and value.dtype.kind in "iu"
+
+
+def _is_number(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return not (isinstance(value, float) and math.isnan(value))
+    return hasattr(value, "dtype") and value.dtype.kind in "iuf"
+
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "integer": _is_integer,
+    "number": _is_number,
+    "boolean": lambda value: isinstance(value, bool),
+    "array": lambda value: isinstance(value, (list, tuple)),
+    "object": lambda value: isinstance(value, dict),
+    "null": lambda value: value is None,
+}
+
+
+def _hashable(value: Any) -> Any:
+    return tuple(_hashable(item) for item in value) if isinstance(value, (list, tuple)) else value
+
+
+def _compile_field(schema: Dict[str, Any]) -> List[_Check]:
+    checks: List[_Check] = []
+
+    field_type = schema.get("type")
+    if field_type is not None:
+        types = [field_type] if isinstance(field_type, str) else list(field_type)
+        predicates = [_TYPE_CHECKS[name] for name in types if name in _TYPE_CHECKS]
+        expected = " or ".join(types)
+        if len(predicates) == 1:
+            predicate = predicates[0]
+            checks.append(lambda value: None if predicate(value) else f"expected {expected}")
+        elif predicates:
+            checks.append(lambda value: None if any(p(value) for p in predicates) else f"expected {expected}")
+
+    if "enum" in schema:
+        options = list(schema["enum"])
+        try:
+            allowed = frozenset(options)
+            checks.append(lambda value: None if _hashable(value) in allowed else f"must be one of {options!r}")
+        except TypeError:
+            checks.append(lambda value: None if value in options else f"must be one of {options!r}")
+
+    minimum, maximum = schema.get("minimum"), schema.get("maximum")
+    if minimum is not None:
+        checks.append(lambda value: None if not _is_number(value) or value >= minimum else f"must be >= {minimum}")
+    if maximum is not None:
+        checks.append(lambda value: None if not _is_number(value) or value <= maximum else f"must be <= {maximum}")
+
+    min_length, max_length = schema.get("minLength"), schema.get("maxLength")
+    if min_length is not None:
+        checks.append(
+            lambda value: None
+            if not isinstance(value, str) or len(value) >= min_length
+            else f"must be at least {min_length} characters"
+        )
+    if max_length is not None:
+        checks.append(
+            lambda value: None
+            if not isinstance(value, str) or len(value) <= max_length
+            else f"must be at most {max_length} characters"
+        )
+    if schema.get("pattern") is not None:
+        pattern = re.compile(schema["pattern"])
+        checks.append(
+            lambda value: None
+            if not isinstance(value, str) or pattern.search(value)
+            else f"does not match {pattern.pattern!r}"
+        )
+
+    min_items, max_items = schema.get("minItems"), schema.get("maxItems")
+    if min_items is not None:
+        checks.append(
+            lambda value: None
+            if not isinstance(value, (list, tuple)) or len(value) >= min_items
+            else f"must have at least {min_items} items"
+        )
+    if max_items is not None:
+        checks.append(
+            lambda value: None
+            if not isinstance(value, (list, tuple)) or len(value) <= max_items
+            else f"must have at most {max_items} items"
+        )
+    if schema.get("uniqueItems"):
+        checks.append(
+            lambda value: None
+            if not isinstance(value, (list, tuple)) or len({_hashable(item) for item in value}) == len(value)
+            else "items must be unique"
+        )
+    if isinstance(schema.get("items"), dict):
+        item_checks = _compile_field(schema["items"])
+        if item_checks:
+
+            def check_items(value: Any) -> str | None:
+                if not isinstance(value, (list, tuple)):
+                    return None
+                for position, item in enumerate(value):
+                    for check in item_checks:
+                        error = check(item)
+                        if error is not None:
+                            return f"item {position} {error}"
+                return None
+
+            checks.append(check_items)
+    return checks
+
+
+class RecordValidator:
+    """Checks records against an index's JSON schema and vector dimensions before upload.
+
+    The schema is compiled once into per-field checks; ``validate`` returns the first
+    problem found as a message, or ``None`` for a valid record. ``partial=True`` checks a
+    write that keeps the stored properties (an update or a vector-only insert): the given
+    properties are checked, but ``required`` is not enforced and ``None`` is not checked.
+    """
+
+    def __init__(self, schema: Dict[str, Any] | SchemaBuilder | None = None, *, dimensions: int | None = None):
+        if isinstance(schema, SchemaBuilder):
+            schema = schema.build()[0]
+        schema = schema or {}
+        self.dimensions = int(dimensions) if dimensions else None
+        self._required: Tuple[str, ...] = tuple(schema.get("required") or ())
+        self._fields: Dict[str, List[_Check]] = {
+            name: checks
+            for name, checks in (
+                (name, _compile_field(field or {})) for name, field in (schema.get("properties") or {}).items()
+            )
+            if checks
+        }
+        known = frozenset(schema.get("properties") or {})
+        self._closed: frozenset[str] | None = known if schema.get("additionalProperties") is False else None
+
+    def validate(
+        self, properties: Dict[str, Any] | None, vector: Any = None, *, partial: bool = False
+    ) -> str | None:
+        if self.dimensions is not None and vector is not None:
+            length = vector.shape[-1] if hasattr(vector, "shape") else len(vector)
+            if length != self.dimensions:
+                return f"vector has {length} dimensions, expected {self.dimensions}"
+
+        if partial and properties is None:
+            return None
+        properties = properties or {}
+        if not isinstance(properties, dict):
+            return "properties must be an object"
+        for name in () if partial else self._required:
+            if properties.get(name) is None:
+                return f"missing required property {name!r}"
+        if self._closed is not None:
+            for name in properties:
+                if name not in self._closed:
+                    return f"unknown property {name!r}"
+        for name, value in properties.items():
+            checks = self._fields.get(name)
+            if checks is None or value is None:
+                continue
+            for check in checks:
+                error = check(value)
+                if error is not None:
+                    return f"property {name!r} {error}"
+        return None
+
+    def validate_record(self, record: Dict[str, Any], *, partial: bool = False) -> str | None:
+        return self.validate(record.get("properties"), record.get("vector"), partial=partial)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from eigenlake import EigenLakeClient
+from eigenlake.testing import FakeEigenLake
+
+
+def _index(server):
+    client = server.client()
+    return client, client.indexes.create_or_get(namespace="tests", index="batch", dimensions=2)
+
+
+@pytest.mark.parametrize("status", [400, 413, 422])
+def test_bisection_isolates_records_rejected_as_a_batch(status):
+    server = FakeEigenLake()
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        # Rejects any insert-many that carries the poisoned record, as a whole.
+        if request.url.path.endswith("/data/insert-many") and b'"r5"' in request.read():
+            return httpx.Response(status, json={"detail": "rejected"})
+        return server.handle(request)
+
+    client = EigenLakeClient(url="http://eigenlake.test", http_transport=httpx.MockTransport(handle))
+    index = client.indexes.create_or_get(namespace="tests", index="batch", dimensions=2)
+    with index.batch.with_size(batch_size=16) as writer:
+        for n in range(16):
+            writer.add(id=f"r{n}", properties={}, vector=[0.1, 0.2])
+    assert [record.id for record in writer.failed_records] == ["r5"]
+    assert writer.requests > 1
+    assert index.records.get("r4") is not None and index.records.get("r6") is not None
+    client.close()
+
+
+def test_server_errors_fail_the_batch_without_bisecting():
+    server = FakeEigenLake()
+    client, index = _index(server)
+    server.error_rate = 1.0
+    with index.batch.with_size(batch_size=200) as writer:
+        for n in range(200):
+            writer.add(id=f"r{n}", properties={}, vector=[0.1, 0.2])
+    assert writer.requests == 1
+    assert writer.number_errors == 200
+    client.close()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import pytest
+
+from eigenlake.errors import NotFoundError
+from eigenlake.testing import FakeEigenLake
+
+
+def test_writes_through_the_handle_invalidate_cached_results():
+    server = FakeEigenLake()
+    client = server.client()
+    index = client.indexes.create_or_get(namespace="tests", index="cache", dimensions=2)
+    index.records.add(id="a", properties={"n": 1}, vector=[1.0, 0.0])
+    index.search.enable_cache(maxsize=16, ttl=60.0)
+
+    first = index.search.nearest(vector=[1.0, 0.0], limit=5)
+    assert index.search.nearest(vector=[1.0, 0.0], limit=5) is first
+    assert server.requests["near_vector"] == 1
+
+    index.records.add(id="b", properties={"n": 2}, vector=[1.0, 0.0])
+    results = index.search.nearest(vector=[1.0, 0.0], limit=5)["results"]
+    assert sorted(hit["uuid"] for hit in results) == ["a", "b"]
+    assert server.requests["near_vector"] == 2
+
+    index.records.update(id="b", properties={"n": 3})
+    index.search.nearest(vector=[1.0, 0.0], limit=5)
+    assert server.requests["near_vector"] == 3
+    assert index.search.cache_stats().hits == 1
+    client.close()
+
+
+def test_failed_write_still_invalidates():
+    server = FakeEigenLake()
+    client = server.client()
+    index = client.indexes.create_or_get(namespace="tests", index="cache", dimensions=2)
+    index.search.enable_cache()
+    index.search.nearest(vector=[1.0, 0.0], limit=5)
+    with pytest.raises(NotFoundError):
+        index.records.remove("missing")
+    index.search.nearest(vector=[1.0, 0.0], limit=5)
+    assert server.requests["near_vector"] == 2
+    client.close()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from eigenlake.testing import FakeEigenLake
+
+np = pytest.importorskip("numpy")
+
+DIMS = 4
+COUNT = 250
+
+
+@pytest.mark.parametrize("cursor_hints", [True, False])
+def test_export_is_complete_when_server_caps_limit(tmp_path, cursor_hints):
+    server = FakeEigenLake(max_limit=40, cursor_hints=cursor_hints)
+    client = server.client()
+    index = client.indexes.create_or_get(namespace="tests", index="export", dimensions=DIMS)
+    vectors = np.random.default_rng(0).standard_normal((COUNT, DIMS)).astype(np.float32)
+    index.records.add_many(
+        {"id": f"r{n:04d}", "properties": {"n": n}, "vector": vectors[n]} for n in range(COUNT)
+    )
+
+    result = index.export(tmp_path, page_size=100)
+
+    assert result.rows == COUNT
+    exported = np.load(result.vectors_path)
+    assert exported.shape == (COUNT, DIMS)
+    with open(result.properties_paths[0]) as handle:
+        rows = [json.loads(line) for line in handle]
+    assert sorted(row["id"] for row in rows) == [f"r{n:04d}" for n in range(COUNT)]
+    for row, vector in zip(rows, exported):
+        assert vector.tobytes() == vectors[row["n"]].tobytes()
+    client.close()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from eigenlake.testing import FakeEigenLake
+
+
+def _client():
+    server = FakeEigenLake()
+    return server, server.client()
+
+
+def test_create_or_get_skips_request_only_for_matching_cached_config():
+    server, client = _client()
+    index = client.indexes.create_or_get(namespace="tests", index="meta", dimensions=3)
+    # Existence alone is not enough: without cached config the server is asked again.
+    client.indexes.create_or_get(namespace="tests", index="meta", dimensions=3)
+    assert server.requests["get_or_create"] == 2
+
+    index.settings.dimensions()
+    client.indexes.create_or_get(namespace="tests", index="meta", dimensions=3)
+    assert server.requests["get_or_create"] == 2
+
+    client.indexes.create_or_get(namespace="tests", index="meta", dimensions=4)
+    assert server.requests["get_or_create"] == 3
+    client.close()
+
+
+def test_handles_do_not_share_validator_or_query_cache():
+    _, client = _client()
+    first = client.indexes.create_or_get(namespace="tests", index="meta", dimensions=3)
+    second = client.indexes.ref(namespace="tests", index="meta")
+    first.records.enable_validation(schema={}, dimensions=3)
+    first.search.enable_cache()
+    assert second is not first
+    assert second._validator is None
+    assert second.search.cache_stats() is None
+    client.close()
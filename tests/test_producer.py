@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import queue
+
+import pytest
+
+from eigenlake.testing import FakeEigenLake
+
+
+@pytest.fixture
+def index():
+    client = FakeEigenLake().client()
+    yield client.indexes.create_or_get(namespace="tests", index="producer", dimensions=2)
+    client.close()
+
+
+def test_flush_sends_without_waiting_for_linger(index):
+    with index.producer(batch_size=100, linger=60.0) as producer:
+        futures = [producer.add(id=f"r{n}", properties={"n": n}, vector=[0.1, 0.2]) for n in range(5)]
+        assert producer.flush(timeout=5.0)
+        assert [future.result() for future in futures] == [f"r{n}" for n in range(5)]
+        assert producer.stats().batches == 1
+    assert index.records.get("r4")["properties"] == {"n": 4}
+
+
+def test_full_queue_blocks_and_times_out(index):
+    with index.producer(batch_size=100, linger=60.0, max_queue=3) as producer:
+        for n in range(3):
+            producer.add(properties={"n": n}, vector=[0.1, 0.2])
+        with pytest.raises(queue.Full):
+            producer.add(properties={"n": 3}, vector=[0.1, 0.2], timeout=0.05)
+        assert producer.flush(timeout=5.0)
+        producer.add(properties={"n": 3}, vector=[0.1, 0.2], timeout=1.0)
+
+
+def test_cancelled_futures_are_skipped(index):
+    with index.producer(batch_size=100, linger=60.0) as producer:
+        futures = [producer.add(id=f"r{n}", properties={}, vector=[0.1, 0.2]) for n in range(4)]
+        assert futures[1].cancel()
+        assert producer.flush(timeout=5.0)
+        stats = producer.stats()
+        assert stats.records == 3 and stats.in_flight == 0
+    assert index.records.get("r1") is None
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from eigenlake.testing import FakeEigenLake
+
+
+def _index(**options):
+    server = FakeEigenLake(**options)
+    client = server.client()
+    index = client.indexes.create_or_get(namespace="tests", index="reads", dimensions=2)
+    index.records.add_many({"id": f"r{n}", "properties": {"n": n}, "vector": [0.1, 0.2]} for n in range(10))
+    return server, client, index
+
+
+@pytest.mark.parametrize("bulk", [True, False])
+def test_get_many_keeps_input_order_and_deduplicates(bulk):
+    server, client, index = _index()
+    records = index.records.get_many(["r3", "missing", "r1", "r3"], use_bulk_endpoint=bulk)
+    assert [record and record["properties"]["n"] for record in records] == [3, None, 1, 3]
+    if bulk:
+        assert server.requests["get_many"] == 1
+    else:
+        # One request per distinct id.
+        assert server.requests["get_by_id"] == 3
+    client.close()
+
+
+@pytest.mark.parametrize("bulk", [True, False])
+def test_exists_many(bulk):
+    _, client, index = _index()
+    assert index.records.exists_many(["r0", "nope", "r0"], use_bulk_endpoint=bulk) == [True, False, True]
+    client.close()
+
+
+def test_coalescing_merges_concurrent_gets():
+    server, client, index = _index()
+    index.records.enable_coalescing(window=0.05)
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        records = list(pool.map(index.records.get, [f"r{n}" for n in range(10)]))
+    assert [record["properties"]["n"] for record in records] == list(range(10))
+    assert server.requests["get_many"] < 10
+    assert server.requests["get_by_id"] == 0
+    client.close()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from eigenlake.errors import CircuitOpenError
+from eigenlake.retry import CircuitBreaker, RetryBudget, RetryPolicy, deadline
+from eigenlake.testing import FakeEigenLake
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_deadline_clips_the_timeout_passed_for_a_request():
+    seen = []
+    server = FakeEigenLake()
+
+    def latency(request: httpx.Request) -> float:
+        seen.append(request.extensions["timeout"])
+        return 0.0
+
+    server.latency = latency
+    client = server.client(timeout=20.0)
+    with deadline(10.0):
+        client._transport.get("/v1/health/ready", timeout=httpx.Timeout(2.0, connect=0.5))
+        client._transport.get("/v1/health/ready")
+    explicit, default = seen
+    assert explicit["connect"] == 0.5 and explicit["read"] == 2.0
+    assert 9.0 < default["read"] <= 10.0
+    client.close()
+
+
+def test_breaker_opens_and_recovers_through_one_half_open_trial():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=5.0, clock=clock)
+    server = FakeEigenLake(error_rate=1.0)
+    client = server.client(retry_policy=RetryPolicy(retries=0, breaker=breaker))
+    for _ in range(2):
+        with pytest.raises(Exception):
+            client._transport.get("/v1/collections/tests/missing")
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        client._transport.get("/v1/collections/tests/missing")
+
+    clock.now = 6.0
+    server.error_rate = 0.0
+    assert breaker.state == "half-open"
+    client._transport.get("/v1/health/ready")
+    assert breaker.state == "closed"
+    client.close()
+
+
+def test_half_open_trial_is_released_when_the_attempt_has_no_outcome():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=1.0, clock=clock)
+    breaker.record_failure()
+    clock.now = 2.0
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.release_trial()
+    assert breaker.allow()
+
+
+def test_budget_caps_retries_during_an_outage():
+    budget = RetryBudget(ratio=0.0, min_per_second=0.0, burst=2.0)
+    server = FakeEigenLake(error_rate=1.0)
+    client = server.client(retry_policy=RetryPolicy(retries=5, base_delay=0.0, max_delay=0.0, budget=budget))
+    for _ in range(3):
+        with pytest.raises(Exception):
+            client._transport.get("/v1/collections/tests/missing")
+    # Three calls, and only the two retries the bucket held.
+    assert server.requests["injected_error"] == 5
+    client.close()
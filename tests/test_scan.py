@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from eigenlake.scan import CursorScan, OffsetScan
+
+IDS = [f"{n:04d}" for n in range(95)]
+
+
+def _cursor_pages(cap: int, *, hints: bool):
+    # A server that returns at most ``cap`` objects per page whatever limit was asked for.
+    def fetch(after):
+        start = 0 if after is None else IDS.index(after) + 1
+        page = {"objects": [{"uuid": id} for id in IDS[start : start + cap]]}
+        if hints:
+            page["next_after"] = page["objects"][-1]["uuid"] if start + cap < len(IDS) else None
+        return page
+
+    return fetch
+
+
+def _offset_pages(cap: int):
+    def fetch(offset):
+        objects = [{"uuid": id} for id in IDS[offset : offset + cap]]
+        return {"objects": objects, "next_offset": offset + len(objects)}
+
+    return fetch
+
+
+def test_cursor_scan_continues_past_capped_pages():
+    for hints in (True, False):
+        scan = CursorScan(_cursor_pages(7, hints=hints), filter=None, page_size=20)
+        assert [obj["uuid"] for obj in scan] == IDS
+
+
+def test_cursor_scan_stops_on_explicit_end():
+    def fetch(after):
+        return {"objects": [{"uuid": "a"}, {"uuid": "b"}], "next_after": None}
+
+    assert [obj["uuid"] for obj in CursorScan(fetch, filter=None, page_size=2)] == ["a", "b"]
+
+
+def test_cursor_checkpoint_resumes_mid_page_and_at_boundary():
+    fetch = _cursor_pages(7, hints=True)
+    for taken in (10, 14):
+        scan = CursorScan(fetch, filter=None, page_size=20)
+        first = [next(scan)["uuid"] for _ in range(taken)]
+        token = scan.checkpoint()
+        scan.close()
+        rest = [obj["uuid"] for obj in CursorScan(fetch, filter=None, page_size=20, checkpoint=token)]
+        assert first + rest == IDS
+
+
+def test_offset_scan_windowed_with_capped_pages():
+    for ordered in (True, False):
+        scan = OffsetScan(_offset_pages(7), page_size=20, prefetch=1, parallel=3, ordered=ordered)
+        got = [obj["uuid"] for obj in scan]
+        assert sorted(got) == IDS
+        if ordered:
+            assert got == IDS
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from eigenlake.testing import FakeEigenLake
+
+
+class _VanishedSegment:
+    # Listed by the spool, then unlinked by the uploader before its size is read.
+    def exists(self) -> bool:
+        return True
+
+    def stat(self):
+        raise FileNotFoundError("000000000099.ready")
+
+
+def _index(server):
+    client = server.client()
+    return client, client.indexes.create_or_get(namespace="tests", index="spool", dimensions=2)
+
+
+def test_stats_tolerates_segments_removed_by_the_uploader(tmp_path, monkeypatch):
+    client, index = _index(FakeEigenLake())
+    with index.batch.spooled(str(tmp_path)) as spool:
+        spool.add(id="a", properties={}, vector=[0.1, 0.2])
+        monkeypatch.setattr(spool, "_segments", lambda suffix: [_VanishedSegment()])
+        assert spool.stats().depth_bytes >= 0
+        monkeypatch.undo()
+    client.close()
+
+
+def test_close_is_bounded_while_server_is_down_and_data_replays(tmp_path):
+    server = FakeEigenLake()
+    client, index = _index(server)
+    server.error_rate = 1.0
+    spool = index.batch.spooled(str(tmp_path), batch_size=2)
+    for n in range(5):
+        spool.add(id=f"r{n}", properties={"n": n}, vector=[0.1, 0.2])
+    spool.close(timeout=0.3)
+    assert spool.stats().depth_records == 5
+
+    server.error_rate = 0.0
+    with index.batch.spooled(str(tmp_path), batch_size=2) as replay:
+        pass
+    assert replay.stats().uploaded == 5
+    assert replay.stats().depth_records == 0
+    assert sorted(index.records.get(f"r{n}")["properties"]["n"] for n in range(5)) == list(range(5))
+    client.close()
+
+
+def test_recovery_drops_a_torn_final_frame(tmp_path):
+    server = FakeEigenLake()
+    client, index = _index(server)
+    server.error_rate = 1.0
+    spool = index.batch.spooled(str(tmp_path))
+    for n in range(3):
+        spool.add(id=f"r{n}", properties={"n": n}, vector=[0.1, 0.2])
+    spool.close(timeout=0.3)
+
+    # Simulate a crash mid-append: the segment is still open and ends in half a frame.
+    (segment,) = tmp_path.glob("*.ready")
+    crashed = segment.with_suffix(".open")
+    segment.rename(crashed)
+    with open(crashed, "ab") as handle:
+        handle.write(b"\x40\x00\x00\x00partial")
+
+    server.error_rate = 0.0
+    with index.batch.spooled(str(tmp_path)) as replay:
+        pass
+    assert replay.stats().uploaded == 3
+    assert replay.stats().depth_records == 0
+    assert not list(tmp_path.glob("*.ready")) and not list(tmp_path.glob("*.open"))
+    client.close()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from eigenlake.testing import FakeEigenLake
+
+np = pytest.importorskip("numpy")
+
+
+def test_import_npy_reports_short_properties_file(tmp_path):
+    client = FakeEigenLake().client()
+    index = client.indexes.create_or_get(namespace="tests", index="import", dimensions=2)
+    np.save(tmp_path / "vectors.npy", np.zeros((5, 2), dtype=np.float32))
+    with open(tmp_path / "properties.jsonl", "w") as handle:
+        for n in range(3):
+            handle.write(json.dumps({"id": f"r{n}", "n": n}) + "\n")
+
+    with pytest.raises(ValueError) as raised:
+        index.records.import_file(
+            str(tmp_path / "vectors.npy"), properties=str(tmp_path / "properties.jsonl"), batch_size=2
+        )
+    message = str(raised.value)
+    assert "properties.jsonl has 3 property rows" in message
+    assert "vectors.npy has 5 vectors" in message
+    client.close()
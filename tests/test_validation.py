@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from eigenlake.errors import ValidationError
+from eigenlake.testing import FakeEigenLake
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"title": {"type": "string"}, "year": {"type": "integer"}},
+    "required": ["title"],
+}
+
+
+@pytest.fixture
+def index():
+    client = FakeEigenLake().client()
+    index = client.indexes.create_or_get(namespace="tests", index="validation", dimensions=2)
+    index.records.add_many([{"id": "a", "properties": {"title": "A", "year": 2001}, "vector": [0.1, 0.2]}])
+    index.records.enable_validation(schema=SCHEMA, dimensions=2)
+    yield index
+    client.close()
+
+
+def test_vector_only_insert_keeps_properties(index):
+    assert index.records.add_vectors([[0.3, 0.4]], ids=["a"]) == []
+    record = index.records.get("a")
+    assert record["properties"] == {"title": "A", "year": 2001}
+    assert record["vector"] == pytest.approx([0.3, 0.4])
+
+
+def test_vector_only_insert_checks_dimensions(index):
+    failed = index.records.add_vectors([[0.3, 0.4, 0.5]], ids=["a"])
+    assert [record.id for record in failed] == ["a"]
+    assert "dimensions" in failed[0].error
+
+
+def test_vector_insert_checks_given_properties(index):
+    failed = index.records.add_vectors([[0.3, 0.4]], ids=["a"], properties=[{"title": 7}])
+    assert [record.id for record in failed] == ["a"]
+
+
+def test_add_many_enforces_required(index):
+    result = index.records.add_many([{"id": "b", "properties": {"year": 2002}, "vector": [0.1, 0.2]}])
+    assert [record.id for record in result.failed_records] == ["b"]
+
+
+def test_update_checks_only_sent_fields(index):
+    index.records.update(id="a", properties={"year": 2002})
+    assert index.records.get("a")["properties"] == {"title": "A", "year": 2002}
+    with pytest.raises(ValidationError):
+        index.records.update(id="a", properties={"year": "late"})
+
+    result = index.records.update_many([("a", {"year": 2003}), ("a", {"year": "later"})])
+    assert len(result) == 1
+    assert len(result.failed_records) == 1
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import pytest
+
+from eigenlake.testing import FakeEigenLake
+
+np = pytest.importorskip("numpy")
+
+DIMS = 16
+ENCODINGS = ["json", "float32", "float16"]
+
+
+@pytest.fixture
+def vectors():
+    # Values that float16 represents exactly, so every encoding must round-trip them bit for bit.
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((8, DIMS)).astype(np.float16).astype(np.float32)
+
+
+@pytest.fixture(params=ENCODINGS)
+def index(request):
+    client = FakeEigenLake().client(vector_encoding=request.param)
+    yield client.indexes.create_or_get(namespace="tests", index="vectors", dimensions=DIMS)
+    client.close()
+
+
+def _as_float32(vector) -> np.ndarray:
+    return np.asarray(vector, dtype=np.float32)
+
+
+def _load(index, vectors) -> None:
+    index.records.add(id="r0", properties={"n": 0}, vector=vectors[0])
+    index.records.add_many(
+        [{"id": f"r{n}", "properties": {"n": n}, "vector": vectors[n]} for n in (1, 2, 3)],
+        chunk_size=2,
+    )
+    failed = index.records.add_vectors(vectors[4:], ids=[f"r{n}" for n in range(4, len(vectors))])
+    assert failed == []
+
+
+def test_get_round_trips_every_write_path(index, vectors):
+    _load(index, vectors)
+    for n, expected in enumerate(vectors):
+        record = index.records.get(f"r{n}")
+        assert _as_float32(record["vector"]).tobytes() == expected.tobytes()
+
+        found = index.search.get(f"r{n}", with_vector=True, as_numpy=True)
+        assert found["vector"].dtype == np.float32
+        assert found["vector"].tobytes() == expected.tobytes()
+
+
+def test_list_round_trips_vectors(index, vectors):
+    _load(index, vectors)
+    page = index.records.list(filter={}, with_vector=True, as_numpy=True)
+    got = {obj["uuid"]: obj["vector"] for obj in page["objects"]}
+    assert len(got) == len(vectors)
+    for n, expected in enumerate(vectors):
+        assert got[f"r{n}"].tobytes() == expected.tobytes()
+
+    page = index.records.list(filter={}, with_vector=True)
+    for obj in page["objects"]:
+        n = int(obj["uuid"][1:])
+        assert _as_float32(obj["vector"]).tobytes() == vectors[n].tobytes()
+
+
+def test_nearest_matches_across_encodings(index, vectors):
+    _load(index, vectors)
+    reference = FakeEigenLake().client()
+    plain = reference.indexes.create_or_get(namespace="tests", index="vectors", dimensions=DIMS)
+    _load(plain, vectors)
+    try:
+        for query in vectors:
+            results = index.search.nearest(vector=query, limit=3)["results"]
+            expected = plain.search.nearest(vector=query, limit=3)["results"]
+            assert [hit["uuid"] for hit in results] == [hit["uuid"] for hit in expected]
+            assert [hit["score"] for hit in results] == pytest.approx([hit["score"] for hit in expected])
+    finally:
+        reference.close()
+
+
+def test_float32_is_bit_exact_for_arbitrary_values():
+    client = FakeEigenLake().client(vector_encoding="float32")
+    index = client.indexes.create_or_get(namespace="tests", index="exact", dimensions=DIMS)
+    vector = np.random.default_rng(1).standard_normal(DIMS).astype(np.float32)
+    index.records.add(id="exact", properties={}, vector=vector)
+    index.records.add_many([{"id": "many", "properties": {}, "vector": vector}])
+    index.records.add_vectors(vector[None, :], ids=["matrix"])
+    for id in ("exact", "many", "matrix"):
+        assert _as_float32(index.records.get(id)["vector"]).tobytes() == vector.tobytes()
+        assert index.search.get(id, with_vector=True, as_numpy=True)["vector"].tobytes() == vector.tobytes()
+    client.close()